@@ -1,4 +1,7 @@
-from typing import List, Union, Dict
+from typing import List, Sequence, Tuple, Union, Dict
+from common import DATA_COLUMNS, RECORD_DTYPE
+
+import numpy as np
 
 
 class Actor:
@@ -13,15 +16,52 @@ class Actor:
     def __init__(self, id: int, type: int, max_entry_count: int) -> None:
         self._data: Dict[int, int] = [id, type]
         self._max_entry_count: int = max_entry_count
-        self._velocity: List[float] = []
-        self._orientation: List[float] = []
-        self._angular_speed: List[float] = []
-        self._accelaration: List[float] = []
-        self._distance_to_hero: List[float] = []
-        self._angle_to_hero: List[float] = []
+        self._entries: np.ndarray = np.zeros(
+            (2 * max_entry_count, len(DATA_COLUMNS)), dtype=np.float64
+        )
+        self._timestamps: np.ndarray = np.zeros(2 * max_entry_count, dtype=np.float64)
+        self._start: int = 0
+        self._size: int = 0
+        # odd while an entry is written, so readers in other threads can detect that they copied a changing ring
+        self._version: int = 0
+
+    @property
+    def id(self) -> int:
+        """
+        Returns:
+            int: Id that represents the actor in the Carla world
+        """
+        return self._data[0]
+
+    @property
+    def type(self) -> int:
+        """
+        Returns:
+            int: Number that represents the type of traffic user in the Carla world
+        """
+        return self._data[1]
+
+    @property
+    def history(self) -> np.ndarray:
+        """Returns the stored entries from oldest to newest without copying them
+
+        Returns:
+            np.ndarray: View on the stored entries (shape (n, 6)) with the columns in the order of DATA_COLUMNS
+        """
+        return self._entries[self._start : self._start + self._size]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Returns the timestamps of the stored entries from oldest to newest without copying them
+
+        Returns:
+            np.ndarray: View on the timestamps of the stored entries (shape (n,))
+        """
+        return self._timestamps[self._start : self._start + self._size]
 
     def add_data(
         self,
+        timestamp: float,
         velocity: Union[float, None],
         orientation: Union[float, None],
         angular_speed: Union[float, None],
@@ -32,6 +72,7 @@ class Actor:
         """Add new entry to saved data
 
         Args:
+            timestamp (float): Timestamp the data was calculated for
             velocity (float | None): Velocity to be saved
             orientation (float | None): Orientation to be saved
             angular_speed (float | None): Angular speed to be saved
@@ -39,35 +80,40 @@ class Actor:
             distance_to_hero (float | None): Distance to hero to be saved
             angle_to_hero (float | None): Angle to hero to be saved
         """
-        if len(self._velocity) >= self._max_entry_count:
-            self._velocity.pop(0)
-        self._velocity.append(round(velocity, 3) if velocity != None else 0)
-
-        if len(self._orientation) >= self._max_entry_count:
-            self._orientation.pop(0)
-        self._orientation.append(round(orientation, 3) if orientation != None else 0)
-
-        if len(self._angular_speed) >= self._max_entry_count:
-            self._angular_speed.pop(0)
-        self._angular_speed.append(
-            round(angular_speed, 3) if angular_speed != None else 0
+        self.add_entry(
+            timestamp,
+            tuple(
+                round(value, 3) if value != None else 0
+                for value in (
+                    velocity,
+                    orientation,
+                    angular_speed,
+                    accelaration,
+                    distance_to_hero,
+                    angle_to_hero,
+                )
+            ),
         )
 
-        if len(self._accelaration) >= self._max_entry_count:
-            self._accelaration.pop(0)
-        self._accelaration.append(round(accelaration, 3) if accelaration != None else 0)
-
-        if len(self._distance_to_hero) >= self._max_entry_count:
-            self._distance_to_hero.pop(0)
-        self._distance_to_hero.append(
-            round(distance_to_hero, 3) if distance_to_hero != None else 0
-        )
+    def add_entry(self, timestamp: float, entry: Sequence[float]) -> None:
+        """Add new entry to saved data whose values are already rounded
 
-        if len(self._angle_to_hero) >= self._max_entry_count:
-            self._angle_to_hero.pop(0)
-        self._angle_to_hero.append(
-            round(angle_to_hero, 3) if angle_to_hero != None else 0
-        )
+        Args:
+            timestamp (float): Timestamp the data was calculated for
+            entry (Sequence[float]): Values in the order of DATA_COLUMNS, rounded to 3 decimals and 0 where unknown
+        """
+        self._version += 1
+        if self._size < self._max_entry_count:
+            slot: int = self._start + self._size
+            self._size += 1
+        else:
+            slot = self._start
+            self._start = (self._start + 1) % self._max_entry_count
+        self._entries[slot] = entry
+        self._entries[slot + self._max_entry_count] = entry
+        self._timestamps[slot] = timestamp
+        self._timestamps[slot + self._max_entry_count] = timestamp
+        self._version += 1
 
     def get_data(self) -> List[Union[int, float]]:
         """Returns all saved data in a single big array with id and type as first entries
@@ -75,12 +121,34 @@ class Actor:
         Returns:
             List[int | float]: Array of all stored data with id and type as first entries
         """
-        return (
-            self._data
-            + self._velocity
-            + self._orientation
-            + self._angular_speed
-            + self._accelaration
-            + self._distance_to_hero
-            + self._angle_to_hero
-        )
+        return self._data + self.history.T.ravel().tolist()
+
+    def records(self) -> np.ndarray:
+        """Returns all saved data as typed records with one row per timestamp
+
+        Returns:
+            np.ndarray: Structured array with the datatype RECORD_DTYPE
+        """
+        timestamps, entries = self._snapshot()
+        records: np.ndarray = np.empty(len(timestamps), dtype=RECORD_DTYPE)
+        records["id"] = self._data[0]
+        records["type"] = self._data[1]
+        records["timestamp"] = timestamps
+        for index, column in enumerate(DATA_COLUMNS):
+            records[column] = entries[:, index]
+        return records
+
+    def _snapshot(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Copies the stored timestamps and entries consistently, even while data is added in another thread
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Timestamps (shape (n,)) and entries (shape (n, 6)) from oldest to newest
+        """
+        while True:
+            version: int = self._version
+            start: int = self._start
+            size: int = self._size
+            timestamps: np.ndarray = self._timestamps[start : start + size].copy()
+            entries: np.ndarray = self._entries[start : start + size].copy()
+            if version % 2 == 0 and version == self._version:
+                return timestamps, entries
@@ -1,16 +1,34 @@
 import logging
 import sys
 import csv
-import carla
 import pathlib
+import threading
 
-from math_operations import MathOperations as mo
 from hero import Hero
 from actor import Actor
-from typing import Dict, List, Union
-from common import EActorType, VehicleTypes, ROAD_USER_CODE
-from datatypes import Subscription
-from gnss_receiver import GnssReceiver
+from typing import Any, Dict, List, Tuple, Union
+from common import (
+    EActorType,
+    EVehicleType,
+    ENoiseModel,
+    EOverflowPolicy,
+    DATA_COLUMNS,
+    RECORD_DTYPE,
+    FRAME_QUEUE_SIZE,
+)
+from datatypes import ActorInfo, GnssCallback, PositionSource, Subscription
+from frame_batcher import FrameBatcher
+from frame_aligner import FrameAligner
+from ingestion import Ingestion
+from dispatcher import Dispatcher
+from npy_writer import NpyWriter
+from record_log import RecordLog
+from shard_pool import ShardPool
+from state_table import StateTable
+from metrics import MetricsExporter, metrics
+from type_classifier import TypeClassifier
+from gnss_recorder import GnssRecorder
+from noise import NoiseGenerator
 
 
 class Api:
@@ -21,11 +39,13 @@ class Api:
         Refer to the example.py file for an example of the usage
 
     Args:
-        host (string): Address of the host where the Carla world is running
-        port (int): Port to the host where the Carla world is running
+        host (string): Address of the host where the Carla world is running (unused if a source is given)
+        port (int): Port to the host where the Carla world is running (unused if a source is given)
         relevance_radius (int): Radius of distance that filters out actors that are out of range from the hero
         max_entry_count (int): Amount of entries to be stored for CSV file to be created
         hero_id (int, optional): Id of the actor to be assigned as hero
+        source (PositionSource, optional): Source of the position data, defaults to the Carla world at host and port
+        fallback_type (EVehicleType | EActorType, optional): Traffic user type of actors whose blueprint is not known (EActorType.VEHICLE is not supported)
     """
 
     def __init__(
@@ -35,78 +55,218 @@ class Api:
         relevance_radius: float,
         max_entry_count: int,
         hero_id: int = -1,
+        source: Union[PositionSource, None] = None,
+        fallback_type: Union[EVehicleType, EActorType] = EActorType.PEDESTRIAN,
     ) -> None:
+        if not relevance_radius >= 0:
+            raise ValueError(
+                f"Relevance radius must not be negative, got {relevance_radius}"
+            )
         self._actors: Dict[int, Actor] = {}
-        self._road_users: List[carla.Actor] = []
-        self._subscribers: List[Subscription] = []
+        self._road_users: Dict[int, ActorInfo] = {}
+        self._dispatcher: Dispatcher = Dispatcher()
+        self._hero_dispatchers: Dict[int, Dispatcher] = {}
         self._stop: bool = False
-        self._gnss_receivers: List[GnssReceiver] = []
         self._hero: Union[Hero, None] = None
+        self._batcher: Union[FrameBatcher, None] = None
+        self._aligner: Union[FrameAligner, None] = None
+        self._ingestion: Union[Ingestion, None] = None
+        self._record_log: Union[RecordLog, None] = None
+        self._shard_pool: Union[ShardPool, None] = None
+        self._state_table: Union[StateTable, None] = None
+        self._exporter: Union[MetricsExporter, None] = None
+        self._recorder: Union[GnssRecorder, None] = None
         self._hero_id: int = hero_id
         self._relevance_radius: float = relevance_radius
         self._max_entry_count: int = max_entry_count
         self._header_written: bool = False
-        try:
-            client: carla.Client = carla.Client(host, port)
-            client.set_timeout(5.0)
-            self._world: carla.World = client.get_world()
-        except RuntimeError as err:
-            logging.error(f"Something went wrong connecting: {err}")
-            sys.exit(1)
-        for actor in self._world.get_actors():
-            if (
-                EActorType.VEHICLE.value in actor.type_id
-                or EActorType.PEDESTRIAN.value in actor.type_id
-            ):
-                if self._hero_id != -1 and actor.id == self._hero_id:
-                    self._hero = Hero(
-                        actor.id,
-                        self._actors,
-                        self._subscribers,
-                        self._relevance_radius,
-                    )
-                elif (
-                    self._hero_id == -1
-                    and self._hero == None
-                    and mo.vector_length(actor.get_velocity()) > 0
-                ):
-                    self._hero = Hero(
-                        actor.id,
-                        self._actors,
-                        self._subscribers,
-                        self._relevance_radius,
-                    )
-                self._road_users.append(actor)
-                self._actors[actor.id] = Actor(
-                    actor.id, self._classify_type(actor.type_id), self._max_entry_count
+        self._classifier: TypeClassifier = TypeClassifier(fallback_type)
+        self._on_data: Union[GnssCallback, None] = None
+        self._tick: float = 0
+        self._error_range: float = 0
+        self._noise_model: ENoiseModel = ENoiseModel.CIRCULAR
+        self._seed: Union[int, None] = None
+        self._reconcile_lock: threading.Lock = threading.Lock()
+        self._reconciler: Union[threading.Thread, None] = None
+        self._stopped: threading.Event = threading.Event()
+        if source == None:
+            # imported here, so the Api can be used without carla installed when another source is given
+            from carla_source import CarlaSource
+
+            source = CarlaSource(host, port)
+        self._source: PositionSource = source
+        for actor in self._source.actors():
+            if self._hero_id != -1 and actor.id == self._hero_id:
+                self._hero = Hero(
+                    actor.id,
+                    self._actors,
+                    self._dispatcher,
+                    self._relevance_radius,
                 )
+            elif self._hero_id == -1 and self._hero == None and actor.moving:
+                self._hero_id = actor.id
+                self._hero = Hero(
+                    actor.id,
+                    self._actors,
+                    self._dispatcher,
+                    self._relevance_radius,
+                )
+            self._road_users[actor.id] = actor
+            self._actors[actor.id] = self._create_actor(actor)
 
-    def start(self, tick: float, error_range: float = 0) -> None:
-        """Method to start a thread to poll and calulate the data of all present actors in the connected Carla world
+    def start(
+        self,
+        tick: float,
+        error_range: float = 0,
+        batched: bool = False,
+        queue_size: int = 0,
+        overflow_policy: EOverflowPolicy = EOverflowPolicy.DROP_OLDEST,
+        worker_count: int = 1,
+        record_path: Union[str, None] = None,
+        noise_model: ENoiseModel = ENoiseModel.CIRCULAR,
+        seed: Union[int, None] = None,
+        reconcile_interval: Union[float, None] = None,
+        aligned: bool = False,
+        frame_deadline: float = 0.1,
+        process_count: int = 0,
+    ) -> None:
+        """Method to start polling and calulating the data of all present actors of the position source
 
         Args:
             tick (float): Time in seconds how often the position of the actors is to be polled
             error_range (float, optional): Range from which a random error is generated that falsifies the positions
+            batched (bool, optional): Gather the position data of all actors with the same timestamp and calculate them in one pass
+            queue_size (int, optional): Amount of position data that can be queued per worker thread, 0 calculates the data directly in the sensor callbacks,
+                if aligned the amount of frames that can be queued for the thread of the aligner, 0 uses FRAME_QUEUE_SIZE
+            overflow_policy (EOverflowPolicy, optional): How to handle incoming position data (or frames if aligned) when the queue is full
+            worker_count (int, optional): Amount of worker threads that calculate the queued position data, always 1 if batched
+            record_path (str, optional): Path of a file the raw measurements are recorded to, so they can be replayed with GnssReplay
+            noise_model (ENoiseModel, optional): Error model the positions are distorted with
+            seed (int, optional): Seed of the distortion, every actor gets its own generator derived from the seed and its id
+            reconcile_interval (float, optional): Time in seconds how often actors that spawned or despawned are picked up, None to keep the initial actors
+            aligned (bool, optional): Group the position data by simulator frame and calculate every frame with the exact samples of the hero
+                (for synchronous-mode runs), the frames are calculated in a thread of the aligner, so batched is ignored then
+            frame_deadline (float, optional): Time in seconds an aligned frame waits for missing position data before it is calculated
+            process_count (int, optional): Amount of worker processes the frames are calculated and encoded in, 0 calculates them in this process,
+                the position data is batched then unless it is aligned
         """
         if self._hero == None:
             logging.error("No Hero initialized or found")
             sys.exit(1)
-        for road_user in self._road_users:
-            self._gnss_receivers.append(
-                GnssReceiver(
-                    road_user,
-                    self._world,
-                    self._hero.on_position_data,
-                    error_range,
-                    tick,
-                )
+        if process_count > 0:
+            self._shard_pool = ShardPool(process_count, len(self._road_users))
+            self._hero.shard_pool = self._shard_pool
+            batched = True
+        on_data: GnssCallback = self._hero.on_position_data
+        if aligned:
+            self._aligner = FrameAligner(
+                self._hero.on_aligned_frame,
+                len(self._road_users),
+                frame_deadline,
+                queue_size if queue_size > 0 else FRAME_QUEUE_SIZE,
+                overflow_policy,
+            )
+            on_data = self._aligner
+        elif batched:
+            self._batcher = FrameBatcher(self._hero.on_position_frame)
+            on_data = self._batcher
+        if self._batcher != None and queue_size > 0 and worker_count > 1:
+            # the batcher forwards a frame whenever the timestamp changes, interleaved workers would split the frames
+            logging.warning(
+                "Batched position data is queued for a single worker thread, worker_count is ignored"
+            )
+            worker_count = 1
+        if queue_size > 0 and not aligned:
+            self._ingestion = Ingestion(
+                on_data, queue_size, overflow_policy, worker_count
             )
+            on_data = self._ingestion
+        if record_path != None:
+            self._recorder = GnssRecorder(record_path)
+        with self._reconcile_lock:
+            self._on_data = on_data
+            self._tick = tick
+            self._error_range = error_range
+            self._noise_model = noise_model
+            self._seed = seed
+            for road_user in self._road_users.values():
+                self._attach(road_user)
+        self._source.start()
+        if reconcile_interval != None:
+            self._reconciler = threading.Thread(
+                target=self._reconcile_periodically,
+                args=(reconcile_interval,),
+                daemon=True,
+            )
+            self._reconciler.start()
 
     def stop(self) -> None:
         """Method to stop the polling of positions and calculation of data by killing the thread and main loop"""
         self._stop = True
-        for gnss_receiver in self._gnss_receivers:
-            gnss_receiver.destroy()
+        self._stopped.set()
+        if self._reconciler != None:
+            self._reconciler.join()
+            self._reconciler = None
+        self._source.stop()
+        if self._recorder != None:
+            self._recorder.close()
+            self._recorder = None
+        if self._ingestion != None:
+            self._ingestion.stop()
+        if self._batcher != None:
+            self._batcher.flush()
+        if self._aligner != None:
+            self._aligner.stop()
+        if self._shard_pool != None:
+            self._hero.shard_pool = None
+            self._shard_pool.stop()
+            self._shard_pool = None
+        self._dispatcher.stop()
+        for dispatcher in self._hero_dispatchers.values():
+            dispatcher.stop()
+        self.stop_record_log()
+        self.stop_state_table()
+        self.stop_metrics()
+
+    def reconcile(self) -> Tuple[List[int], List[int]]:
+        """Method to pick up the actors that spawned or despawned in the position source since the last call
+
+        Note:
+            Only the difference to the known actors is processed, new actors are tracked (and their position data
+            forwarded once started) and the sensors and stored data of vanished actors are removed
+
+        Returns:
+            Tuple[List[int], List[int]]: Ids of the added and of the removed actors
+        """
+        with self._reconcile_lock:
+            present: Dict[int, ActorInfo] = {
+                actor.id: actor for actor in self._source.actors()
+            }
+            added: List[int] = [id for id in present if id not in self._road_users]
+            removed: List[int] = [id for id in self._road_users if id not in present]
+            for id in removed:
+                if id == self._hero_id:
+                    logging.warning(f"Hero {id} has left the world")
+                self._source.detach(id)
+                del self._road_users[id]
+                if self._hero != None:
+                    self._hero.forget(id)
+                else:
+                    self._actors.pop(id, None)
+                if id in self._hero_dispatchers:
+                    self._hero_dispatchers.pop(id).stop()
+            for id in added:
+                actor: Actor = self._create_actor(present[id])
+                self._road_users[id] = present[id]
+                if self._hero != None:
+                    self._hero.register(actor)
+                else:
+                    self._actors[id] = actor
+                if self._on_data != None:
+                    self._attach(present[id])
+            if self._aligner != None:
+                self._aligner.expected_count = len(self._road_users)
+            return added, removed
 
     def save_csv(self, path: str, filename: str) -> None:
         """Method to save collected data into a .csv file on the given path with the given filename
@@ -120,27 +280,275 @@ class Api:
             if not self._header_written:
                 writer.writerow(self._header())
                 self._header_written = True
-            for actor_id in self._actors:
-                writer.writerow(self._actors[actor_id].get_data())
+            for actor in list(self._actors.values()):
+                writer.writerow(actor.get_data())
+
+    def save_npy(self, path: str, filename: str, chunk_size: int = 65536) -> None:
+        """Method to save collected data into a binary .npy file with one typed row per actor and timestamp
+
+        Note:
+            The rows are written in chunks, the file can be loaded memory-mapped with numpy.load(file, mmap_mode="r")
+            and holds the columns of common.RECORD_DTYPE
+
+        Args:
+            path (string): Path where the file should be saved to
+            filename (string): Name of the file the data should be saved to
+            chunk_size (int, optional): Amount of rows that are written at once
+        """
+        writer: NpyWriter = NpyWriter(
+            str(pathlib.Path(path, filename)), RECORD_DTYPE, chunk_size
+        )
+        try:
+            # actors may be forgotten by reconcile meanwhile
+            for actor in list(self._actors.values()):
+                writer.append(actor.records())
+        finally:
+            writer.close()
+
+    def start_record_log(
+        self,
+        path: str,
+        prefix: str = "records",
+        max_file_size: int = 256 * 1024 * 1024,
+        max_file_age: Union[float, None] = None,
+    ) -> None:
+        """Method to continuously append every calculated record to rotating .npy files in the background
+
+        Args:
+            path (string): Path of the folder the files should be written to
+            prefix (string, optional): Prefix of the file names, the files are named <prefix>_<index>.npy
+            max_file_size (int, optional): Size (in bytes) after which a new file is started
+            max_file_age (float, optional): Time (in s) after which a new file is started, None to rotate by size only
+        """
+        if self._hero == None:
+            logging.error("No Hero initialized or found")
+            return
+        self.stop_record_log()
+        self._record_log = RecordLog(path, prefix, max_file_size, max_file_age)
+        self._hero.record_log = self._record_log
+
+    def stop_record_log(self) -> None:
+        """Method to write all pending records and stop the record log"""
+        if self._record_log == None:
+            return
+        if self._hero != None:
+            self._hero.record_log = None
+        self._record_log.close()
+        self._record_log = None
+
+    def start_state_table(
+        self, capacity: Union[int, None] = None, name: Union[str, None] = None
+    ) -> Union[str, None]:
+        """Method to keep the latest record of every actor in a shared memory table other processes on the host can poll
+
+        Note:
+            The table is read with state_table.StateTableReader, which returns the records as a NumPy structured array
+            with the columns of common.RECORD_DTYPE. Only the data relative to the first hero is kept
+
+        Args:
+            capacity (int, optional): Amount of actors the table holds, defaults to twice the amount of present actors
+            name (str, optional): Name of the shared memory block, a unique name is generated if not given
+
+        Returns:
+            str | None: Name of the shared memory block readers attach to, None if no hero is initialized
+        """
+        if self._hero == None:
+            logging.error("No Hero initialized or found")
+            return None
+        self.stop_state_table()
+        self._state_table = StateTable(
+            2 * len(self._road_users) if capacity == None else capacity, name
+        )
+        self._hero.state_table = self._state_table
+        return self._state_table.name
+
+    def stop_state_table(self) -> None:
+        """Method to stop updating the shared memory table and release it"""
+        if self._state_table == None:
+            return
+        if self._hero != None:
+            self._hero.state_table = None
+        self._state_table.close()
+        self._state_table = None
+
+    def add_hero(
+        self, hero_id: int, relevance_radius: Union[float, None] = None
+    ) -> None:
+        """Method to add a further hero the data of all actors is calculated relative to, with its own subscribers
+
+        Note:
+            The data that does not depend on a hero is calculated once for all heroes, only the data relative to the
+            first hero is saved into the CSV and .npy files
+
+        Args:
+            hero_id (int): Id of the actor to be assigned as additional hero
+            relevance_radius (float, optional): Radius of distance that filters out actors that are out of range from this hero,
+                defaults to the relevance radius of the Api
+        """
+        if self._hero == None:
+            logging.error("No Hero initialized or found")
+            return
+        if hero_id not in self._actors:
+            logging.error(f"Actor {hero_id} not found")
+            return
+        if hero_id == self._hero_id or hero_id in self._hero_dispatchers:
+            return
+        self._hero_dispatchers[hero_id] = Dispatcher()
+        self._hero.add_hero(
+            hero_id,
+            self._relevance_radius if relevance_radius == None else relevance_radius,
+            self._hero_dispatchers[hero_id],
+        )
+
+    def remove_hero(self, hero_id: int) -> None:
+        """Method to remove a hero that was added with add_hero, its subscribers get all pending data first
 
-    def subscribe(self, subscription: Subscription) -> None:
+        Args:
+            hero_id (int): Id of the additional hero
+        """
+        if hero_id not in self._hero_dispatchers:
+            return
+        if self._hero != None:
+            self._hero.remove_hero(hero_id)
+        self._hero_dispatchers.pop(hero_id).stop()
+
+    def subscribe(
+        self, subscription: Subscription, hero_id: Union[int, None] = None
+    ) -> None:
         """Method to add callback function to which the calculated data will be forwarded to in runtime
 
         Args:
             subscription (Subscription): Callback function with one argument holding the data in JSON format
+            hero_id (int, optional): Id of the hero whose data should be forwarded, defaults to the first hero
         """
-        self._subscribers.append(subscription)
+        dispatcher: Union[Dispatcher, None] = self._hero_dispatcher(hero_id)
+        if dispatcher != None:
+            dispatcher.subscribe(subscription)
 
-    def unsubscribe(self, subscription: Subscription) -> None:
+    def unsubscribe(
+        self, subscription: Subscription, hero_id: Union[int, None] = None
+    ) -> None:
         """Method to remove callback function to which the calculated data is forwarded to in runtime
 
         Args:
             subscription (Subscription): Callback function that should be removed
+            hero_id (int, optional): Id of the hero the callback function was subscribed to, defaults to the first hero
+        """
+        dispatcher: Union[Dispatcher, None] = self._hero_dispatcher(hero_id)
+        if dispatcher != None:
+            dispatcher.unsubscribe(subscription)
+
+    def start_metrics(
+        self,
+        dump_path: Union[str, None] = None,
+        dump_port: Union[int, None] = None,
+        dump_interval: float = 10.0,
+    ) -> None:
+        """Method to start counting the events and timing the stages of the processing, from the GNSS callbacks to the subscribers
+
+        Note:
+            The counters and histograms are shared by all instances of Api in the process and are cleared on every start
+
+        Args:
+            dump_path (str, optional): Path of a file the metrics are written to in the Prometheus text format every dump_interval
+            dump_port (int, optional): Port on localhost the metrics are served on in the Prometheus text format
+            dump_interval (float, optional): Time in seconds between two writes of the file
+        """
+        self.stop_metrics()
+        metrics.reset()
+        metrics.enabled = True
+        if dump_path != None or dump_port != None:
+            self._exporter = MetricsExporter(
+                metrics, dump_path, dump_port, dump_interval
+            )
+
+    def stop_metrics(self) -> None:
+        """Method to stop counting and timing, the metrics collected so far stay available through stats"""
+        metrics.enabled = False
+        if self._exporter != None:
+            self._exporter.stop()
+            self._exporter = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Method to get all counters of the program
+
+        Returns:
+            Dict[str, Any]: Event counters and latencies per stage (see start_metrics) along with the counters of the queue,
+                the frame-aligned mode and the subscribers
+        """
+        stats: Dict[str, Any] = metrics.snapshot()
+        stats["queue"] = self.queue_stats()
+        stats["frames"] = self.frame_stats()
+        stats["subscribers"] = self.subscriber_stats()
+        return stats
+
+    def queue_stats(self) -> Dict[str, int]:
+        """Method to get the counters of the queue between the sensor callbacks and the calculations
+
+        Returns:
+            Dict[str, int]: Amount of queued, dropped, processed and currently pending position data
+        """
+        if self._ingestion == None:
+            return {}
+        return self._ingestion.stats()
+
+    def frame_stats(self) -> Dict[str, int]:
+        """Method to get the counters of the frame-aligned mode
+
+        Returns:
+            Dict[str, int]: Amount of complete, incomplete (calculated by deadline), dropped (by the overflow policy),
+                pending frames and late position data
         """
-        for index in range(len(self._subscribers)):
-            if self._subscribers[index] == subscription:
-                self._subscribers.pop(index)
-                break
+        if self._aligner == None:
+            return {}
+        return self._aligner.stats()
+
+    def subscriber_stats(self) -> Dict[int, List[Dict[str, float]]]:
+        """Method to get the delivery counters of all subscribers of all heroes
+
+        Returns:
+            Dict[int, List[Dict[str, float]]]: Amount of delivered, dropped, failed and pending data and the lag (in s) per subscriber,
+                keyed by the id of the hero the subscribers are subscribed to
+        """
+        stats: Dict[int, List[Dict[str, float]]] = {
+            self._hero_id: self._dispatcher.stats()
+        }
+        for hero_id, dispatcher in list(self._hero_dispatchers.items()):
+            stats[hero_id] = dispatcher.stats()
+        return stats
+
+    def actors_in_radius(
+        self, radius: Union[float, None] = None, hero_id: Union[int, None] = None
+    ) -> List[int]:
+        """Method to get all actors that are currently within a radius around a hero
+
+        Args:
+            radius (float, optional): Radius around the hero, defaults to the relevance radius of the hero
+            hero_id (int, optional): Id of the hero, defaults to the first hero
+
+        Returns:
+            List[int]: Ids of the actors within the radius (including the hero)
+        """
+        if self._hero == None:
+            return []
+        return self._hero.actors_in_radius(radius, hero_id)
+
+    def _hero_dispatcher(self, hero_id: Union[int, None]) -> Union[Dispatcher, None]:
+        """Method to get the dispatcher that forwards the data calculated relative to a hero
+
+        Args:
+            hero_id (int | None): Id of the hero, None for the first hero
+
+        Returns:
+            Dispatcher: Dispatcher of the hero
+            None: Hero not found
+        """
+        if hero_id == None or hero_id == self._hero_id:
+            return self._dispatcher
+        if hero_id not in self._hero_dispatchers:
+            logging.error(f"Hero {hero_id} not found")
+            return None
+        return self._hero_dispatchers[hero_id]
 
     def _header(self) -> List[str]:
         """Creates a header line for the created CSV file
@@ -149,11 +557,8 @@ class Api:
             List[str]: An array holding all headers for the created CSV file
         """
         header: List[str] = ["ID", "type"]
-        header += self._data_header("velocity")
-        header += self._data_header("orientation")
-        header += self._data_header("angular_speed")
-        header += self._data_header("distance_to_hero")
-        header += self._data_header("angle_to_hero")
+        for data_type in DATA_COLUMNS:
+            header += self._data_header(data_type)
         return header
 
     def _data_header(self, data_type: str) -> List[str]:
@@ -170,17 +575,40 @@ class Api:
             header.append(f"{data_type}_{count}")
         return header
 
-    def _classify_type(self, actor_type: str) -> int:
-        """Method to classify the type of an actor encoded as an integer
+    def _create_actor(self, actor: ActorInfo) -> Actor:
+        """Method to create the record of a road user
 
         Args:
-            actor_type (str): Actor type provided by the Carla world
+            actor (ActorInfo): Road user provided by the position source
 
         Returns:
-            int: Encoded traffic user type
+            Actor: Record the calculated data of the road user is stored in
+        """
+        return Actor(
+            actor.id, self._classifier.classify(actor.type_id), self._max_entry_count
+        )
+
+    def _attach(self, actor: ActorInfo) -> None:
+        """Method to start forwarding the position data of a road user with the settings given to start
+
+        Args:
+            actor (ActorInfo): Road user whose position data should be forwarded
+        """
+        noise: NoiseGenerator = NoiseGenerator(
+            self._error_range,
+            self._noise_model,
+            None if self._seed == None else (self._seed, actor.id),
+        )
+        self._source.attach(actor, self._on_data, self._tick, noise, self._recorder)
+
+    def _reconcile_periodically(self, interval: float) -> None:
+        """Main loop of the thread that reconciles the actors until the Api is stopped
+
+        Args:
+            interval (float): Time in seconds between two reconciliations
         """
-        for category in VehicleTypes.categories:
-            for type in VehicleTypes.types[category]:
-                if type in actor_type:
-                    return ROAD_USER_CODE[category]
-        return ROAD_USER_CODE[EActorType.PEDESTRIAN]
+        while not self._stopped.wait(interval):
+            try:
+                self.reconcile()
+            except Exception as err:
+                logging.error(f"An error occurred when reconciling the actors: {err}")
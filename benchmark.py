@@ -0,0 +1,480 @@
+import argparse
+import json
+import pathlib
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import numpy as np
+import recent_data
+
+from typing import Any, Callable, Dict, List, Union
+from actor import Actor
+from api import Api
+from common import EOverflowPolicy
+from datatypes import Coordinate
+from dispatcher import Dispatcher
+from hero import Hero
+from ingestion import Ingestion
+from math_operations import MathOperations as mo
+from shard_pool import ShardPool
+from recent_data import RecentData
+from synthetic_source import SyntheticSource
+
+TICK: float = 0.05
+RELEVANCE_RADIUS: float = 200.0
+CORE_MODULES: List[str] = [
+    "datatypes",
+    "math_operations",
+    "recent_data",
+    "actor",
+    "hero",
+    "api",
+]
+HEAVY_MODULES: List[str] = ["carla", "scipy"]
+
+Result = Dict[str, Any]
+# amount of events processed by a step, or the latencies (in ns) of the events it timed individually
+StepResult = Union[int, List[int]]
+# stops the threads the setups started, run by measure after every pass
+TEARDOWNS: List[Callable[[], None]] = []
+
+
+def measure(
+    name: str,
+    params: Dict[str, Any],
+    setup: Callable[[], Callable[[int], StepResult]],
+    iterations: int,
+) -> Result:
+    """Runs a benchmark and returns throughput, latency percentiles and peak memory
+
+    Note:
+        Steps that time their events individually yield true per event percentiles. For all other steps the
+        latency of an event is the duration of its step divided by the amount of events, which is an average
+        per step (e.g. per frame) once a step processes several events, as the result states under "latency"
+
+    Args:
+        name (str): Name of the benchmark
+        params (Dict[str, Any]): Parameters the benchmark was run with
+        setup (Callable[[], Callable[[int], StepResult]]): Creates fresh state and returns the measured step, which
+            takes the iteration index and returns the amount of events it processed or their individual latencies
+        iterations (int): Amount of measured steps
+
+    Returns:
+        Result: Benchmark result
+    """
+    step: Callable[[int], StepResult] = setup()
+    latencies: List[float] = []
+    events: int = 0
+    averaged: bool = False
+    start: float = time.perf_counter()
+    for iteration in range(iterations):
+        before: int = time.perf_counter_ns()
+        result: StepResult = step(iteration)
+        elapsed: int = time.perf_counter_ns() - before
+        if isinstance(result, list):
+            latencies += result
+            events += len(result)
+            continue
+        if result > 0:
+            latencies.append(elapsed / result)
+        averaged = averaged or result > 1
+        events += result
+    duration: float = time.perf_counter() - start
+    teardown()
+
+    step = setup()
+    tracemalloc.start()
+    for iteration in range(iterations):
+        step(iteration)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    teardown()
+
+    return {
+        "name": name,
+        "params": params,
+        "events": events,
+        "seconds": round(duration, 6),
+        "events_per_second": round(events / duration, 1) if duration > 0 else None,
+        "latency": "per_step_average" if averaged else "per_event",
+        "p50_us": round(float(np.percentile(latencies, 50)) / 1000, 3),
+        "p99_us": round(float(np.percentile(latencies, 99)) / 1000, 3),
+        "peak_memory_bytes": peak_memory,
+    }
+
+
+def teardown() -> None:
+    """Stops the threads started by the setups of the last pass"""
+    while TEARDOWNS:
+        TEARDOWNS.pop()()
+
+
+def measure_import(module: str, repetitions: int) -> Result:
+    """Measures the time it takes to import a module in a fresh interpreter
+
+    Args:
+        module (str): Name of the module to be imported
+        repetitions (int): Amount of fresh interpreters the import is measured in
+
+    Returns:
+        Result: Median import time and the heavy dependencies that were loaded by the import
+    """
+    code: str = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "seconds = time.perf_counter() - start\n"
+        f"heavy = sorted({{m.split('.')[0] for m in sys.modules}} & set({HEAVY_MODULES!r}))\n"
+        "print(json.dumps([seconds, heavy]))\n"
+    )
+    seconds: List[float] = []
+    heavy: List[str] = []
+    for _ in range(repetitions):
+        output: str = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=pathlib.Path(__file__).parent,
+            check=True,
+        ).stdout
+        elapsed, heavy = json.loads(output)
+        seconds.append(elapsed)
+    return {
+        "name": "import",
+        "params": {"module": module},
+        "median_ms": round(float(np.median(seconds)) * 1000, 3),
+        "heavy_modules": heavy,
+    }
+
+
+def hero_setup(
+    actor_count: int,
+    batched: bool,
+    hero_count: int = 1,
+    queue_size: int = 0,
+    process_count: int = 0,
+) -> Callable[[], Callable[[int], StepResult]]:
+    """Creates the setup of a benchmark of the per event or per frame calculations of Hero
+
+    Note:
+        Every hero has a subscriber that discards the data, so the data is encoded and delivered like in a run
+
+    Args:
+        actor_count (int): Amount of synthetic actors
+        batched (bool): Benchmark Hero.on_position_frame instead of Hero.on_position_data
+        hero_count (int, optional): Amount of heroes the data is calculated relative to
+        queue_size (int, optional): Feed the position data through an Ingestion with a queue of this size,
+            each event is timed from being queued until it is calculated (ignored if batched)
+        process_count (int, optional): Calculate the frames in a ShardPool with this amount of processes (only if batched)
+
+    Returns:
+        Callable[[], Callable[[int], StepResult]]: Setup of the benchmark
+    """
+
+    def setup() -> Callable[[int], StepResult]:
+        source: SyntheticSource = SyntheticSource(actor_count, seed=1, realtime=False)
+        actors: Dict[int, Actor] = {id: Actor(id, 0, 10) for id in range(actor_count)}
+        dispatchers: List[Dispatcher] = [Dispatcher() for _ in range(hero_count)]
+        for dispatcher in dispatchers:
+            dispatcher.subscribe(lambda json_data: None)
+            TEARDOWNS.append(dispatcher.stop)
+        hero: Hero = Hero(0, actors, dispatchers[0], RELEVANCE_RADIUS)
+        for hero_id in range(1, hero_count):
+            hero.add_hero(hero_id, RELEVANCE_RADIUS, dispatchers[hero_id])
+        if process_count > 0:
+            pool: ShardPool = ShardPool(process_count, actor_count, hero_count)
+            hero.shard_pool = pool
+            TEARDOWNS.append(pool.stop)
+        ids: List[int] = list(range(actor_count))
+
+        def step(iteration: int) -> StepResult:
+            timestamp: float = iteration * TICK
+            positions: np.ndarray = source.positions(timestamp)
+            if batched:
+                hero.on_position_frame(timestamp, ids, positions)
+                return actor_count
+            latencies: List[int] = []
+            for id, position in zip(ids, positions.tolist()):
+                coordinate: Coordinate = Coordinate(*position)
+                before: int = time.perf_counter_ns()
+                hero.on_position_data(id, timestamp, coordinate)
+                latencies.append(time.perf_counter_ns() - before)
+            return latencies
+
+        if queue_size == 0 or batched:
+            return step
+        queued: List[int] = []
+        calculated: List[int] = []
+        drained: threading.Event = threading.Event()
+
+        def on_data(id: int, timestamp: float, position: Coordinate) -> None:
+            hero.on_position_data(id, timestamp, position)
+            calculated.append(time.perf_counter_ns())
+            if len(calculated) == actor_count:
+                drained.set()
+
+        # a single worker without dropping calculates the events in the order they were queued
+        ingestion: Ingestion = Ingestion(on_data, queue_size, EOverflowPolicy.BLOCK, 1)
+        TEARDOWNS.append(ingestion.stop)
+
+        def ingested_step(iteration: int) -> StepResult:
+            timestamp: float = iteration * TICK
+            positions: np.ndarray = source.positions(timestamp)
+            queued.clear()
+            calculated.clear()
+            drained.clear()
+            for id, position in zip(ids, positions.tolist()):
+                coordinate: Coordinate = Coordinate(*position)
+                queued.append(time.perf_counter_ns())
+                ingestion(id, timestamp, coordinate)
+            drained.wait()
+            return [after - before for before, after in zip(queued, calculated)]
+
+        return ingested_step
+
+    return setup
+
+
+def recent_data_setup(store_size: int) -> Callable[[], Callable[[int], StepResult]]:
+    """Creates the setup of a benchmark of RecentData.update
+
+    Args:
+        store_size (int): Value of MAX_STORE_SIZE to benchmark with
+
+    Returns:
+        Callable[[], Callable[[int], StepResult]]: Setup of the benchmark
+    """
+
+    def setup() -> Callable[[int], StepResult]:
+        recent_data.MAX_STORE_SIZE = store_size
+        data: RecentData = RecentData(3)
+
+        def step(iteration: int) -> int:
+            data.update(iteration * TICK, Coordinate(iteration * 0.3, iteration, 0))
+            return 1
+
+        return step
+
+    return setup
+
+
+def actor_setup(max_entry_count: int) -> Callable[[], Callable[[int], StepResult]]:
+    """Creates the setup of a benchmark of Actor.add_data
+
+    Args:
+        max_entry_count (int): Amount of entries stored per actor
+
+    Returns:
+        Callable[[], Callable[[int], StepResult]]: Setup of the benchmark
+    """
+
+    def setup() -> Callable[[int], StepResult]:
+        actor: Actor = Actor(1, 0, max_entry_count)
+
+        def step(iteration: int) -> int:
+            actor.add_data(iteration * TICK, 12.3456, 90.1, 0.5, 0.1, 42.42, 180.0)
+            return 1
+
+        return step
+
+    return setup
+
+
+def math_setup() -> Callable[[], Callable[[int], StepResult]]:
+    """Creates the setup of a benchmark of the MathOperations used per event
+
+    Returns:
+        Callable[[], Callable[[int], StepResult]]: Setup of the benchmark
+    """
+
+    def setup() -> Callable[[int], StepResult]:
+        before: Coordinate = Coordinate(1.0, 2.0, 0.0)
+
+        def step(iteration: int) -> int:
+            vec = mo.vector(Coordinate(1.0 + iteration * 0.01, 3.0, 0.0), before)
+            mo.velocity(vec, 0, TICK)
+            angle = mo.angle_to_y_axis(vec)
+            mo.angle_between_vectors(vec, before)
+            mo.angular_speed(angle, 10.0, 0, TICK)
+            return 1
+
+        return step
+
+    return setup
+
+
+def save_csv_setup(
+    actor_count: int, max_entry_count: int, directory: str
+) -> Callable[[], Callable[[int], StepResult]]:
+    """Creates the setup of a benchmark of Api.save_csv
+
+    Args:
+        actor_count (int): Amount of actors to be saved
+        max_entry_count (int): Amount of entries stored per actor
+        directory (str): Folder the files are written to
+
+    Returns:
+        Callable[[], Callable[[int], StepResult]]: Setup of the benchmark
+    """
+
+    def setup() -> Callable[[int], StepResult]:
+        api: Api = Api(
+            "",
+            0,
+            RELEVANCE_RADIUS,
+            max_entry_count,
+            source=SyntheticSource(actor_count, realtime=False),
+        )
+        for actor in api._actors.values():
+            for index in range(max_entry_count):
+                actor.add_data(index * TICK, 12.3456, 90.1, 0.5, 0.1, 42.42, 180.0)
+
+        def step(iteration: int) -> int:
+            api.save_csv(directory, f"benchmark_{iteration}.csv")
+            return actor_count
+
+        return step
+
+    return setup
+
+
+def run(quick: bool) -> List[Result]:
+    """Runs all benchmarks
+
+    Args:
+        quick (bool): Run with smaller sizes
+
+    Returns:
+        List[Result]: Results of all benchmarks
+    """
+    actor_counts: List[int] = [10, 100, 1000] if quick else [10, 100, 1000, 10000]
+    store_sizes: List[int] = [10, 30, 100] if quick else [10, 30, 100, 1000]
+    entry_counts: List[int] = [10, 100, 1000] if quick else [10, 100, 1000, 10000]
+    frames: int = 20 if quick else 100
+    results: List[Result] = []
+    for actor_count in actor_counts:
+        for batched in (False, True):
+            results.append(
+                measure(
+                    "hero.on_position_frame" if batched else "hero.on_position_data",
+                    {"actor_count": actor_count},
+                    hero_setup(actor_count, batched),
+                    frames,
+                )
+            )
+    for actor_count in actor_counts:
+        results.append(
+            measure(
+                "ingestion",
+                {"actor_count": actor_count, "queue_size": 1000},
+                hero_setup(actor_count, False, queue_size=1000),
+                frames,
+            )
+        )
+    for actor_count in actor_counts[-2:]:
+        for process_count in (2, 4):
+            results.append(
+                measure(
+                    "hero.on_position_frame",
+                    {"actor_count": actor_count, "process_count": process_count},
+                    hero_setup(actor_count, True, process_count=process_count),
+                    frames,
+                )
+            )
+    for hero_count in (2, 4, 8):
+        for batched in (False, True):
+            results.append(
+                measure(
+                    "hero.on_position_frame" if batched else "hero.on_position_data",
+                    {"actor_count": actor_counts[-2], "hero_count": hero_count},
+                    hero_setup(actor_counts[-2], batched, hero_count),
+                    frames,
+                )
+            )
+    default_store_size: int = recent_data.MAX_STORE_SIZE
+    for store_size in store_sizes:
+        results.append(
+            measure(
+                "recent_data.update",
+                {"max_store_size": store_size},
+                recent_data_setup(store_size),
+                10000,
+            )
+        )
+    recent_data.MAX_STORE_SIZE = default_store_size
+    for entry_count in entry_counts:
+        results.append(
+            measure(
+                "actor.add_data",
+                {"max_entry_count": entry_count},
+                actor_setup(entry_count),
+                10000,
+            )
+        )
+    results.append(measure("math_operations", {}, math_setup(), 10000))
+    with tempfile.TemporaryDirectory() as directory:
+        for actor_count in actor_counts:
+            for entry_count in entry_counts[:2]:
+                results.append(
+                    measure(
+                        "api.save_csv",
+                        {"actor_count": actor_count, "max_entry_count": entry_count},
+                        save_csv_setup(actor_count, entry_count, directory),
+                        3,
+                    )
+                )
+    return results
+
+
+def run_imports(quick: bool) -> List[Result]:
+    """Measures the import times of the computation core
+
+    Args:
+        quick (bool): Measure with fewer repetitions
+
+    Returns:
+        List[Result]: Results of all import measurements
+    """
+    return [measure_import(module, 3 if quick else 10) for module in CORE_MODULES]
+
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Benchmarks the hot path from ingestion to publishing with synthetic data"
+    )
+    parser.add_argument(
+        "-o", "--output", default="benchmark.json", help="File the results are saved to"
+    )
+    parser.add_argument(
+        "-q", "--quick", action="store_true", help="Run with smaller sizes"
+    )
+    args: argparse.Namespace = parser.parse_args()
+    imports: List[Result] = run_imports(args.quick)
+    for result in imports:
+        print(
+            f"{result['name']:<24} {json.dumps(result['params']):<48} "
+            f"{result['median_ms']:>9} ms  heavy {result['heavy_modules']}"
+        )
+    results: List[Result] = run(args.quick)
+    for result in results:
+        print(
+            f"{result['name']:<24} {json.dumps(result['params']):<48} "
+            f"{result['events_per_second']:>12} ev/s  p50 {result['p50_us']:>9} us  "
+            f"p99 {result['p99_us']:>9} us  {result['latency']:<16}  peak {result['peak_memory_bytes']:>11} B"
+        )
+    with open(args.output, "w", encoding="UTF-8") as f:
+        json.dump(
+            {
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "imports": imports,
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
@@ -0,0 +1,100 @@
+from common import ROAD_USER_PREFIXES
+from datatypes import ActorInfo, GnssCallback
+from gnss_receiver import GnssReceiver
+from gnss_recorder import GnssRecorder
+from math_operations import MathOperations as mo
+from noise import NoiseGenerator
+from typing import Dict, List, Union
+
+import carla
+import logging
+import sys
+
+
+class CarlaSource:
+    """Class that provides the position data of the road users of a Carla world via GNSS sensors
+
+    Args:
+        host (string): Address of the host where the Carla world is running
+        port (int): Port to the host where the Carla world is running
+    """
+
+    def __init__(self, host: str, port: int) -> None:
+        self._gnss_receivers: Dict[int, GnssReceiver] = {}
+        self._road_users: Dict[int, carla.Actor] = {}
+        self._infos: Dict[int, ActorInfo] = {}
+        try:
+            client: carla.Client = carla.Client(host, port)
+            client.set_timeout(5.0)
+            self._world: carla.World = client.get_world()
+        except RuntimeError as err:
+            logging.error(f"Something went wrong connecting: {err}")
+            sys.exit(1)
+
+    def actors(self) -> List[ActorInfo]:
+        """Returns all vehicles and pedestrians currently present in the Carla world
+
+        Note:
+            Reading the velocity is a request to the server, so it is only read for actors that were not returned by the previous call
+
+        Returns:
+            List[ActorInfo]: Road users of the Carla world
+        """
+        infos: Dict[int, ActorInfo] = {}
+        for actor in self._world.get_actors():
+            if actor.type_id.startswith(ROAD_USER_PREFIXES):
+                self._road_users[actor.id] = actor
+                info: Union[ActorInfo, None] = self._infos.get(actor.id)
+                if info == None:
+                    info = ActorInfo(
+                        actor.id,
+                        actor.type_id,
+                        mo.vector_length(actor.get_velocity()) > 0,
+                    )
+                infos[actor.id] = info
+        self._infos = infos
+        return list(infos.values())
+
+    def attach(
+        self,
+        actor: ActorInfo,
+        on_data: GnssCallback,
+        tick: float,
+        noise: NoiseGenerator,
+        recorder: Union[GnssRecorder, None] = None,
+    ) -> None:
+        """Spawns a GNSS sensor on an actor that forwards its position data
+
+        Args:
+            actor (ActorInfo): Actor whose position data should be forwarded
+            on_data (GnssCallback): Callback function to which the position data is forwarded to
+            tick (float): Seconds between each position detection
+            noise (NoiseGenerator): Generator of the offsets the position data is distorted with
+            recorder (GnssRecorder, optional): Recorder the raw measurements and applied distortion are recorded with
+        """
+        self._gnss_receivers[actor.id] = GnssReceiver(
+            self._road_users[actor.id],
+            self._world,
+            on_data,
+            noise,
+            tick,
+            recorder,
+        )
+
+    def start(self) -> None:
+        """Does nothing, as every GNSS sensor forwards its position data as soon as it is spawned"""
+
+    def detach(self, id: int) -> None:
+        """Destroys the GNSS sensor of an actor
+
+        Args:
+            id (int): Id of the actor within the Carla world
+        """
+        if id in self._gnss_receivers:
+            self._gnss_receivers.pop(id).destroy()
+        self._road_users.pop(id, None)
+
+    def stop(self) -> None:
+        """Destroys all GNSS sensors"""
+        for id in list(self._gnss_receivers):
+            self._gnss_receivers.pop(id).destroy()
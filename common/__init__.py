@@ -2,3 +2,6 @@ from .constants import *
 from .vehicle_types import *
 from .vehicle_type import *
 from .actor_type import *
+from .overflow_policy import *
+from .trajectory import *
+from .noise_model import *
@@ -1,4 +1,5 @@
-from typing import Dict
+from typing import Dict, List, Tuple, Union
+import numpy as np
 from datatypes import Vector
 from .vehicle_type import EVehicleType
 from .actor_type import EActorType
@@ -7,10 +8,72 @@ Y_AXIS: Vector = Vector(0, 1, 0)
 
 MAX_STORE_SIZE: int = 30
 
-ROAD_USER_CODE: Dict[EVehicleType, int] = {
+EARTH_RADIUS_EQUA: float = 6378137.0
+
+HERO_POSE_CACHE_SIZE: int = 16
+
+FRAME_QUEUE_SIZE: int = 64
+
+CULL_MARGIN: float = 1.0
+
+MIN_CELL_SIZE: float = 10.0
+
+DATA_COLUMNS: List[str] = [
+    "velocity",
+    "orientation",
+    "angular_speed",
+    "accelaration",
+    "distance_to_hero",
+    "angle_to_hero",
+]
+
+ROAD_USER_CODE: Dict[Union[EVehicleType, EActorType], int] = {
     EVehicleType.CAR: 0,
     EActorType.PEDESTRIAN: 1,
     EVehicleType.MOTORCYCLE: 2,
     EVehicleType.TRUCK: 3,
     EVehicleType.BIKE: 4,
 }
+
+ROAD_USER_PREFIXES: Tuple[str, ...] = (
+    f"{EActorType.VEHICLE.value}.",
+    f"walker.{EActorType.PEDESTRIAN.value}.",
+)
+
+RECORD_DTYPE: np.dtype = np.dtype(
+    [("id", np.int64), ("type", np.int8), ("timestamp", np.float64)]
+    + [(column, np.float64) for column in DATA_COLUMNS]
+)
+
+GNSS_RECORD_DTYPE: np.dtype = np.dtype(
+    [
+        ("id", np.int64),
+        ("timestamp", np.float64),
+        ("longitude", np.float64),
+        ("latitude", np.float64),
+        ("altitude", np.float64),
+        ("distorted_longitude", np.float64),
+        ("distorted_latitude", np.float64),
+        ("distorted_altitude", np.float64),
+    ]
+)
+
+# upper bounds (in s) of the buckets of the latency histograms of the instrumentation
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    1e-6,
+    2.5e-6,
+    5e-6,
+    1e-5,
+    2.5e-5,
+    5e-5,
+    1e-4,
+    2.5e-4,
+    5e-4,
+    1e-3,
+    2.5e-3,
+    5e-3,
+    1e-2,
+    2.5e-2,
+    5e-2,
+    1e-1,
+)
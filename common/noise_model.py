@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class ENoiseModel(Enum):
+    """
+    Enum that holds the different error models the GNSS positions can be distorted with
+    """
+
+    CIRCULAR = "circular"
+    GAUSSIAN = "gaussian"
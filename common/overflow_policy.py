@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class EOverflowPolicy(Enum):
+    """
+    Enum that holds the policies of how to handle incoming data when a queue is full
+    """
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
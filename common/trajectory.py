@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class ETrajectory(Enum):
+    """
+    Enum that holds the different trajectories of synthetically generated actors
+    """
+
+    LINEAR = "linear"
+    CIRCLE = "circle"
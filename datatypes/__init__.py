@@ -1,5 +1,11 @@
 from .coordinate import *
 from .vector import *
+from .coordinate_array import *
 from .recent import *
+from .position_buffer import *
 from .subscription import *
 from .gnss_callback import *
+from .frame_callback import *
+from .frame_data_callback import *
+from .actor_info import *
+from .position_source import *
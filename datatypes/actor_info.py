@@ -0,0 +1,34 @@
+class ActorInfo:
+    """Class to represent an actor provided by a position source
+
+    Args:
+        id (int): Id that represents the actor in the world
+        type_id (str): Blueprint name of the actor (e.g. "vehicle.audi.a2")
+        moving (bool): Whether the actor was moving when it was first enumerated
+    """
+
+    def __init__(self, id: int, type_id: str, moving: bool) -> None:
+        self._id: int = id
+        self._type_id: str = type_id
+        self._moving: bool = moving
+
+    @property
+    def id(self) -> int:
+        """
+        Returns:
+            int: Id that represents the actor in the world"""
+        return self._id
+
+    @property
+    def type_id(self) -> str:
+        """
+        Returns:
+            str: Blueprint name of the actor"""
+        return self._type_id
+
+    @property
+    def moving(self) -> bool:
+        """
+        Returns:
+            bool: Whether the actor was moving when it was first enumerated"""
+        return self._moving
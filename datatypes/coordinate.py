@@ -1,34 +1,18 @@
-class Coordinate:
+from typing import NamedTuple
+
+
+class Coordinate(NamedTuple):
     """Class to represent a 3D coordinate
 
+    Note:
+        Stored as an immutable tuple without a per-instance __dict__, so it can be passed directly to NumPy
+
     Args:
         x (float): x component of coordinate
         y (float): y component of coordinate
         z (float): z component of coordinate
     """
 
-    def __init__(self, x: float, y: float, z: float):
-        self._x: float = x
-        self._y: float = y
-        self._z: float = z
-
-    @property
-    def x(self) -> float:
-        """
-        Returns:
-            float: x component of coordinate"""
-        return self._x
-
-    @property
-    def y(self) -> float:
-        """
-        Returns:
-            float: y component of coordinate"""
-        return self._y
-
-    @property
-    def z(self) -> float:
-        """
-        Returns:
-            float: z component of coordinate"""
-        return self._z
+    x: float
+    y: float
+    z: float
@@ -0,0 +1,73 @@
+from datatypes import Coordinate
+from typing import Iterable, Iterator, List
+
+import numpy as np
+
+
+class CoordinateArray:
+    """Class to represent many 3D coordinates as one (n, 3) array for bulk calculations
+
+    Args:
+        values (np.ndarray): Coordinates as rows of x, y and z (shape (n, 3))
+    """
+
+    def __init__(self, values: np.ndarray) -> None:
+        self._values: np.ndarray = np.asarray(values, dtype=float).reshape(-1, 3)
+
+    @staticmethod
+    def from_coordinates(coordinates: Iterable[Coordinate]) -> "CoordinateArray":
+        """Creates a coordinate array from single coordinates
+
+        Args:
+            coordinates (Iterable[Coordinate]): Coordinates to be converted
+
+        Returns:
+            CoordinateArray: Coordinates as one array
+        """
+        return CoordinateArray(np.array(list(coordinates), dtype=float))
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: Coordinates as rows of x, y and z (shape (n, 3))
+        """
+        return self._values
+
+    @property
+    def x(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: x components of the coordinates"""
+        return self._values[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: y components of the coordinates"""
+        return self._values[:, 1]
+
+    @property
+    def z(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: z components of the coordinates"""
+        return self._values[:, 2]
+
+    def to_coordinates(self) -> List[Coordinate]:
+        """Converts the array into single coordinates
+
+        Returns:
+            List[Coordinate]: Coordinates in the order of the rows
+        """
+        return [Coordinate(x, y, z) for x, y, z in self._values.tolist()]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index: int) -> Coordinate:
+        return Coordinate(*self._values[index].tolist())
+
+    def __iter__(self) -> Iterator[Coordinate]:
+        return iter(self.to_coordinates())
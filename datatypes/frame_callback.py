@@ -0,0 +1,16 @@
+from typing import List, Protocol
+import numpy as np
+
+
+class FrameCallback(Protocol):
+    """Class to represent a callback function that receives the positions of all actors detected at the same timestamp
+
+    Args:
+        timestamp (float): Timestamp on when the positions were retrieved
+        ids (List[int]): Ids of the actors within the Carla world
+        positions (np.ndarray): Positions of the actors at the given timestamp (shape (n, 3))
+    """
+
+    def __call__(
+        self, timestamp: float, ids: List[int], positions: np.ndarray
+    ) -> None: ...
@@ -0,0 +1,17 @@
+from typing import Protocol
+from datatypes import Coordinate
+
+
+class FrameDataCallback(Protocol):
+    """Class to represent a callback function that receives position data together with the simulator frame it was measured in
+
+    Args:
+        id (int): Id of the actor within the Carla world
+        frame (int): Id of the simulator frame the position was measured in
+        timestamp (float): Timestamp on when the position was retrieved
+        position (Coordinate): Position at the given timestamp
+    """
+
+    def __call__(
+        self, id: int, frame: int, timestamp: float, position: Coordinate
+    ) -> None: ...
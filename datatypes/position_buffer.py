@@ -0,0 +1,108 @@
+import numpy as np
+
+from datatypes import Coordinate
+
+
+class PositionBuffer:
+    """Class to represent a timestamp ordered ring buffer of positions backed by preallocated arrays
+
+    Note:
+        Every sample is written twice (at its slot and at slot + capacity), so the stored samples always
+        form one contiguous window that can be handed out as a view without copying
+
+    Args:
+        capacity (int): Maximum amount of positions to be stored
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity: int = capacity
+        self._timestamps: np.ndarray = np.zeros(2 * capacity, dtype=np.float64)
+        self._positions: np.ndarray = np.zeros((2 * capacity, 3), dtype=np.float64)
+        self._start: int = 0
+        self._size: int = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: View on the stored timestamps in ascending order (shape (n,))
+        """
+        return self._timestamps[self._start : self._start + self._size]
+
+    @property
+    def positions(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: View on the stored positions in order of their timestamps (shape (n, 3))
+        """
+        return self._positions[self._start : self._start + self._size]
+
+    @property
+    def latest_timestamp(self) -> float:
+        """
+        Returns:
+            float: Most recent stored timestamp
+        """
+        return float(self._timestamps[self._start + self._size - 1])
+
+    def append(self, timestamp: float, position: Coordinate) -> None:
+        """Stores a position at the given timestamp, evicting the oldest one when full
+
+        Args:
+            timestamp (float): Timestamp of the position
+            position (Coordinate): Position to be stored
+        """
+        if self._size > 0 and timestamp <= self.latest_timestamp:
+            self._insert(timestamp, position)
+            return
+        if self._size < self._capacity:
+            slot: int = (self._start + self._size) % self._capacity
+            self._size += 1
+        else:
+            slot = self._start
+            self._start = (self._start + 1) % self._capacity
+        self._write(slot, timestamp, position.x, position.y, position.z)
+
+    def _write(self, slot: int, timestamp: float, x: float, y: float, z: float) -> None:
+        """Writes a sample into the given slot and its mirrored slot
+
+        Args:
+            slot (int): Slot within [0, capacity)
+            timestamp (float): Timestamp to write
+            x (float): x component of the position
+            y (float): y component of the position
+            z (float): z component of the position
+        """
+        self._timestamps[slot] = timestamp
+        self._timestamps[slot + self._capacity] = timestamp
+        self._positions[slot] = (x, y, z)
+        self._positions[slot + self._capacity] = (x, y, z)
+
+    def _insert(self, timestamp: float, position: Coordinate) -> None:
+        """Stores a sample that is not newer than the most recent one (replaces a sample with an equal timestamp)
+
+        Args:
+            timestamp (float): Timestamp of the position
+            position (Coordinate): Position to be stored
+        """
+        timestamps: np.ndarray = self.timestamps.copy()
+        positions: np.ndarray = self.positions.copy()
+        index: int = int(np.searchsorted(timestamps, timestamp))
+        if timestamps[index] == timestamp:
+            positions[index] = (position.x, position.y, position.z)
+        else:
+            timestamps = np.insert(timestamps, index, timestamp)
+            positions = np.insert(
+                positions, index, (position.x, position.y, position.z), axis=0
+            )
+        timestamps = timestamps[-self._capacity :]
+        positions = positions[-self._capacity :]
+        self._start = 0
+        self._size = len(timestamps)
+        self._timestamps[: self._size] = timestamps
+        self._timestamps[self._capacity : self._capacity + self._size] = timestamps
+        self._positions[: self._size] = positions
+        self._positions[self._capacity : self._capacity + self._size] = positions
@@ -0,0 +1,53 @@
+from typing import List, Protocol, Union, TYPE_CHECKING
+from datatypes import ActorInfo, GnssCallback
+
+if TYPE_CHECKING:
+    from gnss_recorder import GnssRecorder
+    from noise import NoiseGenerator
+
+
+class PositionSource(Protocol):
+    """Class to represent a source of position data for a set of actors (e.g. a Carla world or a synthetic traffic generator)"""
+
+    def actors(self) -> List[ActorInfo]:
+        """Returns all road users currently present in the source
+
+        Returns:
+            List[ActorInfo]: Road users of the source
+        """
+        ...
+
+    def attach(
+        self,
+        actor: ActorInfo,
+        on_data: GnssCallback,
+        tick: float,
+        noise: "NoiseGenerator",
+        recorder: Union["GnssRecorder", None] = None,
+    ) -> None:
+        """Starts forwarding the position data of an actor
+
+        Args:
+            actor (ActorInfo): Actor whose position data should be forwarded
+            on_data (GnssCallback): Callback function to which the position data is forwarded to
+            tick (float): Seconds between each position detection
+            noise (NoiseGenerator): Generator of the offsets the position data is distorted with
+            recorder (GnssRecorder, optional): Recorder the raw measurements and applied distortion are recorded with
+        """
+        ...
+
+    def start(self) -> None:
+        """Starts forwarding the position data of the attached actors, called once all initial actors are attached"""
+        ...
+
+    def detach(self, id: int) -> None:
+        """Stops forwarding the position data of an actor
+
+        Args:
+            id (int): Id of the actor
+        """
+        ...
+
+    def stop(self) -> None:
+        """Stops forwarding the position data of all actors"""
+        ...
@@ -1,34 +1,18 @@
-class Vector:
+from typing import NamedTuple
+
+
+class Vector(NamedTuple):
     """Class to represent a 3D vector
 
+    Note:
+        Stored as an immutable tuple without a per-instance __dict__, so it can be passed directly to NumPy
+
     Args:
         x (float): x component of vector
         y (float): y component of vector
         z (float): z component of vector
     """
 
-    def __init__(self, x: float, y: float, z: float) -> None:
-        self._x: float = x
-        self._y: float = y
-        self._z: float = z
-
-    @property
-    def x(self) -> float:
-        """
-        Returns:
-            float: x component of vector"""
-        return self._x
-
-    @property
-    def y(self) -> float:
-        """
-        Returns:
-            float: y component of vector"""
-        return self._y
-
-    @property
-    def z(self) -> float:
-        """
-        Returns:
-            float: z component of vector"""
-        return self._z
+    x: float
+    y: float
+    z: float
@@ -0,0 +1,209 @@
+from common import EOverflowPolicy
+from datatypes import Subscription
+from metrics import metrics
+from collections import deque
+from typing import Deque, Dict, List, Tuple, Union
+
+import json
+import logging
+import threading
+import time
+
+
+class SubscriberQueue:
+    """Class that delivers JSON data to one subscriber from its own bounded queue and worker thread
+
+    Args:
+        subscription (Subscription): Callback function the JSON data is delivered to
+        max_size (int): Maximum amount of queued JSON data
+        overflow_policy (EOverflowPolicy): How to handle new JSON data when the queue is full
+    """
+
+    def __init__(
+        self,
+        subscription: Subscription,
+        max_size: int,
+        overflow_policy: EOverflowPolicy,
+    ) -> None:
+        self._subscription: Subscription = subscription
+        self._max_size: int = max_size
+        self._overflow_policy: EOverflowPolicy = overflow_policy
+        self._queue: Deque[Tuple[float, str]] = deque()
+        self._condition: threading.Condition = threading.Condition()
+        self._stop: bool = False
+        self._delivered: int = 0
+        self._dropped: int = 0
+        self._failed: int = 0
+        self._worker: threading.Thread = threading.Thread(
+            target=self._work, daemon=True
+        )
+        self._worker.start()
+
+    @property
+    def subscription(self) -> Subscription:
+        """
+        Returns:
+            Subscription: Callback function the JSON data is delivered to
+        """
+        return self._subscription
+
+    def put(self, json_data: str) -> None:
+        """Queues JSON data for delivery
+
+        Args:
+            json_data (str): String containing JSON data to be delivered
+        """
+        with self._condition:
+            if self._stop:
+                return
+            if len(self._queue) >= self._max_size:
+                if self._overflow_policy == EOverflowPolicy.BLOCK:
+                    self._condition.wait_for(
+                        lambda: len(self._queue) < self._max_size or self._stop
+                    )
+                    if self._stop:
+                        return
+                elif self._overflow_policy == EOverflowPolicy.DROP_OLDEST:
+                    self._queue.popleft()
+                    self._dropped += 1
+                else:
+                    self._dropped += 1
+                    return
+            self._queue.append((time.monotonic(), json_data))
+            self._condition.notify_all()
+
+    def stats(self) -> Dict[str, float]:
+        """Returns the delivery counters of the subscriber
+
+        Returns:
+            Dict[str, float]: Amount of delivered, dropped, failed and pending JSON data and the lag (in s) of the oldest pending one
+        """
+        with self._condition:
+            return {
+                "delivered": self._delivered,
+                "dropped": self._dropped,
+                "failed": self._failed,
+                "pending": len(self._queue),
+                "lag": time.monotonic() - self._queue[0][0] if self._queue else 0,
+            }
+
+    def stop(self, drain: bool = True) -> None:
+        """Stops the worker thread
+
+        Args:
+            drain (bool, optional): Deliver all pending JSON data before stopping
+        """
+        with self._condition:
+            if drain:
+                self._condition.wait_for(lambda: len(self._queue) == 0)
+            else:
+                self._queue.clear()
+            self._stop = True
+            self._condition.notify_all()
+        if threading.current_thread() != self._worker:
+            self._worker.join()
+
+    def _work(self) -> None:
+        """Main loop of the worker thread that delivers the queued JSON data"""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: len(self._queue) > 0 or self._stop)
+                if self._stop and len(self._queue) == 0:
+                    return
+                _, json_data = self._queue.popleft()
+                self._condition.notify_all()
+            timed: bool = metrics.enabled
+            start: int = time.perf_counter_ns() if timed else 0
+            try:
+                self._subscription(json_data)
+                self._delivered += 1
+                if timed:
+                    metrics.lap("subscriber", start)
+            except Exception as err:
+                self._failed += 1
+                logging.error(f"An error occurred when notifying a subscriber: {err}")
+
+
+class Dispatcher:
+    """Class that encodes calculated data once and forwards it to all subscribers asynchronously
+
+    Args:
+        max_size (int, optional): Maximum amount of queued JSON data per subscriber
+        overflow_policy (EOverflowPolicy, optional): How to handle new JSON data when the queue of a subscriber is full
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        overflow_policy: EOverflowPolicy = EOverflowPolicy.DROP_OLDEST,
+    ) -> None:
+        self._max_size: int = max_size
+        self._overflow_policy: EOverflowPolicy = overflow_policy
+        self._queues: List[SubscriberQueue] = []
+        self._lock: threading.Lock = threading.Lock()
+
+    def subscribe(self, subscription: Subscription) -> None:
+        """Adds a callback function to which the data will be forwarded to
+
+        Args:
+            subscription (Subscription): Callback function with one argument holding the data in JSON format
+        """
+        queue: SubscriberQueue = SubscriberQueue(
+            subscription, self._max_size, self._overflow_policy
+        )
+        with self._lock:
+            self._queues = self._queues + [queue]
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Removes a callback function to which the data is forwarded to
+
+        Args:
+            subscription (Subscription): Callback function that should be removed
+        """
+        removed: Union[SubscriberQueue, None] = None
+        with self._lock:
+            for index in range(len(self._queues)):
+                if self._queues[index].subscription == subscription:
+                    removed = self._queues[index]
+                    self._queues = self._queues[:index] + self._queues[index + 1 :]
+                    break
+        if removed != None:
+            removed.stop(drain=False)
+
+    def publish(self, data: List[Union[int, float, None]]) -> None:
+        """Encodes data once and queues it for every subscriber
+
+        Args:
+            data (List[int | float | None]): Data to be forwarded
+        """
+        if not self._queues:
+            return
+        if metrics.enabled:
+            start: int = time.perf_counter_ns()
+            json_data: str = json.dumps(data)
+            metrics.lap("encode", start)
+        else:
+            json_data = json.dumps(data)
+        self.publish_encoded(json_data)
+
+    def publish_encoded(self, json_data: str) -> None:
+        """Queues data that is already encoded for every subscriber
+
+        Args:
+            json_data (str): String containing JSON data to be forwarded
+        """
+        for queue in self._queues:
+            queue.put(json_data)
+
+    def stats(self) -> List[Dict[str, float]]:
+        """Returns the delivery counters of all subscribers
+
+        Returns:
+            List[Dict[str, float]]: Delivery counters of every subscriber in order of subscription
+        """
+        return [queue.stats() for queue in self._queues]
+
+    def stop(self) -> None:
+        """Delivers all pending data and stops all subscriber threads"""
+        for queue in self._queues:
+            queue.stop()
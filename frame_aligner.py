@@ -0,0 +1,237 @@
+from common import EOverflowPolicy, FRAME_QUEUE_SIZE
+from datatypes import Coordinate, CoordinateArray, FrameCallback
+from collections import deque
+from typing import Deque, Dict, List, Tuple, Union
+
+import threading
+import time
+import numpy as np
+
+FrameKey = Union[int, float]
+
+
+class FrameAligner:
+    """Class that groups the position data of all actors by the simulator frame it was measured in and forwards
+    every frame once it is complete or its deadline has passed
+
+    Note:
+        Meant for synchronous-mode runs, where all measurements of a frame are taken at the same instant.
+        Position data without a frame id (the GnssCallback signature) is grouped by its timestamp instead.
+        Position data of a frame that was already forwarded is dropped and counted as late.
+        Frames are forwarded in order from the thread of the aligner, so the sensor callbacks never wait for the calculations.
+        At most max_size forwarded frames wait for the thread, the overflow policy decides what happens to further frames
+
+    Args:
+        on_frame (FrameCallback): Callback function to which the aligned frames are forwarded to
+        expected_count (int): Amount of actors a complete frame holds
+        deadline (float, optional): Time in seconds after the first position data of a frame after which it is forwarded incomplete
+        max_size (int, optional): Maximum amount of forwarded frames waiting for the thread
+        overflow_policy (EOverflowPolicy, optional): How to handle a forwarded frame when the queue is full
+
+    Raises:
+        ValueError: If max_size is smaller than 1
+    """
+
+    def __init__(
+        self,
+        on_frame: FrameCallback,
+        expected_count: int,
+        deadline: float = 0.1,
+        max_size: int = FRAME_QUEUE_SIZE,
+        overflow_policy: EOverflowPolicy = EOverflowPolicy.DROP_OLDEST,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+        self._on_frame: FrameCallback = on_frame
+        self._expected_count: int = expected_count
+        self._deadline: float = deadline
+        self._max_size: int = max_size
+        self._overflow_policy: EOverflowPolicy = overflow_policy
+        self._frames: Dict[FrameKey, Tuple[float, float, Dict[int, Coordinate]]] = {}
+        self._ready: Deque[Tuple[float, List[int], np.ndarray]] = deque()
+        self._forwarded: Union[FrameKey, None] = None
+        self._complete: int = 0
+        self._incomplete: int = 0
+        self._late: int = 0
+        self._dropped: int = 0
+        self._stop: bool = False
+        self._condition: threading.Condition = threading.Condition()
+        self._worker: threading.Thread = threading.Thread(
+            target=self._work, daemon=True
+        )
+        self._worker.start()
+
+    @property
+    def expected_count(self) -> int:
+        """
+        Returns:
+            int: Amount of actors a complete frame holds
+        """
+        return self._expected_count
+
+    @expected_count.setter
+    def expected_count(self, expected_count: int) -> None:
+        """
+        Args:
+            expected_count (int): Amount of actors a complete frame should hold
+        """
+        with self._condition:
+            self._expected_count = expected_count
+
+    def __call__(self, id: int, timestamp: float, position: Coordinate) -> None:
+        """Adds position data to the frame of its timestamp
+
+        Args:
+            id (int): Id of the actor within the Carla world
+            timestamp (float): Timestamp on when the position was retrieved
+            position (Coordinate): Position at the given timestamp
+        """
+        self.on_frame_data(id, timestamp, timestamp, position)
+
+    def on_frame_data(
+        self, id: int, frame: FrameKey, timestamp: float, position: Coordinate
+    ) -> None:
+        """Adds position data to the frame it was measured in
+
+        Args:
+            id (int): Id of the actor within the Carla world
+            frame (int): Id of the simulator frame the position was measured in
+            timestamp (float): Timestamp on when the position was retrieved
+            position (Coordinate): Position at the given timestamp
+        """
+        with self._condition:
+            if self._stop or (self._forwarded != None and frame <= self._forwarded):
+                self._late += 1
+                return
+            if frame not in self._frames:
+                self._frames[frame] = (timestamp, time.monotonic() + self._deadline, {})
+                self._condition.notify_all()
+            positions: Dict[int, Coordinate] = self._frames[frame][2]
+            positions[id] = position
+            if self._expected_count > 0 and len(positions) >= self._expected_count:
+                self._forward_until(frame)
+
+    def on_frame(self, timestamp: float, ids: List[int], positions: np.ndarray) -> None:
+        """Forwards a frame that is complete already (e.g. read from one world snapshot) directly
+
+        Args:
+            timestamp (float): Timestamp on when the positions were retrieved
+            ids (List[int]): Ids of the actors within the Carla world
+            positions (np.ndarray): Positions of the actors at the given timestamp (shape (n, 3))
+        """
+        with self._condition:
+            if self._stop:
+                return
+            while self._frames:
+                self._forward(min(self._frames))
+            if self._overflow_policy == EOverflowPolicy.BLOCK:
+                self._condition.wait_for(
+                    lambda: len(self._ready) < self._max_size or self._stop
+                )
+                if self._stop:
+                    return
+            self._complete += 1
+            self._queue((timestamp, ids, positions))
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the counters of the aligner
+
+        Returns:
+            Dict[str, int]: Amount of complete, incomplete (forwarded by deadline), dropped (by the overflow policy),
+                pending (not yet calculated) frames and late position data
+        """
+        with self._condition:
+            return {
+                "complete": self._complete,
+                "incomplete": self._incomplete,
+                "dropped": self._dropped,
+                "pending": len(self._frames) + len(self._ready),
+                "late": self._late,
+            }
+
+    def stop(self) -> None:
+        """Forwards all pending frames, waits until they are calculated and stops the thread"""
+        with self._condition:
+            while self._frames:
+                self._forward(min(self._frames))
+            self._stop = True
+            self._condition.notify_all()
+        self._worker.join()
+
+    def _forward_until(self, last: FrameKey) -> None:
+        """Forwards all pending frames up to and including the given frame in order, without acquiring the lock
+
+        Args:
+            last (FrameKey): Last frame to be forwarded
+        """
+        while self._frames:
+            frame: FrameKey = min(self._frames)
+            if frame > last:
+                break
+            self._forward(frame)
+
+    def _forward(self, frame: FrameKey) -> None:
+        """Queues a pending frame to be forwarded by the thread without acquiring the lock
+
+        Note:
+            With the BLOCK policy and a full queue it only waits for room and leaves the frame pending,
+            the caller picks the oldest pending frame again, as other threads may have forwarded frames meanwhile
+
+        Args:
+            frame (FrameKey): Frame to be forwarded
+        """
+        if (
+            self._overflow_policy == EOverflowPolicy.BLOCK
+            and len(self._ready) >= self._max_size
+        ):
+            self._condition.wait_for(
+                lambda: len(self._ready) < self._max_size or self._stop
+            )
+            return
+        timestamp, _, positions = self._frames.pop(frame)
+        if len(positions) >= self._expected_count:
+            self._complete += 1
+        else:
+            self._incomplete += 1
+        self._forwarded = frame
+        self._queue(
+            (
+                timestamp,
+                list(positions),
+                CoordinateArray.from_coordinates(positions.values()).values,
+            )
+        )
+
+    def _queue(self, ready: Tuple[float, List[int], np.ndarray]) -> None:
+        """Queues a frame for the thread and drops the oldest or the given frame if the queue is full, without acquiring the lock
+
+        Args:
+            ready (Tuple[float, List[int], np.ndarray]): Timestamp, ids and positions of the frame
+        """
+        if len(self._ready) >= self._max_size:
+            self._dropped += 1
+            if self._overflow_policy != EOverflowPolicy.DROP_OLDEST:
+                return
+            self._ready.popleft()
+        self._ready.append(ready)
+        self._condition.notify_all()
+
+    def _work(self) -> None:
+        """Main loop of the thread that queues the frames whose deadline has passed and forwards the queued frames in order"""
+        while True:
+            with self._condition:
+                while not self._ready:
+                    if self._stop:
+                        return
+                    if not self._frames:
+                        self._condition.wait()
+                        continue
+                    frame: FrameKey = min(self._frames)
+                    delay: float = self._frames[frame][1] - time.monotonic()
+                    if delay > 0:
+                        self._condition.wait(delay)
+                        continue
+                    self._forward(frame)
+                ready: Tuple[float, List[int], np.ndarray] = self._ready.popleft()
+                self._condition.notify_all()
+            self._on_frame(*ready)
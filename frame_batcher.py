@@ -0,0 +1,67 @@
+from datatypes import Coordinate, CoordinateArray, FrameCallback
+from typing import Dict, List, Union
+
+import threading
+import numpy as np
+
+
+class FrameBatcher:
+    """Class that gathers the position data of all actors with the same timestamp and forwards them as one frame
+
+    Note:
+        Instances are callable with the signature of a GnssCallback, so they can be handed to a GnssReceiver directly.
+        A frame is forwarded as soon as position data with a different timestamp comes in or flush is called
+
+    Args:
+        on_frame (FrameCallback): Callback function to which the gathered frames are forwarded to
+    """
+
+    def __init__(self, on_frame: FrameCallback) -> None:
+        self._on_frame: FrameCallback = on_frame
+        self._lock: threading.Lock = threading.Lock()
+        self._timestamp: Union[float, None] = None
+        self._positions: Dict[int, Coordinate] = {}
+
+    def __call__(self, id: int, timestamp: float, position: Coordinate) -> None:
+        """Adds position data to the frame of its timestamp
+
+        Args:
+            id (int): Id of the actor within the Carla world
+            timestamp (float): Timestamp on when the position was retrieved
+            position (Coordinate): Position at the given timestamp
+        """
+        with self._lock:
+            if self._timestamp != None and timestamp != self._timestamp:
+                self._flush()
+            self._timestamp = timestamp
+            self._positions[id] = position
+
+    def on_frame(self, timestamp: float, ids: List[int], positions: np.ndarray) -> None:
+        """Forwards a complete frame directly, after the currently gathered frame
+
+        Args:
+            timestamp (float): Timestamp on when the positions were retrieved
+            ids (List[int]): Ids of the actors within the Carla world
+            positions (np.ndarray): Positions of the actors at the given timestamp (shape (n, 3))
+        """
+        with self._lock:
+            self._flush()
+            self._on_frame(timestamp, ids, positions)
+
+    def flush(self) -> None:
+        """Forwards the currently gathered frame, if there is one"""
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Forwards the currently gathered frame without acquiring the lock"""
+        if self._timestamp == None:
+            return
+        positions: np.ndarray = CoordinateArray.from_coordinates(
+            self._positions.values()
+        ).values
+        timestamp: float = self._timestamp
+        ids: List[int] = list(self._positions)
+        self._timestamp = None
+        self._positions = {}
+        self._on_frame(timestamp, ids, positions)
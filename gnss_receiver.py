@@ -1,6 +1,10 @@
-from datatypes import GnssCallback
-import math_operations as mo
+from datatypes import Coordinate, FrameDataCallback, GnssCallback
+from gnss_recorder import GnssRecorder
+from metrics import metrics
+from noise import NoiseGenerator
+from typing import Union
 import carla
+import time
 
 
 class GnssReceiver:
@@ -10,8 +14,9 @@ class GnssReceiver:
         actor (carla.Actor): Actor to which the GNSS sensor should be attached to
         world (carla.World): CARLA World, into which the actor is located and the GNSS sensor should be spawned into
         on_data (Callback): Callback function to which the collected GNSS data is forwarded to
-        error_range (float): Error range in which the collected GNSS data should be distored
+        noise (NoiseGenerator): Generator of the offsets the collected GNSS data is distorted with
         tick (float): Seconds between each position detection
+        recorder (GnssRecorder, optional): Recorder the raw measurements and applied distortion are recorded with
     """
 
     def __init__(
@@ -19,12 +24,18 @@ class GnssReceiver:
         actor: carla.Actor,
         world: carla.World,
         on_data: GnssCallback,
-        error_range: float,
+        noise: NoiseGenerator,
         tick: float,
+        recorder: Union[GnssRecorder, None] = None,
     ) -> None:
         self._actor: carla.Actor = actor
         self._on_data: GnssCallback = on_data
-        self._error_range: float = error_range
+        # callback functions that group the position data by simulator frame (e.g. FrameAligner) get the frame id
+        self._on_frame_data: Union[FrameDataCallback, None] = getattr(
+            on_data, "on_frame_data", None
+        )
+        self._noise: NoiseGenerator = noise
+        self._recorder: Union[GnssRecorder, None] = recorder
         bp = world.get_blueprint_library().find("sensor.other.gnss")
         bp.set_attribute("sensor_tick", str(tick))
         self._sensor: carla.GnssSensor = world.spawn_actor(
@@ -44,10 +55,28 @@ class GnssReceiver:
         Args:
             event (carla.GnssMeasurement): Detected position data wrapped in longitude, latitude and altitude
         """
-        self._on_data(
-            self._actor.id,
-            event.timestamp,
-            mo.distorted_coordinate(
-                event.longitude, event.latitude, event.altitude, self._error_range
-            ),
+        timed: bool = metrics.enabled
+        start: int = time.perf_counter_ns() if timed else 0
+        position: Coordinate = self._noise.distort(
+            event.longitude, event.latitude, event.altitude
         )
+        if timed:
+            start = metrics.lap("distort", start)
+        if self._recorder != None:
+            self._recorder.record(
+                self._actor.id,
+                event.timestamp,
+                event.longitude,
+                event.latitude,
+                event.altitude,
+                position,
+            )
+            if timed:
+                start = metrics.lap("gnss_record", start)
+        if self._on_frame_data != None:
+            self._on_frame_data(self._actor.id, event.frame, event.timestamp, position)
+        else:
+            self._on_data(self._actor.id, event.timestamp, position)
+        if timed:
+            metrics.count("gnss_events")
+            metrics.lap("forward", start)
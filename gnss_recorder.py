@@ -0,0 +1,73 @@
+from common import GNSS_RECORD_DTYPE
+from datatypes import Coordinate
+from npy_writer import NpyWriter
+from typing import List, Tuple
+
+import threading
+import numpy as np
+
+
+class GnssRecorder:
+    """Class that records raw GNSS measurements and the distorted positions into a compact binary .npy file
+
+    Note:
+        The file holds the columns of common.GNSS_RECORD_DTYPE and can be replayed with GnssReplay.
+        The distorted position is stored as it was forwarded, so a replay reproduces it bit for bit
+
+    Args:
+        path (str): Path of the file to be written
+        chunk_size (int, optional): Amount of measurements that are buffered before they are written
+    """
+
+    def __init__(self, path: str, chunk_size: int = 4096) -> None:
+        self._writer: NpyWriter = NpyWriter(path, GNSS_RECORD_DTYPE, chunk_size)
+        self._chunk_size: int = chunk_size
+        self._rows: List[Tuple[float, ...]] = []
+        self._lock: threading.Lock = threading.Lock()
+
+    def record(
+        self,
+        id: int,
+        timestamp: float,
+        longitude: float,
+        latitude: float,
+        altitude: float,
+        position: Coordinate,
+    ) -> None:
+        """Records a raw measurement together with the distorted position that was forwarded
+
+        Args:
+            id (int): Id of the actor within the Carla world
+            timestamp (float): Timestamp on when the position was retrieved
+            longitude (float): Measured longitude
+            latitude (float): Measured latitude
+            altitude (float): Measured altitude
+            position (Coordinate): Distorted position that was forwarded
+        """
+        with self._lock:
+            self._rows.append(
+                (
+                    id,
+                    timestamp,
+                    longitude,
+                    latitude,
+                    altitude,
+                    position.x,
+                    position.y,
+                    position.z,
+                )
+            )
+            if len(self._rows) >= self._chunk_size:
+                self._write()
+
+    def close(self) -> None:
+        """Writes all buffered measurements and closes the file"""
+        with self._lock:
+            self._write()
+            self._writer.close()
+
+    def _write(self) -> None:
+        """Hands the buffered measurements to the writer without acquiring the lock"""
+        if self._rows:
+            self._writer.append(np.array(self._rows, dtype=GNSS_RECORD_DTYPE))
+            self._rows = []
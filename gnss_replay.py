@@ -0,0 +1,86 @@
+from datatypes import Coordinate, GnssCallback
+from typing import List
+
+import time
+import numpy as np
+
+
+class GnssReplay:
+    """Class that replays GNSS measurements recorded by a GnssRecorder without a running Carla world
+
+    Note:
+        To replay into the calculations, create a Hero with an Actor for every id of actor_ids and hand its
+        on_position_data (or a FrameBatcher on its on_position_frame) to run.
+        Recordings of earlier versions, which hold the distortion instead of the distorted position, are replayed with the
+        distortion added to the raw measurement
+
+    Args:
+        path (str): Path of the recorded file
+    """
+
+    def __init__(self, path: str) -> None:
+        self._measurements: np.ndarray = np.load(path, mmap_mode="r")
+
+    def __len__(self) -> int:
+        return len(self._measurements)
+
+    def actor_ids(self) -> List[int]:
+        """Returns the ids of all recorded actors
+
+        Returns:
+            List[int]: Ids of the actors within the recorded Carla world
+        """
+        return np.unique(self._measurements["id"]).tolist()
+
+    def run(
+        self, on_data: GnssCallback, speed: float = 0, distorted: bool = True
+    ) -> float:
+        """Forwards all recorded measurements in the recorded order
+
+        Args:
+            on_data (GnssCallback): Callback function to which the measurements are forwarded to
+            speed (float, optional): Factor of the recorded pace to replay with, 0 replays as fast as possible
+            distorted (bool, optional): Forward the recorded distorted positions instead of the raw measurements
+
+        Returns:
+            float: Seconds it took to replay all measurements
+        """
+        measurements: np.ndarray = np.asarray(self._measurements)
+        ids: List[int] = measurements["id"].tolist()
+        timestamps: List[float] = measurements["timestamp"].tolist()
+        positions: np.ndarray = np.stack(
+            (
+                measurements["longitude"],
+                measurements["latitude"],
+                measurements["altitude"],
+            ),
+            axis=1,
+        )
+        if distorted and "distorted_longitude" in measurements.dtype.names:
+            positions = np.stack(
+                (
+                    measurements["distorted_longitude"],
+                    measurements["distorted_latitude"],
+                    measurements["distorted_altitude"],
+                ),
+                axis=1,
+            )
+        elif distorted:
+            positions = positions + np.stack(
+                (
+                    measurements["distortion_x"],
+                    measurements["distortion_y"],
+                    measurements["distortion_z"],
+                ),
+                axis=1,
+            )
+        start: float = time.perf_counter()
+        for id, timestamp, position in zip(ids, timestamps, positions.tolist()):
+            if speed > 0:
+                delay: float = (timestamp - timestamps[0]) / speed - (
+                    time.perf_counter() - start
+                )
+                if delay > 0:
+                    time.sleep(delay)
+            on_data(id, timestamp, Coordinate(*position))
+        return time.perf_counter() - start
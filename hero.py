@@ -1,35 +1,163 @@
 from recent_data import RecentData
-from scipy import interpolate
-from datatypes import Coordinate, Subscription
+from kinematics import Kinematics
+from spatial_index import SpatialIndex
+from interpolation import Interpolation
+from datatypes import Coordinate, PositionBuffer
+from dispatcher import Dispatcher
+from record_log import Record, RecordLog
+from shard_pool import ShardPool, ShardResult
+from state_table import StateTable
 from typing import Dict, List, Union, Tuple
 from actor import Actor
 from math_operations import MathOperations as mo
+from common import HERO_POSE_CACHE_SIZE, CULL_MARGIN, MIN_CELL_SIZE
+from metrics import metrics
 
-import json
-import logging
+import math
+import threading
+import time
+import numpy as np
 
 
 class Hero:
     """Class that represents the hero ("the vehicle on which the software is running") and does all the calculations with the position data received
 
+    Note:
+        Further heroes can be added with add_hero. The data of every actor that does not depend on a hero is calculated
+        once for all heroes, distances and angles to the heroes are calculated as one heroes x actors matrix per frame.
+        Only the data relative to the first hero is stored into the actors and the record log
+
     Args:
         hero_id (int): Id of the hero in the connected Carla world
         actors (Dict[int, Actor]): Dictionary with all actors in the connected Carla world with the id as the key
-        subscribers (List[Subscription]): List
+        dispatcher (Dispatcher): Dispatcher that forwards the calculated data to all subscribers
+        relevance_radius (float): Radius of distance that filters out actors that are out of range from the hero
     """
 
     def __init__(
         self,
         hero_id: int,
         actors: Dict[int, Actor],
-        subscribers: List[Subscription],
+        dispatcher: Dispatcher,
         relevance_radius: float,
     ) -> None:
+        Hero._check_radius(relevance_radius)
         self._hero_id: int = hero_id
         self._actors: Dict[int, Actor] = actors
-        self._subscribers: List[Subscription] = subscribers
+        self._dispatcher: Dispatcher = dispatcher
         self._recent_data: Dict[int, RecentData] = {}
         self._relevance_radius: float = relevance_radius
+        self._heroes: Dict[int, Tuple[float, Dispatcher]] = {
+            hero_id: (relevance_radius, dispatcher)
+        }
+        self._hero_poses: Dict[
+            int,
+            Dict[
+                float,
+                Union[
+                    Tuple[None, None],
+                    Tuple[Coordinate, None],
+                    Tuple[Coordinate, Coordinate],
+                ],
+            ],
+        ] = {hero_id: {}}
+        self._kinematics: Kinematics = Kinematics(3)
+        # a radius of 0 is valid (only the hero is published), but cannot span the grid
+        self._spatial_index: SpatialIndex = SpatialIndex(
+            max(relevance_radius, MIN_CELL_SIZE)
+        )
+        self._lock: threading.RLock = threading.RLock()
+        self._record_log: Union[RecordLog, None] = None
+        self._shard_pool: Union[ShardPool, None] = None
+        self._state_table: Union[StateTable, None] = None
+
+    @property
+    def record_log(self) -> Union[RecordLog, None]:
+        """
+        Returns:
+            RecordLog | None: Record log every accepted record is appended to
+        """
+        return self._record_log
+
+    @record_log.setter
+    def record_log(self, record_log: Union[RecordLog, None]) -> None:
+        """
+        Args:
+            record_log (RecordLog | None): Record log every accepted record should be appended to, None to stop logging
+        """
+        self._record_log = record_log
+
+    @property
+    def state_table(self) -> Union[StateTable, None]:
+        """
+        Returns:
+            StateTable | None: Shared memory table the latest accepted record of every actor is kept in
+        """
+        return self._state_table
+
+    @state_table.setter
+    def state_table(self, state_table: Union[StateTable, None]) -> None:
+        """
+        Args:
+            state_table (StateTable | None): Shared memory table the latest accepted record of every actor should be kept in, None to stop
+        """
+        with self._lock:
+            self._state_table = state_table
+
+    @property
+    def shard_pool(self) -> Union[ShardPool, None]:
+        """
+        Returns:
+            ShardPool | None: Process pool the frames are calculated in
+        """
+        return self._shard_pool
+
+    @shard_pool.setter
+    def shard_pool(self, shard_pool: Union[ShardPool, None]) -> None:
+        """
+        Note:
+            The kinematics of the actors are kept by the pool, so it should be set before the first frame
+
+        Args:
+            shard_pool (ShardPool | None): Process pool the frames should be calculated in, None to calculate them in this process
+        """
+        with self._lock:
+            self._shard_pool = shard_pool
+
+    @property
+    def heroes(self) -> List[int]:
+        """
+        Returns:
+            List[int]: Ids of all heroes, starting with the first hero
+        """
+        return list(self._heroes)
+
+    def add_hero(
+        self, hero_id: int, relevance_radius: float, dispatcher: Dispatcher
+    ) -> None:
+        """Adds a further hero the data of all actors is calculated relative to
+
+        Args:
+            hero_id (int): Id of the hero in the connected Carla world
+            relevance_radius (float): Radius of distance that filters out actors that are out of range from this hero
+            dispatcher (Dispatcher): Dispatcher that forwards the data calculated relative to this hero
+        """
+        Hero._check_radius(relevance_radius)
+        with self._lock:
+            self._heroes[hero_id] = (relevance_radius, dispatcher)
+            self._hero_poses[hero_id] = {}
+
+    def remove_hero(self, hero_id: int) -> None:
+        """Removes a hero that was added with add_hero, the actor itself stays tracked
+
+        Args:
+            hero_id (int): Id of the hero in the connected Carla world
+        """
+        with self._lock:
+            if hero_id == self._hero_id:
+                return
+            self._heroes.pop(hero_id, None)
+            self._hero_poses.pop(hero_id, None)
 
     def on_position_data(self, id: int, timestamp: float, position: Coordinate) -> None:
         """Callback function that will be called when position data was retrieved
@@ -39,21 +167,406 @@ class Hero:
             timestamp (float): Timestamp on when the position was retrieved
             position (Coordinate): Position at the given timestamp
         """
-        if id not in self._recent_data:
-            self._recent_data[id] = RecentData(3)
-        velocity, orientation, angular_speed, accelaration = self._recent_data[
-            id
-        ].update(timestamp, position)
-        if id != self._hero_id:
-            distance_to_hero, angle_to_hero = self._hero_dependent_data(id, timestamp)
-        else:
-            distance_to_hero, angle_to_hero = 0, 0
-        if (
-            distance_to_hero != None
-            and distance_to_hero <= self._relevance_radius
-            and id in self._actors
+        with self._lock:
+            timed: bool = metrics.enabled
+            start: int = time.perf_counter_ns() if timed else 0
+            if id not in self._actors:
+                return
+            if timed:
+                metrics.count("position_data")
+            self._spatial_index.update(id, position)
+            if id not in self._heroes and self._is_culled(id, timestamp):
+                if timed:
+                    metrics.count("culled")
+                    metrics.lap("cull", start)
+                return
+            if timed:
+                start = metrics.lap("cull", start)
+            if id not in self._recent_data:
+                self._recent_data[id] = RecentData(3)
+            velocity, orientation, angular_speed, accelaration = self._recent_data[
+                id
+            ].update(timestamp, position)
+            if timed:
+                start = metrics.lap("recent_data", start)
+            if id in self._heroes:
+                self._hero_poses[id].clear()
+            position_other: Union[Coordinate, None] = None
+            predicted: bool = False
+            for hero_id, (relevance_radius, _) in self._heroes.items():
+                if id != hero_id:
+                    if not predicted:
+                        position_other = self._predict_position(id, timestamp)
+                        predicted = True
+                        if timed:
+                            start = metrics.lap("interpolation", start)
+                    distance_to_hero, angle_to_hero = self._hero_dependent_data(
+                        hero_id, position_other, timestamp
+                    )
+                    if timed:
+                        start = metrics.lap("hero_dependent_data", start)
+                else:
+                    distance_to_hero, angle_to_hero = 0, 0
+                if distance_to_hero == None:
+                    if timed:
+                        metrics.count("insufficient_data")
+                elif distance_to_hero > relevance_radius:
+                    if timed:
+                        metrics.count("radius_filtered")
+                else:
+                    self._publish(
+                        hero_id,
+                        id,
+                        timestamp,
+                        velocity,
+                        orientation,
+                        angular_speed,
+                        accelaration,
+                        distance_to_hero,
+                        angle_to_hero,
+                    )
+                    if timed:
+                        start = time.perf_counter_ns()
+
+    def on_position_frame(
+        self, timestamp: float, ids: List[int], positions: np.ndarray
+    ) -> None:
+        """Callback function that will be called when the positions of several actors at the same timestamp were retrieved
+
+        Note:
+            All data of the frame is calculated in one vectorized pass, the actors' own positions are used as they are
+            and only the pose of the hero is predicted
+
+        Args:
+            timestamp (float): Timestamp on when the positions were retrieved
+            ids (List[int]): Ids of the actors within the Carla world
+            positions (np.ndarray): Positions of the actors at the given timestamp (shape (n, 3))
+        """
+        with self._lock:
+            self._calculate_frame(timestamp, ids, positions, False)
+
+    def on_aligned_frame(
+        self, timestamp: float, ids: List[int], positions: np.ndarray
+    ) -> None:
+        """Callback function that will be called when the positions of several actors measured in the same simulator frame were retrieved
+
+        Note:
+            Like on_position_frame, but the pose of the hero is taken from its exact samples instead of being predicted,
+            the current one from the frame and the previous one from the frame 0.5s before.
+            If the hero is missing in the frame, its pose is predicted
+
+        Args:
+            timestamp (float): Timestamp of the simulator frame
+            ids (List[int]): Ids of the actors within the Carla world
+            positions (np.ndarray): Positions of the actors in the simulator frame (shape (n, 3))
+        """
+        with self._lock:
+            self._calculate_frame(timestamp, ids, positions, True)
+
+    def register(self, actor: Actor) -> None:
+        """Adds an actor whose position data should be calculated from now on
+
+        Args:
+            actor (Actor): Actor that appeared in the Carla world
+        """
+        with self._lock:
+            self._actors[actor.id] = actor
+
+    def forget(self, id: int) -> None:
+        """Removes an actor and drops all data stored for it, position data of it that still comes in is ignored
+
+        Args:
+            id (int): Id of the actor that disappeared from the Carla world
+        """
+        with self._lock:
+            self._actors.pop(id, None)
+            self._recent_data.pop(id, None)
+            self._kinematics.remove(id)
+            if self._shard_pool != None:
+                self._shard_pool.remove(id)
+            if self._state_table != None:
+                self._state_table.remove(id)
+            self._spatial_index.remove(id)
+            if id == self._hero_id:
+                self._hero_poses[id].clear()
+            else:
+                self._heroes.pop(id, None)
+                self._hero_poses.pop(id, None)
+
+    def actors_in_radius(
+        self, radius: Union[float, None] = None, hero_id: Union[int, None] = None
+    ) -> List[int]:
+        """Returns all actors whose latest position is within the radius around the latest position of a hero
+
+        Args:
+            radius (float, optional): Radius around the hero, defaults to the relevance radius of the hero
+            hero_id (int, optional): Id of the hero, defaults to the first hero
+
+        Returns:
+            List[int]: Ids of the actors within the radius (including the hero)
+        """
+        with self._lock:
+            hero_id = self._hero_id if hero_id == None else hero_id
+            if hero_id not in self._heroes:
+                return []
+            position_hero: Union[Tuple[float, float, float], None] = (
+                self._spatial_index.position(hero_id)
+            )
+            if position_hero == None:
+                return []
+            return self._spatial_index.query(
+                position_hero, self._heroes[hero_id][0] if radius == None else radius
+            )
+
+    def _calculate_frame(
+        self, timestamp: float, ids: List[int], positions: np.ndarray, aligned: bool
+    ) -> None:
+        """Calculates and publishes the data of all actors of a frame in one vectorized pass without acquiring the lock
+
+        Args:
+            timestamp (float): Timestamp on when the positions were retrieved
+            ids (List[int]): Ids of the actors within the Carla world
+            positions (np.ndarray): Positions of the actors at the given timestamp (shape (n, 3))
+            aligned (bool): All positions were measured at the same instant, so the hero pose is not predicted
+        """
+        timed: bool = metrics.enabled
+        start: int = time.perf_counter_ns() if timed else 0
+        known: List[bool] = [id in self._actors for id in ids]
+        if not all(known):
+            ids = [id for id, is_known in zip(ids, known) if is_known]
+            positions = positions[known]
+        self._spatial_index.update_many(ids, positions)
+        id_array: np.ndarray = np.array(ids, dtype=np.int64)
+        hero_ids: List[int] = list(self._heroes)
+        hero_now: np.ndarray = np.full((len(hero_ids), 3), np.nan)
+        hero_before: np.ndarray = np.full((len(hero_ids), 3), np.nan)
+        for index, hero_id in enumerate(hero_ids):
+            rows: np.ndarray = np.flatnonzero(id_array == hero_id)
+            if len(rows) > 0:
+                if hero_id not in self._recent_data:
+                    self._recent_data[hero_id] = RecentData(3)
+                self._recent_data[hero_id].stored.append(
+                    timestamp, Coordinate(*positions[rows[0]].tolist())
+                )
+                self._hero_poses[hero_id].clear()
+            position_hero_now, position_hero_before = (
+                self._hero_sample(hero_id, timestamp)
+                if aligned and len(rows) > 0
+                else self._hero_pose(hero_id, timestamp)
+            )
+            if position_hero_now != None:
+                hero_now[index] = position_hero_now
+            if position_hero_before != None:
+                hero_before[index] = position_hero_before
+
+        if self._shard_pool != None:
+            self._publish_shards(
+                timestamp, id_array, positions, hero_ids, hero_now, hero_before
+            )
+            if timed:
+                metrics.count("frames")
+                metrics.count("frame_actors", len(ids))
+            return
+
+        # heroes x actors matrices, the rows of a hero without a pose stay NaN
+        velocity, orientation, angular_speed, accelaration = self._kinematics.update(
+            timestamp, ids, positions
+        )
+        distances, angles = mo.hero_relations(hero_now, hero_before, positions)
+        if timed:
+            metrics.lap("frame_calculation", start)
+
+        data: List[List[Union[float, None]]] = [
+            [None if value != value else value for value in column.tolist()]
+            for column in (velocity, orientation, angular_speed, accelaration)
+        ]
+        for index, hero_id in enumerate(hero_ids):
+            distance_to_hero: np.ndarray = distances[index]
+            angle_to_hero: np.ndarray = angles[index]
+            is_hero: np.ndarray = id_array == hero_id
+            distance_to_hero[is_hero] = 0
+            angle_to_hero[is_hero] = 0
+            relevant: List[int] = np.flatnonzero(
+                distance_to_hero <= self._heroes[hero_id][0]
+            ).tolist()
+            if timed:
+                insufficient: int = int(np.isnan(distance_to_hero).sum())
+                metrics.count("insufficient_data", insufficient)
+                metrics.count(
+                    "radius_filtered", len(ids) - len(relevant) - insufficient
+                )
+            distance_values: List[float] = distance_to_hero.tolist()
+            angle_values: List[float] = angle_to_hero.tolist()
+            for row in relevant:
+                angle: float = angle_values[row]
+                self._publish(
+                    hero_id,
+                    ids[row],
+                    timestamp,
+                    data[0][row],
+                    data[1][row],
+                    data[2][row],
+                    data[3][row],
+                    distance_values[row],
+                    None if angle != angle else angle,
+                )
+        if timed:
+            metrics.count("frames")
+            metrics.count("frame_actors", len(ids))
+
+    def _publish_shards(
+        self,
+        timestamp: float,
+        ids: np.ndarray,
+        positions: np.ndarray,
+        hero_ids: List[int],
+        hero_now: np.ndarray,
+        hero_before: np.ndarray,
+    ) -> None:
+        """Calculates a frame in the process pool and publishes the data it encoded without acquiring the lock
+
+        Args:
+            timestamp (float): Timestamp on when the positions were retrieved
+            ids (np.ndarray): Ids of the known actors of the frame (shape (n,))
+            positions (np.ndarray): Positions of the actors at the given timestamp (shape (n, 3))
+            hero_ids (List[int]): Ids of the heroes
+            hero_now (np.ndarray): Current positions of the heroes, NaN if unknown (shape (k, 3))
+            hero_before (np.ndarray): Previous positions of the heroes, NaN if unknown (shape (k, 3))
+        """
+        timed: bool = metrics.enabled
+        start: int = time.perf_counter_ns() if timed else 0
+        results: List[ShardResult] = self._shard_pool.calculate(
+            timestamp,
+            ids,
+            positions,
+            hero_ids,
+            hero_now,
+            hero_before,
+            [self._heroes[hero_id][0] for hero_id in hero_ids],
+            hero_ids.index(self._hero_id),
+            self._record_log != None or self._state_table != None,
+        )
+        if timed:
+            metrics.lap("frame_calculation", start)
+        for hero_id, (relevant, json_data, values, entries, insufficient) in zip(
+            hero_ids, results
         ):
+            if timed:
+                metrics.count("insufficient_data", insufficient)
+                metrics.count(
+                    "radius_filtered", len(ids) - len(relevant) - insufficient
+                )
+            if entries == None:
+                dispatcher: Dispatcher = self._heroes[hero_id][1]
+                for data in json_data:
+                    dispatcher.publish_encoded(data)
+                if timed:
+                    metrics.count("published", len(json_data))
+                continue
+            # without record outputs the values are not needed, the data is already encoded and rounded
+            if values == None:
+                values = [[None] * 6] * len(relevant)
+            for id, data, row, entry in zip(relevant, json_data, values, entries):
+                self._publish(hero_id, id, timestamp, *row, json_data=data, entry=entry)
+
+    @staticmethod
+    def _check_radius(relevance_radius: float) -> None:
+        """Rejects relevance radii that cannot filter anything
+
+        Args:
+            relevance_radius (float): Radius of distance that filters out actors that are out of range from a hero
+        """
+        if not relevance_radius >= 0:
+            raise ValueError(
+                f"Relevance radius must not be negative, got {relevance_radius}"
+            )
+
+    def _is_culled(self, id: int, timestamp: float) -> bool:
+        """Checks cheaply if an actor is certainly out of the relevance radius of every hero, before anything is calculated for it
+
+        Note:
+            Culled actors are skipped entirely, so their velocity is calculated over the whole gap once they are back in range
+
+        Args:
+            id (int): Id of the actor within the Carla world
+            timestamp (float): Timestamp on when the position of the actor was retrieved
+
+        Returns:
+            bool: True if the actor is out of the relevance radius of every hero, False otherwise
+        """
+        for hero_id, (relevance_radius, _) in self._heroes.items():
+            if hero_id not in self._recent_data:
+                return False
+            stored_data: PositionBuffer = self._recent_data[hero_id].stored
+            if len(stored_data) <= 1:
+                return False
+            timestamps: List[float] = stored_data.timestamps[-2:].tolist()
+            positions: List[List[float]] = stored_data.positions[-2:].tolist()
+            delta_t: float = timestamps[1] - timestamps[0]
+            speed: float = math.dist(positions[1], positions[0]) / delta_t
+            margin: float = CULL_MARGIN + speed * abs(timestamp - timestamps[1])
+            if self._spatial_index.within(
+                id, tuple(positions[1]), relevance_radius + margin
+            ):
+                return False
+        return True
+
+    def _publish(
+        self,
+        hero_id: int,
+        id: int,
+        timestamp: float,
+        velocity: Union[float, None],
+        orientation: Union[float, None],
+        angular_speed: Union[float, None],
+        accelaration: Union[float, None],
+        distance_to_hero: float,
+        angle_to_hero: Union[float, None],
+        json_data: Union[str, None] = None,
+        entry: Union[List[float], None] = None,
+    ) -> None:
+        """Forwards the calculated data of an actor to all subscribers of a hero, the data relative to the first hero is also stored
+        (in the actor, the record log and the state table)
+
+        Args:
+            hero_id (int): Id of the hero the data was calculated relative to
+            id (int): Id of the actor within the Carla world
+            timestamp (float): Timestamp the data was calculated for
+            velocity (float | None): Current velocity
+            orientation (float | None): Current orientation
+            angular_speed (float | None): Current angular speed
+            accelaration (float | None): Current accelaration
+            distance_to_hero (float): Current distance to hero
+            angle_to_hero (float | None): Current angle to hero
+            json_data (str, optional): The data already encoded by the process pool
+            entry (List[float], optional): The data already rounded for the actor by the process pool
+        """
+        timed: bool = metrics.enabled
+        start: int = time.perf_counter_ns() if timed else 0
+        if json_data != None:
+            self._heroes[hero_id][1].publish_encoded(json_data)
+        else:
+            self._heroes[hero_id][1].publish(
+                [
+                    id,
+                    velocity,
+                    orientation,
+                    angular_speed,
+                    accelaration,
+                    distance_to_hero,
+                    angle_to_hero,
+                ]
+            )
+        if timed:
+            metrics.count("published")
+            start = metrics.lap("dispatch", start)
+        if hero_id != self._hero_id:
+            return
+        if entry != None:
+            self._actors[id].add_entry(timestamp, entry)
+        else:
             self._actors[id].add_data(
+                timestamp,
                 velocity,
                 orientation,
                 angular_speed,
@@ -61,41 +574,46 @@ class Hero:
                 distance_to_hero,
                 angle_to_hero,
             )
-            try:
-                for subscriber in self._subscribers:
-                    subscriber(
-                        json.dumps(
-                            [
-                                id,
-                                velocity,
-                                orientation,
-                                angular_speed,
-                                accelaration,
-                                distance_to_hero,
-                                angle_to_hero,
-                            ]
-                        )
-                    )
-            except Exception as err:
-                logging.error(f"An error occurred when notifying a subscriber: {err}")
+        if timed:
+            start = metrics.lap("actor_store", start)
+        if self._record_log == None and self._state_table == None:
+            return
+        record: Record = (
+            id,
+            self._actors[id].type,
+            timestamp,
+            velocity,
+            orientation,
+            angular_speed,
+            accelaration,
+            distance_to_hero,
+            angle_to_hero,
+        )
+        if self._record_log != None:
+            self._record_log.put(record)
+        if self._state_table != None:
+            self._state_table.put(record)
+        if timed:
+            metrics.lap("record_output", start)
 
     def _hero_dependent_data(
-        self, id: int, timestamp: float
+        self,
+        hero_id: int,
+        position_other: Union[Coordinate, None],
+        timestamp: float,
     ) -> Union[Tuple[None, None], Tuple[float, None], Tuple[float, float]]:
         """Method that calculates and returns hero dependent data (distance to hero and angle to hero)
 
         Args:
-            id (int): Id of the actor within the Carla world
+            hero_id (int): Id of the hero the data should be calculated relative to
+            position_other (Coordinate | None): Predicted position of the actor at the timestamp
             timestamp (float): Timestamp for which the data should be calculated for
 
         Returns:
             Tuple[None, None]: Insufficient data
             Tuple[float, float]: Distance to hero and angle to hero
         """
-        position_other: Union[Coordinate, None] = self._predict_position(id, timestamp)
-        position_hero_now, position_hero_before = self._predict_positions(
-            self._hero_id, timestamp - 0.5, timestamp
-        )
+        position_hero_now, position_hero_before = self._hero_pose(hero_id, timestamp)
         if (
             position_hero_before == None and position_hero_now == None
         ) or position_other == None:
@@ -109,6 +627,67 @@ class Hero:
             ),
         )
 
+    def _hero_pose(
+        self, hero_id: int, timestamp: float
+    ) -> Union[
+        Tuple[None, None], Tuple[Coordinate, None], Tuple[Coordinate, Coordinate]
+    ]:
+        """Method that returns the current and previous position of the hero for a given timestamp
+
+        Note:
+            Poses are cached per timestamp so all actors of the same tick share one prediction,
+            the cache is cleared whenever new hero data comes in
+
+        Args:
+            hero_id (int): Id of the hero
+            timestamp (float): Timestamp for which the hero pose should be returned
+
+        Returns:
+            Tuple[None, None]: Insufficient data
+            Tuple[Coordinate, Coordinate]: Predicted positions of the hero now and 0.5s before
+        """
+        hero_poses = self._hero_poses[hero_id]
+        if timestamp not in hero_poses:
+            if len(hero_poses) >= HERO_POSE_CACHE_SIZE:
+                del hero_poses[next(iter(hero_poses))]
+            hero_poses[timestamp] = self._predict_positions(
+                hero_id, timestamp - 0.5, timestamp
+            )
+        return hero_poses[timestamp]
+
+    def _hero_sample(
+        self, hero_id: int, timestamp: float
+    ) -> Union[
+        Tuple[None, None], Tuple[Coordinate, None], Tuple[Coordinate, Coordinate]
+    ]:
+        """Method that returns the stored samples of the hero at a given timestamp and 0.5s before
+
+        Args:
+            hero_id (int): Id of the hero
+            timestamp (float): Timestamp of the latest stored sample of the hero
+
+        Returns:
+            Tuple[Coordinate, None]: Sample of the hero now, there is no different sample 0.5s before
+            Tuple[Coordinate, Coordinate]: Samples of the hero now and of the latest frame at least 0.5s before
+        """
+        stored_data: PositionBuffer = self._recent_data[hero_id].stored
+        timestamps: np.ndarray = stored_data.timestamps
+        positions: np.ndarray = stored_data.positions
+        position_now: List[float] = positions[-1].tolist()
+        # tolerance, so the frame exactly 0.5s before is found despite floating point errors of the timestamps
+        index: int = (
+            int(np.searchsorted(timestamps, timestamp - 0.5 + 1e-9, side="right")) - 1
+        )
+        if index < 0:
+            return Coordinate(*position_now), None
+        position_before: List[float] = positions[index].tolist()
+        if (
+            position_now[0] == position_before[0]
+            and position_now[1] == position_before[1]
+        ):
+            return Coordinate(*position_now), None
+        return Coordinate(*position_now), Coordinate(*position_before)
+
     def _predict_position(self, id: int, timestamp: float) -> Union[Coordinate, None]:
         """Method to predict a position at a given timestamp via inter-/extrapolation
 
@@ -120,36 +699,10 @@ class Hero:
             None: Insufficient data
             Coordinate: Predicted position at the provided timestamp
         """
-        if id not in self._recent_data:
+        predicted: Union[np.ndarray, None] = self._predict(id, [timestamp])
+        if predicted is None:
             return None
-        stored_data: Dict[float, Coordinate] = self._recent_data[id].stored
-        timestamps: List[float] = sorted(stored_data, reverse=True)
-        if len(timestamps) <= 1:
-            return None
-        x = []
-        y = []
-        z = []
-        for ts in timestamps:
-            data = stored_data[ts]
-            x.append(data.x)
-            y.append(data.y)
-            z.append(data.z)
-        polation: str = (
-            "extrapolate"
-            if timestamp < timestamps[0] or timestamp > timestamps[-1]
-            else "interpolate"
-        )
-        polate_x: interpolate.interp1d = interpolate.interp1d(
-            timestamps, x, fill_value=polation
-        )
-        polate_y: interpolate.interp1d = interpolate.interp1d(
-            timestamps, y, fill_value=polation
-        )
-        polate_z: interpolate.interp1d = interpolate.interp1d(
-            timestamps, z, fill_value=polation
-        )
-
-        return Coordinate(polate_x(timestamp), polate_y(timestamp), polate_z(timestamp))
+        return Coordinate(*predicted[0].tolist())
 
     def _predict_positions(
         self, id: float, timestamp_before: float, timestamp_now: float
@@ -167,78 +720,38 @@ class Hero:
             Tuple[None, None]: Insufficient data
             Tuple[Coordinate, Coordinate]: Predicted positions at the provided timestamps
         """
-        stored_data: Dict[float, Coordinate] = self._recent_data[id].stored
-        timestamps: List[float] = sorted(stored_data, reverse=True)
-        if len(timestamps) <= 1:
-            return None, None
-        x = []
-        y = []
-        z = []
-        for ts in timestamps:
-            data: Coordinate = stored_data[ts]
-            x.append(data.x)
-            y.append(data.y)
-            z.append(data.z)
-
-        polation_before: str = (
-            "extrapolate"
-            if timestamp_before < timestamps[0] or timestamp_before > timestamps[-1]
-            else "interpolate"
-        )
-        polate_x_before: interpolate.interp1d = interpolate.interp1d(
-            timestamps, x, fill_value=polation_before
-        )
-        polate_y_before: interpolate.interp1d = interpolate.interp1d(
-            timestamps, y, fill_value=polation_before
-        )
-        polate_z_before: interpolate.interp1d = interpolate.interp1d(
-            timestamps, z, fill_value=polation_before
+        predicted: Union[np.ndarray, None] = self._predict(
+            id, [timestamp_now, timestamp_before]
         )
+        if predicted is None:
+            return None, None
+        position_now: List[float] = predicted[0].tolist()
+        position_before: List[float] = predicted[1].tolist()
+        if (
+            position_now[0] == position_before[0]
+            and position_now[1] == position_before[1]
+        ):
+            return Coordinate(*position_now), None
+        return Coordinate(*position_now), Coordinate(*position_before)
 
-        polation_now: str = (
-            "extrapolate"
-            if timestamp_now < timestamps[0] or timestamp_now > timestamps[-1]
-            else "interpolate"
-        )
-        polate_x_now: interpolate.interp1d = interpolate.interp1d(
-            timestamps, x, fill_value=polation_now
-        )
-        polate_y_now: interpolate.interp1d = interpolate.interp1d(
-            timestamps, y, fill_value=polation_now
-        )
-        polate_z_now: interpolate.interp1d = interpolate.interp1d(
-            timestamps, z, fill_value=polation_now
-        )
+    def _predict(self, id: int, timestamps: List[float]) -> Union[np.ndarray, None]:
+        """Method to predict the positions of an actor at several timestamps in one pass
 
-        position_x_now: float = polate_x_now(timestamp_now)
-        position_y_now: float = polate_y_now(timestamp_now)
-        position_z_now: float = polate_z_now(timestamp_now)
-
-        position_x_before: interpolate.interp1d = polate_x_before(timestamp_before)
-        position_y_before: interpolate.interp1d = polate_y_before(timestamp_before)
-        position_z_before: interpolate.interp1d = polate_z_before(timestamp_before)
-
-        if position_x_now == position_x_before and position_y_now == position_y_before:
-            return (
-                Coordinate(
-                    position_x_now,
-                    position_y_now,
-                    position_z_now,
-                ),
-                None,
-            )
+        Args:
+            id (int): Id of the actor within the Carla world
+            timestamps (List[float]): Timestamps for which the positions should be predicted for
 
-        return (
-            Coordinate(
-                position_x_now,
-                position_y_now,
-                position_z_now,
-            ),
-            Coordinate(
-                position_x_before,
-                position_y_before,
-                position_z_before,
-            ),
+        Returns:
+            None: Insufficient data
+            np.ndarray: Predicted positions (shape (len(timestamps), 3))
+        """
+        if id not in self._recent_data:
+            return None
+        stored_data: PositionBuffer = self._recent_data[id].stored
+        if len(stored_data) <= 1:
+            return None
+        return Interpolation.positions(
+            stored_data.timestamps, stored_data.positions, timestamps
         )
 
     def _get_distance_to_hero(
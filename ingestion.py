@@ -0,0 +1,145 @@
+from common import EOverflowPolicy
+from datatypes import Coordinate, GnssCallback
+from collections import deque
+from typing import Deque, Dict, List, Tuple
+
+import logging
+import threading
+
+
+class Ingestion:
+    """Class that decouples the sensor callbacks from the calculations by queueing the position data for worker threads
+
+    Note:
+        Instances are callable with the signature of a GnssCallback, so they can be handed to a GnssReceiver directly.
+        Position data is distributed to the workers by actor id, so the data of one actor is always processed in order
+
+    Args:
+        on_data (GnssCallback): Callback function the queued position data is forwarded to by the workers
+        max_size (int): Maximum amount of queued position data per worker
+        overflow_policy (EOverflowPolicy, optional): How to handle incoming position data when a queue is full
+        worker_count (int, optional): Amount of worker threads
+
+    Raises:
+        ValueError: If max_size or worker_count is smaller than 1
+    """
+
+    def __init__(
+        self,
+        on_data: GnssCallback,
+        max_size: int,
+        overflow_policy: EOverflowPolicy = EOverflowPolicy.DROP_OLDEST,
+        worker_count: int = 1,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+        if worker_count < 1:
+            raise ValueError(f"worker_count must be at least 1, got {worker_count}")
+        self._on_data: GnssCallback = on_data
+        self._max_size: int = max_size
+        self._overflow_policy: EOverflowPolicy = overflow_policy
+        self._stop: bool = False
+        self._queued: int = 0
+        self._dropped: int = 0
+        self._processed: int = 0
+        self._counter_lock: threading.Lock = threading.Lock()
+        self._queues: List[Deque[Tuple[int, float, Coordinate]]] = [
+            deque() for _ in range(worker_count)
+        ]
+        self._conditions: List[threading.Condition] = [
+            threading.Condition() for _ in range(worker_count)
+        ]
+        self._workers: List[threading.Thread] = [
+            threading.Thread(target=self._work, args=(index,), daemon=True)
+            for index in range(worker_count)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def __call__(self, id: int, timestamp: float, position: Coordinate) -> None:
+        """Queues position data for the worker responsible for the actor
+
+        Args:
+            id (int): Id of the actor within the Carla world
+            timestamp (float): Timestamp on when the position was retrieved
+            position (Coordinate): Position at the given timestamp
+        """
+        index: int = id % len(self._queues)
+        queue: Deque[Tuple[int, float, Coordinate]] = self._queues[index]
+        condition: threading.Condition = self._conditions[index]
+        dropped: int = 0
+        with condition:
+            if self._stop:
+                return
+            if len(queue) >= self._max_size:
+                if self._overflow_policy == EOverflowPolicy.BLOCK:
+                    condition.wait_for(
+                        lambda: len(queue) < self._max_size or self._stop
+                    )
+                    if self._stop:
+                        return
+                elif self._overflow_policy == EOverflowPolicy.DROP_OLDEST:
+                    queue.popleft()
+                    dropped = 1
+                else:
+                    with self._counter_lock:
+                        self._dropped += 1
+                    return
+            queue.append((id, timestamp, position))
+            condition.notify_all()
+        with self._counter_lock:
+            self._queued += 1
+            self._dropped += dropped
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the counters of the queued position data
+
+        Returns:
+            Dict[str, int]: Amount of queued, dropped, processed and currently pending position data
+        """
+        with self._counter_lock:
+            return {
+                "queued": self._queued,
+                "dropped": self._dropped,
+                "processed": self._processed,
+                "pending": sum(len(queue) for queue in self._queues),
+            }
+
+    def stop(self, drain: bool = True) -> None:
+        """Stops the worker threads
+
+        Args:
+            drain (bool, optional): Process all pending position data before stopping
+        """
+        for queue, condition in zip(self._queues, self._conditions):
+            with condition:
+                if drain:
+                    condition.wait_for(lambda: len(queue) == 0)
+                else:
+                    queue.clear()
+                self._stop = True
+                condition.notify_all()
+        for worker in self._workers:
+            worker.join()
+
+    def _work(self, index: int) -> None:
+        """Main loop of a worker thread that forwards the queued position data
+
+        Args:
+            index (int): Index of the queue the worker is responsible for
+        """
+        queue: Deque[Tuple[int, float, Coordinate]] = self._queues[index]
+        condition: threading.Condition = self._conditions[index]
+        while True:
+            with condition:
+                condition.wait_for(lambda: len(queue) > 0 or self._stop)
+                if self._stop and len(queue) == 0:
+                    return
+                id, timestamp, position = queue.popleft()
+                condition.notify_all()
+            try:
+                self._on_data(id, timestamp, position)
+            except Exception as err:
+                logging.error(f"An error occurred when processing position data: {err}")
+            with self._counter_lock:
+                self._processed += 1
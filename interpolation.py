@@ -0,0 +1,40 @@
+from typing import Sequence, Union
+
+import numpy as np
+
+
+class Interpolation:
+    """Closed-form linear inter-/extrapolation over stored position samples
+
+    Note:
+        Yields the same results as a linear scipy.interpolate.interp1d with fill_value="extrapolate",
+        queries outside of the stored range are extrapolated along the first or last segment
+    """
+
+    @staticmethod
+    def positions(
+        timestamps: np.ndarray,
+        positions: np.ndarray,
+        query_timestamps: Union[Sequence[float], np.ndarray],
+    ) -> np.ndarray:
+        """Predicts positions at the given timestamps via inter-/extrapolation
+
+        Args:
+            timestamps (np.ndarray): Ascending timestamps of the stored positions (shape (n,), n >= 2)
+            positions (np.ndarray): Stored positions belonging to the timestamps (shape (n, 3))
+            query_timestamps (Sequence[float] | np.ndarray): Timestamps the positions should be predicted for
+
+        Returns:
+            np.ndarray: Predicted positions (shape (m, 3)) in the order of query_timestamps
+        """
+        query: np.ndarray = np.asarray(query_timestamps, dtype=np.float64)
+        upper: np.ndarray = np.clip(
+            np.searchsorted(timestamps, query), 1, len(timestamps) - 1
+        )
+        lower: np.ndarray = upper - 1
+        t_lower: np.ndarray = timestamps[lower]
+        p_lower: np.ndarray = positions[lower]
+        slope: np.ndarray = (positions[upper] - p_lower) / (
+            timestamps[upper] - t_lower
+        )[:, None]
+        return p_lower + slope * (query - t_lower)[:, None]
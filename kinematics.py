@@ -0,0 +1,160 @@
+from typing import Dict, List, Sequence, Tuple
+from math_operations import MathOperations as mo
+
+import numpy as np
+
+
+class Kinematics:
+    """Class to store the most recent data of many actors in columns and provide velocity, orientation,
+    angular velocity and accelaration for all of them in one pass
+
+    Note:
+        Mirrors the behaviour of RecentData row by row, missing values are represented by NaN
+
+    Args:
+        expiration_time (float): Time in seconds when the stored current timestamp and position is expired
+        capacity (int, optional): Amount of actors to preallocate rows for
+    """
+
+    _COLUMNS: Tuple[str, ...] = (
+        "_timestamp_previous",
+        "_timestamp_current",
+        "_position_previous",
+        "_position_current",
+        "_velocity_previous",
+        "_velocity_current",
+        "_orientation_previous",
+        "_orientation_current",
+        "_orientation",
+    )
+
+    def __init__(self, expiration_time: float, capacity: int = 64) -> None:
+        self._expiration_time: float = expiration_time
+        self._rows: Dict[int, int] = {}
+        self._free_rows: List[int] = []
+        self._timestamp_previous: np.ndarray = np.full(capacity, np.nan)
+        self._timestamp_current: np.ndarray = np.full(capacity, np.nan)
+        self._position_previous: np.ndarray = np.full((capacity, 3), np.nan)
+        self._position_current: np.ndarray = np.full((capacity, 3), np.nan)
+        self._velocity_previous: np.ndarray = np.full(capacity, np.nan)
+        self._velocity_current: np.ndarray = np.full(capacity, np.nan)
+        self._orientation_previous: np.ndarray = np.full(capacity, np.nan)
+        self._orientation_current: np.ndarray = np.full(capacity, np.nan)
+        self._orientation: np.ndarray = np.full(capacity, np.nan)
+
+    def rows(self, ids: Sequence[int]) -> np.ndarray:
+        """Returns the rows of the given actors, registering unknown actors
+
+        Args:
+            ids (Sequence[int]): Ids of the actors within the Carla world
+
+        Returns:
+            np.ndarray: Row indices of the actors
+        """
+        rows: List[int] = []
+        for id in ids:
+            if id not in self._rows:
+                self._rows[id] = (
+                    self._free_rows.pop()
+                    if self._free_rows
+                    else len(self._rows) + len(self._free_rows)
+                )
+            rows.append(self._rows[id])
+        if len(self._rows) + len(self._free_rows) > len(self._timestamp_current):
+            self._grow(len(self._rows) + len(self._free_rows))
+        return np.array(rows, dtype=np.intp)
+
+    def remove(self, id: int) -> None:
+        """Drops the stored data of an actor and frees its row for other actors
+
+        Args:
+            id (int): Id of the actor within the Carla world
+        """
+        if id not in self._rows:
+            return
+        row: int = self._rows.pop(id)
+        for name in self._COLUMNS:
+            getattr(self, name)[row] = np.nan
+        self._free_rows.append(row)
+
+    def update(
+        self, timestamp: float, ids: Sequence[int], positions: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Updates the previous and current timestamp and position of the given actors returning the calculated data
+
+        Args:
+            timestamp (float): Most recent timestamp to save
+            ids (Sequence[int]): Ids of the actors the positions belong to
+            positions (np.ndarray): Most recent positions to save (shape (n, 3))
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Current velocities, orientations, angular velocities
+            and accelarations (NaN where the data is insufficient)
+        """
+        rows: np.ndarray = self.rows(ids)
+        count: int = len(rows)
+        velocity: np.ndarray = np.full(count, np.nan)
+        orientation: np.ndarray = np.full(count, np.nan)
+        angular_speed: np.ndarray = np.full(count, np.nan)
+        accelaration: np.ndarray = np.full(count, np.nan)
+
+        timestamp_current: np.ndarray = self._timestamp_current[rows]
+        expired: np.ndarray = (timestamp - timestamp_current) > self._expiration_time
+        timestamp_current[expired] = np.nan
+        self._timestamp_previous[rows] = timestamp_current
+        self._timestamp_current[rows] = timestamp
+
+        active: np.ndarray = ~np.isnan(timestamp_current)
+        active_rows: np.ndarray = rows[active]
+        self._position_previous[active_rows] = self._position_current[active_rows]
+        self._position_current[active_rows] = positions[active]
+
+        valid: np.ndarray = active & ~np.isnan(self._position_previous[rows, 0])
+        valid_rows: np.ndarray = rows[valid]
+        if len(valid_rows) == 0:
+            return velocity, orientation, angular_speed, accelaration
+        t_before: np.ndarray = self._timestamp_previous[valid_rows]
+        vectors: np.ndarray = mo.vectors(
+            self._position_current[valid_rows], self._position_previous[valid_rows]
+        )
+
+        self._velocity_previous[valid_rows] = self._velocity_current[valid_rows]
+        self._velocity_current[valid_rows] = mo.velocities(vectors, t_before, timestamp)
+        velocity[valid] = self._velocity_current[valid_rows]
+
+        angle: np.ndarray = mo.angles_to_y_axis(vectors)
+        self._orientation_previous[valid_rows] = self._orientation_current[valid_rows]
+        self._orientation_current[valid_rows] = angle
+        moving: np.ndarray = ~np.isnan(angle) & (velocity[valid] > 0)
+        self._orientation[valid_rows[moving]] = angle[moving]
+        orientation[valid] = self._orientation[valid_rows]
+
+        orientation_previous: np.ndarray = self._orientation_previous[valid_rows]
+        angular_speed[valid] = np.where(
+            np.isnan(orientation_previous) | np.isnan(angle),
+            0,
+            mo.angular_speeds(orientation_previous, angle, t_before, timestamp),
+        )
+
+        velocity_previous: np.ndarray = self._velocity_previous[valid_rows]
+        delta_t: np.ndarray = timestamp - t_before
+        with np.errstate(divide="ignore", invalid="ignore"):
+            accelaration[valid] = np.where(
+                np.isnan(velocity_previous) | (delta_t == 0),
+                0,
+                (velocity[valid] - velocity_previous) / delta_t,
+            )
+        return velocity, orientation, angular_speed, accelaration
+
+    def _grow(self, count: int) -> None:
+        """Enlarges all columns so at least the given amount of actors fit
+
+        Args:
+            count (int): Amount of actors that have to fit
+        """
+        capacity: int = max(count, 2 * len(self._timestamp_current))
+        for name in self._COLUMNS:
+            column: np.ndarray = getattr(self, name)
+            grown: np.ndarray = np.full((capacity,) + column.shape[1:], np.nan)
+            grown[: len(column)] = column
+            setattr(self, name, grown)
@@ -1,9 +1,30 @@
-from common import Y_AXIS
+from common import Y_AXIS, EARTH_RADIUS_EQUA
 from datatypes import Coordinate, Vector
 from math import atan2, degrees, sqrt
-from typing import Union
-from carla import Location
-import random
+from typing import Tuple, Union
+import numpy as np
+
+
+def _round(values: np.ndarray, digits: int) -> np.ndarray:
+    """Rounds the given values exactly like the built-in round of the scalar operations
+
+    Note:
+        np.round scales by a power of ten before rounding, which differs from round for some values (e.g. 1.425)
+
+    Args:
+        values (np.ndarray): Values to be rounded
+        digits (int): Amount of decimal digits to round to
+
+    Returns:
+        np.ndarray: Rounded values with the shape of the given values
+    """
+    array: np.ndarray = np.asarray(values, dtype=float)
+    return np.reshape(
+        np.array(
+            [round(value, digits) for value in array.ravel().tolist()], dtype=float
+        ),
+        array.shape,
+    )
 
 
 class MathOperations:
@@ -132,26 +153,193 @@ class MathOperations:
         return round(delta_theta / delta_t, 2)
 
     @staticmethod
-    def distorted_coordinate(
-        x: float, y: float, z: float, error_range: float
-    ) -> Coordinate:
+    def vectors(points: np.ndarray, feet: np.ndarray) -> np.ndarray:
+        """Converts and returns the vectors from the given pairs of points
+
+        Args:
+            points (np.ndarray): Points the vectors point to (shape (n, 3) or (3,))
+            feet (np.ndarray): Points the vectors start from (shape (n, 3) or (3,))
+
+        Returns:
+            np.ndarray: Vectors with the start at feet and end at points (shape (n, 3))
+        """
+        return np.atleast_2d(np.subtract(points, feet, dtype=float))
+
+    @staticmethod
+    def dot_products(vectors_a: np.ndarray, vectors_b: np.ndarray) -> np.ndarray:
+        """Calculates and returns the dot products of the given pairs of vectors
+
+        Args:
+            vectors_a (np.ndarray): First vectors to calculate dot product (shape (n, 3) or (3,))
+            vectors_b (np.ndarray): Second vectors to calculate dot product (shape (n, 3) or (3,))
+
+        Returns:
+            np.ndarray: Results of the dot products between vectors_a and vectors_b (shape (n,))
+        """
+        a: np.ndarray = np.atleast_2d(vectors_a)
+        b: np.ndarray = np.atleast_2d(vectors_b)
+        return a[:, 0] * b[:, 0] + a[:, 1] * b[:, 1]
+
+    @staticmethod
+    def determinants(vectors_a: np.ndarray, vectors_b: np.ndarray) -> np.ndarray:
+        """Calculates and returns the determinants of the given pairs of vectors
 
-        # set a random distortion as the radius of a circle on which the new distorted coordinate is
-        r = random.uniform(0, error_range)
+        Args:
+            vectors_a (np.ndarray): First vectors to calculate determinant (shape (n, 3) or (3,))
+            vectors_b (np.ndarray): Second vectors to calculate determinant (shape (n, 3) or (3,))
 
-        # select a random point within the radius of the circle as x-coordinate
-        x_distorted = random.uniform(x - r, x + r)
+        Returns:
+            np.ndarray: Determinants of vectors_a and vectors_b (shape (n,))
+        """
+        a: np.ndarray = np.atleast_2d(vectors_a)
+        b: np.ndarray = np.atleast_2d(vectors_b)
+        return a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
 
-        # insert generated x-coordinate into circle formula and calculate y-coordinate
-        # select randomly between the two distorted y-values
-        y_distorted = (
-            sqrt((r**2) - ((x_distorted - x) ** 2)) + y
-            if random.uniform(0, 2) <= 1
-            else -sqrt((r**2) - ((x_distorted - x) ** 2)) + y
+    @staticmethod
+    def vectors_length(vectors: np.ndarray) -> np.ndarray:
+        """Calculates and returns the lengths of the given vectors
+
+        Args:
+            vectors (np.ndarray): Vectors to calculate the length of (shape (n, 3))
+
+        Returns:
+            np.ndarray: Lengths of the vectors (shape (n,))
+        """
+        return _round(
+            np.sqrt(vectors[:, 0] ** 2 + vectors[:, 1] ** 2 + vectors[:, 2] ** 2), 2
         )
 
-        return Coordinate(
-            x_distorted,
-            y_distorted,
-            z,
+    @staticmethod
+    def velocities(
+        vectors: np.ndarray, t_before: np.ndarray, t_after: np.ndarray
+    ) -> np.ndarray:
+        """Calculates and returns the velocities from the given vectors and timestamps (in km/h)
+
+        Args:
+            vectors (np.ndarray): Represent the covered distances (in m, shape (n, 3))
+            t_before (np.ndarray): Timestamps of the positions before (in s)
+            t_after (np.ndarray): Timestamps of the positions afterwards (in s)
+
+        Returns:
+            np.ndarray: Velocities from the given vectors and timestamps (in km/h, shape (n,))
+        """
+        delta_t: np.ndarray = np.abs(t_after - t_before)
+        d: np.ndarray = MathOperations.vectors_length(vectors)
+        return _round((d / delta_t) * 3.6, 2)
+
+    @staticmethod
+    def angles_to_y_axis(vectors: np.ndarray) -> np.ndarray:
+        """Calculates and returns the angles to y-axis (0-360 degrees)
+
+        Args:
+            vectors (np.ndarray): Vectors to calculate the angle between the y-axis (in m, shape (n, 3))
+
+        Returns:
+            np.ndarray: Angles between given vectors and y-axis (0-360 degrees), NaN for vectors with the length 0
+        """
+        axis: np.ndarray = np.array([Y_AXIS.x, Y_AXIS.y, Y_AXIS.z])
+        angle: np.ndarray = MathOperations.angles_between_vectors(axis, vectors)
+        zero: np.ndarray = (vectors[:, 0] == 0) & (vectors[:, 1] == 0)
+        return np.where(zero, np.nan, angle)
+
+    @staticmethod
+    def angles_between_vectors(
+        vectors_a: np.ndarray, vectors_b: np.ndarray
+    ) -> np.ndarray:
+        """Calculates and returns the angles between the given pairs of vectors (0-360 degrees)
+
+        Args:
+            vectors_a (np.ndarray): First vectors to calculate the angle between (shape (n, 3) or (3,))
+            vectors_b (np.ndarray): Second vectors to calculate the angle between (shape (n, 3) or (3,))
+
+        Returns:
+            np.ndarray: Angles between the given vectors (0-360 degrees, shape (n,))
+        """
+        dot: np.ndarray = MathOperations.dot_products(vectors_a, vectors_b)
+        det: np.ndarray = MathOperations.determinants(vectors_a, vectors_b)
+        angle: np.ndarray = _round(np.degrees(np.arctan2(det, dot)), 2)
+        return np.where(angle >= 0, angle, 360 + angle)
+
+    @staticmethod
+    def angular_speeds(
+        angles_a: np.ndarray,
+        angles_b: np.ndarray,
+        t_before: np.ndarray,
+        t_after: np.ndarray,
+    ) -> np.ndarray:
+        """Calculates and returns the angular speeds between the given angles and the corresponding timestamps
+
+        Args:
+            angles_a (np.ndarray): First angles to calculate the speed between
+            angles_b (np.ndarray): Second angles to calculate the speed between
+            t_before (np.ndarray): Timestamps before the change of the angles
+            t_after (np.ndarray): Timestamps after the change of the angles
+
+        Returns:
+            np.ndarray: Angular speeds to turn from angles_a to angles_b between the given timestamps
+        """
+        delta_theta: np.ndarray = np.abs(angles_a - angles_b)
+        delta_t: np.ndarray = np.abs(t_after - t_before)
+        return _round(delta_theta / delta_t, 2)
+
+    @staticmethod
+    def hero_relations(
+        heroes_now: np.ndarray, heroes_before: np.ndarray, positions: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculates and returns the distances and angles of the given positions relative to several heroes
+
+        Args:
+            heroes_now (np.ndarray): Current positions of the heroes, NaN if unknown (shape (k, 3))
+            heroes_before (np.ndarray): Previous positions of the heroes to determine their orientation, NaN if unknown (shape (k, 3))
+            positions (np.ndarray): Positions of the actors (shape (n, 3))
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Distances to the heroes and angles in relation to the orientation of the heroes
+                (shape (k, n) each), NaN where the pose of the hero is insufficient
+        """
+        hero_count: int = len(heroes_now)
+        count: int = len(positions)
+        others: np.ndarray = np.tile(positions, (hero_count, 1))
+        distances: np.ndarray = MathOperations.vectors_length(
+            MathOperations.vectors(np.repeat(heroes_now, count, axis=0), others)
+        ).reshape(hero_count, count)
+        angles: np.ndarray = MathOperations.angles_between_vectors(
+            np.repeat(MathOperations.vectors(heroes_now, heroes_before), count, axis=0),
+            MathOperations.vectors(others, np.repeat(heroes_before, count, axis=0)),
+        ).reshape(hero_count, count)
+        return distances, angles
+
+    @staticmethod
+    def geolocations(
+        locations: np.ndarray, latitude: float, longitude: float, altitude: float
+    ) -> np.ndarray:
+        """Converts world locations into geolocations like carla.Map.transform_to_geolocation does
+
+        Args:
+            locations (np.ndarray): Locations in the world (in m, shape (n, 3))
+            latitude (float): Latitude of the origin of the world
+            longitude (float): Longitude of the origin of the world
+            altitude (float): Altitude of the origin of the world
+
+        Returns:
+            np.ndarray: Longitude, latitude and altitude of the locations (shape (n, 3))
+        """
+        scale: float = np.cos(np.radians(latitude))
+        mx: np.ndarray = (
+            scale * np.radians(longitude) * EARTH_RADIUS_EQUA + locations[:, 0]
+        )
+        my: np.ndarray = (
+            scale
+            * EARTH_RADIUS_EQUA
+            * np.log(np.tan((90.0 + latitude) * np.pi / 360.0))
+            - locations[:, 1]
+        )
+        return np.stack(
+            (
+                mx * 180.0 / (np.pi * EARTH_RADIUS_EQUA * scale),
+                360.0 * np.arctan(np.exp(my / (EARTH_RADIUS_EQUA * scale))) / np.pi
+                - 90.0,
+                altitude + locations[:, 2],
+            ),
+            axis=1,
         )
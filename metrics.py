@@ -0,0 +1,242 @@
+from common import LATENCY_BUCKETS
+from typing import Any, Dict, List, Tuple, Union, TYPE_CHECKING
+
+import bisect
+import logging
+import os
+import threading
+import time
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+PREFIX: str = "carlos_gnss"
+
+
+class Metrics:
+    """Class that counts events and keeps a latency histogram per processing stage
+
+    Note:
+        Disabled by default. Instrumented code checks enabled once per event and skips all timing while it is False,
+        so the overhead of switched off instrumentation is one attribute lookup per event
+
+    Args:
+        buckets (Tuple[float, ...], optional): Upper bounds (in s) of the buckets of the latency histograms
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.enabled: bool = False
+        self._bounds: List[int] = [round(bound * 1e9) for bound in buckets]
+        self._buckets: Tuple[float, ...] = buckets
+        self._counters: Dict[str, int] = {}
+        self._histograms: Dict[str, List[int]] = {}
+        self._sums: Dict[str, int] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increments a counter
+
+        Args:
+            name (str): Name of the counter
+            amount (int, optional): Amount the counter is incremented by
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def lap(self, stage: str, start: int) -> int:
+        """Adds the time since the start to the histogram of a stage
+
+        Args:
+            stage (str): Name of the stage
+            start (int): Value of time.perf_counter_ns when the stage started
+
+        Returns:
+            int: Value of time.perf_counter_ns when the stage ended, to be used as start of the next stage
+        """
+        end: int = time.perf_counter_ns()
+        elapsed: int = end - start
+        with self._lock:
+            if stage not in self._histograms:
+                self._histograms[stage] = [0] * (len(self._bounds) + 1)
+                self._sums[stage] = 0
+            self._histograms[stage][bisect.bisect_left(self._bounds, elapsed)] += 1
+            self._sums[stage] += elapsed
+        return end
+
+    def reset(self) -> None:
+        """Clears all counters and histograms"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._sums.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns the current values of all counters and histograms
+
+        Returns:
+            Dict[str, Any]: Counters by name and per stage the amount, total and percentiles (p50, p99) of the
+                latencies (in s) and the amount per histogram bucket (keyed by its upper bound)
+        """
+        with self._lock:
+            counters: Dict[str, int] = dict(self._counters)
+            histograms: Dict[str, List[int]] = {
+                stage: list(counts) for stage, counts in self._histograms.items()
+            }
+            sums: Dict[str, int] = dict(self._sums)
+        bounds: List[str] = [str(bound) for bound in self._buckets] + ["+Inf"]
+        return {
+            "enabled": self.enabled,
+            "counters": counters,
+            "stages": {
+                stage: {
+                    "count": sum(counts),
+                    "sum": sums[stage] / 1e9,
+                    "p50": self._percentile(counts, 0.5),
+                    "p99": self._percentile(counts, 0.99),
+                    "buckets": dict(zip(bounds, counts)),
+                }
+                for stage, counts in histograms.items()
+            },
+        }
+
+    def prometheus(self) -> str:
+        """Returns all counters and histograms in the Prometheus text exposition format
+
+        Returns:
+            str: Counters as carlos_gnss_events_total and histograms as carlos_gnss_stage_seconds
+        """
+        snapshot: Dict[str, Any] = self.snapshot()
+        lines: List[str] = [
+            f"# HELP {PREFIX}_events_total Amount of processed events by kind",
+            f"# TYPE {PREFIX}_events_total counter",
+        ]
+        for name, value in sorted(snapshot["counters"].items()):
+            lines.append(f'{PREFIX}_events_total{{event="{name}"}} {value}')
+        lines += [
+            f"# HELP {PREFIX}_stage_seconds Latency of the processing stages",
+            f"# TYPE {PREFIX}_stage_seconds histogram",
+        ]
+        for stage, values in sorted(snapshot["stages"].items()):
+            cumulative: int = 0
+            for bound, count in values["buckets"].items():
+                cumulative += count
+                lines.append(
+                    f'{PREFIX}_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}'
+                )
+            lines.append(
+                f'{PREFIX}_stage_seconds_sum{{stage="{stage}"}} {values["sum"]}'
+            )
+            lines.append(
+                f'{PREFIX}_stage_seconds_count{{stage="{stage}"}} {values["count"]}'
+            )
+        return "\n".join(lines) + "\n"
+
+    def _percentile(self, counts: List[int], fraction: float) -> Union[float, None]:
+        """Estimates a percentile as the upper bound of the bucket it falls into
+
+        Args:
+            counts (List[int]): Amount per histogram bucket
+            fraction (float): Percentile as fraction (0-1)
+
+        Returns:
+            None: No latencies or the percentile is above the largest bound
+            float: Upper bound (in s) of the bucket of the percentile
+        """
+        total: int = sum(counts)
+        cumulative: int = 0
+        for bound, count in zip(self._buckets, counts):
+            cumulative += count
+            if cumulative >= total * fraction and cumulative > 0:
+                return bound
+        return None
+
+
+class MetricsExporter:
+    """Class that exposes Metrics in the Prometheus text format, as file that is rewritten periodically and/or over HTTP
+
+    Args:
+        metrics (Metrics): Metrics to be exported
+        path (str, optional): Path of the file the metrics are written to
+        port (int, optional): Port on localhost the metrics are served on (any path, e.g. /metrics)
+        interval (float, optional): Time in seconds between two writes of the file
+    """
+
+    def __init__(
+        self,
+        metrics: Metrics,
+        path: Union[str, None] = None,
+        port: Union[int, None] = None,
+        interval: float = 10.0,
+    ) -> None:
+        self._metrics: Metrics = metrics
+        self._path: Union[str, None] = path
+        self._interval: float = interval
+        self._stopped: threading.Event = threading.Event()
+        self._writer: Union[threading.Thread, None] = None
+        self._server: Union["ThreadingHTTPServer", None] = None
+        if path != None:
+            self._writer = threading.Thread(target=self._work, daemon=True)
+            self._writer.start()
+        if port != None:
+            # imported here, so the instrumented modules do not load the HTTP server (and ssl, email) unless it is served
+            from http.server import ThreadingHTTPServer
+
+            self._server = ThreadingHTTPServer(
+                ("localhost", port), self._handler(metrics)
+            )
+            threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self) -> None:
+        """Writes the file one last time and stops serving the metrics"""
+        self._stopped.set()
+        if self._writer != None:
+            self._writer.join()
+        if self._server != None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def _work(self) -> None:
+        """Main loop of the thread that writes the file"""
+        while not self._stopped.wait(self._interval):
+            self._write()
+        self._write()
+
+    def _write(self) -> None:
+        """Replaces the file with the current metrics, readers never see a partially written file"""
+        temporary: str = f"{self._path}.tmp"
+        try:
+            with open(temporary, "w", encoding="UTF-8") as f:
+                f.write(self._metrics.prometheus())
+            os.replace(temporary, self._path)
+        except OSError as err:
+            logging.error(f"An error occurred when writing the metrics: {err}")
+
+    @staticmethod
+    def _handler(metrics: Metrics) -> type:
+        """Creates the request handler class of the HTTP server
+
+        Args:
+            metrics (Metrics): Metrics to be served
+
+        Returns:
+            type: Request handler that answers every GET request with the metrics
+        """
+        from http.server import BaseHTTPRequestHandler
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                body: bytes = metrics.prometheus().encode("UTF-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
+
+
+# shared by all instrumented components of the process, switched on and off by Api.start_metrics and Api.stop_metrics
+metrics: Metrics = Metrics()
@@ -0,0 +1,89 @@
+from common import ENoiseModel
+from datatypes import Coordinate
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
+
+
+class NoiseGenerator:
+    """Class that pre-generates distortion offsets in blocks from a seeded generator and hands them out one by one
+
+    Note:
+        CIRCULAR places the offsets on a circle with a random radius of up to error_range, with a uniformly drawn
+        x offset and a randomly signed y offset. GAUSSIAN draws the offset of x and y from a normal distribution with error_range as
+        standard deviation. Every receiver should have its own generator, two generators with the same seed hand out
+        the same offsets
+
+    Args:
+        error_range (float): Error range in which the positions should be distorted, 0 disables the distortion
+        model (ENoiseModel, optional): Error model the offsets are drawn from
+        seed (int | Sequence[int], optional): Seed of the generator, None for a non-reproducible seed
+        block_size (int, optional): Amount of offsets that are generated at once
+    """
+
+    def __init__(
+        self,
+        error_range: float,
+        model: ENoiseModel = ENoiseModel.CIRCULAR,
+        seed: Union[int, Sequence[int], None] = None,
+        block_size: int = 1024,
+    ) -> None:
+        self._error_range: float = error_range
+        self._model: ENoiseModel = model
+        self._block_size: int = block_size
+        self._generator: np.random.Generator = np.random.default_rng(seed)
+        self._offsets: List[List[float]] = []
+        self._index: int = 0
+
+    @property
+    def error_range(self) -> float:
+        """
+        Returns:
+            float: Error range in which the positions are distorted
+        """
+        return self._error_range
+
+    def offset(self) -> Tuple[float, float]:
+        """Returns the next distortion offset
+
+        Returns:
+            Tuple[float, float]: Offset of the x and y coordinate
+        """
+        if self._error_range <= 0:
+            return (0.0, 0.0)
+        if self._index == len(self._offsets):
+            self._offsets = self._generate().tolist()
+            self._index = 0
+        x, y = self._offsets[self._index]
+        self._index += 1
+        return (x, y)
+
+    def distort(self, x: float, y: float, z: float) -> Coordinate:
+        """Distorts a position with the next distortion offset
+
+        Args:
+            x (float): X coordinate of the position
+            y (float): Y coordinate of the position
+            z (float): Z coordinate of the position, it is not distorted
+
+        Returns:
+            Coordinate: Distorted position
+        """
+        offset_x, offset_y = self.offset()
+        return Coordinate(x + offset_x, y + offset_y, z)
+
+    def _generate(self) -> np.ndarray:
+        """Generates a block of distortion offsets
+
+        Returns:
+            np.ndarray: Offsets of the x and y coordinate (shape (block_size, 2))
+        """
+        if self._model == ENoiseModel.GAUSSIAN:
+            return self._generator.normal(0, self._error_range, (self._block_size, 2))
+        r: np.ndarray = self._generator.uniform(0, self._error_range, self._block_size)
+        x: np.ndarray = r * self._generator.uniform(-1, 1, self._block_size)
+        sign: np.ndarray = np.where(
+            self._generator.random(self._block_size) < 0.5, 1, -1
+        )
+        y: np.ndarray = sign * np.sqrt(np.maximum(r**2 - x**2, 0))
+        return np.stack((x, y), axis=1)
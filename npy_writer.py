@@ -0,0 +1,111 @@
+from typing import BinaryIO, List
+
+import numpy as np
+
+HEADER_ALIGNMENT: int = 64
+
+
+class NpyWriter:
+    """Class that writes a structured array into a .npy file incrementally in chunks
+
+    Note:
+        The header is rewritten after every chunk, so the file is a valid .npy file at any time and can be read
+        (memory-mapped) with numpy.load(path, mmap_mode="r")
+
+    Args:
+        path (str): Path of the file to be written
+        dtype (np.dtype): Structured datatype of the rows
+        chunk_size (int, optional): Amount of rows that are buffered before they are written
+    """
+
+    def __init__(self, path: str, dtype: np.dtype, chunk_size: int = 65536) -> None:
+        self._dtype: np.dtype = np.dtype(dtype)
+        self._chunk_size: int = chunk_size
+        self._chunks: List[np.ndarray] = []
+        self._buffered: int = 0
+        self._count: int = 0
+        self._header_size: int = len(self._descriptor(np.iinfo(np.int64).max)) + 11
+        self._header_size += -self._header_size % HEADER_ALIGNMENT
+        self._file: BinaryIO = open(path, "wb")
+        self._file.write(self._header(0))
+
+    @property
+    def count(self) -> int:
+        """
+        Returns:
+            int: Amount of rows written to the file
+        """
+        return self._count
+
+    @property
+    def size(self) -> int:
+        """
+        Returns:
+            int: Size of the written file (in bytes)
+        """
+        return self._header_size + self._count * self._dtype.itemsize
+
+    def append(self, rows: np.ndarray) -> None:
+        """Buffers rows and writes them as soon as a chunk is full
+
+        Args:
+            rows (np.ndarray): Rows with the datatype of the writer
+        """
+        if len(rows) == 0:
+            return
+        self._chunks.append(rows.astype(self._dtype, copy=False))
+        self._buffered += len(rows)
+        if self._buffered >= self._chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes all buffered rows and updates the header"""
+        if self._buffered == 0:
+            return
+        for chunk in self._chunks:
+            self._file.write(np.ascontiguousarray(chunk).tobytes())
+        self._count += self._buffered
+        self._chunks = []
+        self._buffered = 0
+        self._file.seek(0)
+        self._file.write(self._header(self._count))
+        self._file.seek(0, 2)
+        self._file.flush()
+
+    def close(self) -> None:
+        """Writes all buffered rows and closes the file"""
+        self.flush()
+        self._file.close()
+
+    def _header(self, count: int) -> bytes:
+        """Creates the .npy header (version 1.0) for the given amount of rows, padded to a fixed size
+
+        Args:
+            count (int): Amount of rows in the file
+
+        Returns:
+            bytes: Header of the .npy file
+        """
+        descriptor: str = self._descriptor(count).ljust(self._header_size - 11) + "\n"
+        return (
+            b"\x93NUMPY\x01\x00"
+            + len(descriptor).to_bytes(2, "little")
+            + descriptor.encode("latin1")
+        )
+
+    def _descriptor(self, count: int) -> str:
+        """Creates the dictionary of the .npy header for the given amount of rows
+
+        Args:
+            count (int): Amount of rows in the file
+
+        Returns:
+            str: Dictionary of the .npy header as string
+        """
+        return repr(
+            {
+                "descr": np.lib.format.dtype_to_descr(self._dtype),
+                "fortran_order": False,
+                "shape": (count,),
+            }
+        )
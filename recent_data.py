@@ -1,6 +1,6 @@
 from common import MAX_STORE_SIZE
-from typing import Union, Dict, Tuple
-from datatypes import Coordinate, Vector, Recent
+from typing import Union, Tuple
+from datatypes import Coordinate, Vector, Recent, PositionBuffer
 from math_operations import MathOperations as mo
 
 
@@ -26,14 +26,14 @@ class RecentData:
             None, None
         )
         self._orientation: Union[float, None] = None
-        self._stored: Dict[float, Coordinate] = {}
+        self._stored: PositionBuffer = PositionBuffer(MAX_STORE_SIZE)
 
     @property
-    def stored(self) -> Dict[float, Coordinate]:
-        """Returns the dictionary with the positions on the corresponding timestamps
+    def stored(self) -> PositionBuffer:
+        """Returns the buffer with the positions on the corresponding timestamps
 
         Returns:
-            Dict[float, Coordinate]: Dictionary with the most recent timestamps and the corresponding positions
+            PositionBuffer: Ring buffer with the most recent timestamps and the corresponding positions in ascending order
         """
         return self._stored
 
@@ -152,7 +152,4 @@ class RecentData:
             timestamp (float): Timestamp of most recent detected position
             position (Coordinate): Most recent detected position
         """
-        if len(self._stored) >= MAX_STORE_SIZE:
-            first = list(self._stored.keys())[0]
-            del self._stored[first]
-        self._stored[timestamp] = position
+        self._stored.append(timestamp, position)
@@ -0,0 +1,152 @@
+from common import RECORD_DTYPE
+from npy_writer import NpyWriter
+from collections import deque
+from typing import Deque, Dict, List, Tuple, Union
+
+import logging
+import pathlib
+import threading
+import time
+import numpy as np
+
+Record = Tuple[Union[int, float], ...]
+
+
+class RecordLog:
+    """Class that continuously appends every accepted record to rotating .npy files from a background thread
+
+    Note:
+        Every file holds the columns of common.RECORD_DTYPE, missing values are stored as NaN.
+        When the writer falls behind, the oldest pending records are dropped so the memory stays bounded
+
+    Args:
+        path (str): Path of the folder the files should be written to
+        prefix (str, optional): Prefix of the file names, the files are named <prefix>_<index>.npy
+        max_file_size (int, optional): Size (in bytes) after which a new file is started
+        max_file_age (float, optional): Time (in s) after which a new file is started, None to rotate by size only
+        flush_interval (float, optional): Time (in s) after which pending records are written at the latest
+        batch_size (int, optional): Amount of pending records that triggers a write
+        max_pending (int, optional): Maximum amount of pending records
+    """
+
+    def __init__(
+        self,
+        path: str,
+        prefix: str = "records",
+        max_file_size: int = 256 * 1024 * 1024,
+        max_file_age: Union[float, None] = None,
+        flush_interval: float = 1.0,
+        batch_size: int = 4096,
+        max_pending: int = 1000000,
+    ) -> None:
+        self._path: pathlib.Path = pathlib.Path(path)
+        self._prefix: str = prefix
+        self._max_file_size: int = max_file_size
+        self._max_file_age: Union[float, None] = max_file_age
+        self._flush_interval: float = flush_interval
+        self._batch_size: int = batch_size
+        self._pending: Deque[Record] = deque(maxlen=max_pending)
+        self._condition: threading.Condition = threading.Condition()
+        self._stop: bool = False
+        self._written: int = 0
+        self._dropped: int = 0
+        self._files: List[str] = []
+        self._writer: Union[NpyWriter, None] = None
+        self._opened: float = 0
+        self._worker: threading.Thread = threading.Thread(
+            target=self._work, daemon=True
+        )
+        self._worker.start()
+
+    def put(self, record: Record) -> None:
+        """Queues a record to be written
+
+        Args:
+            record (Record): Values in the order of the fields of common.RECORD_DTYPE
+        """
+        with self._condition:
+            if self._stop:
+                return
+            if len(self._pending) == self._pending.maxlen:
+                self._dropped += 1
+            self._pending.append(record)
+            if len(self._pending) >= self._batch_size:
+                self._condition.notify()
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the counters of the record log
+
+        Returns:
+            Dict[str, int]: Amount of written, dropped and pending records and the amount of files
+        """
+        with self._condition:
+            return {
+                "written": self._written,
+                "dropped": self._dropped,
+                "pending": len(self._pending),
+                "files": len(self._files),
+            }
+
+    @property
+    def files(self) -> List[str]:
+        """
+        Returns:
+            List[str]: Paths of all files written so far
+        """
+        return list(self._files)
+
+    def close(self) -> None:
+        """Writes all pending records and closes the current file"""
+        with self._condition:
+            self._stop = True
+            self._condition.notify()
+        self._worker.join()
+
+    def _work(self) -> None:
+        """Main loop of the writer thread"""
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: len(self._pending) >= self._batch_size or self._stop,
+                    self._flush_interval,
+                )
+                records: List[Record] = list(self._pending)
+                self._pending.clear()
+                stop: bool = self._stop
+            try:
+                self._write(records)
+            except Exception as err:
+                logging.error(f"An error occurred when writing records: {err}")
+            if stop:
+                if self._writer != None:
+                    self._writer.close()
+                return
+
+    def _write(self, records: List[Record]) -> None:
+        """Writes records into the current file, starting a new file if the current one is full or too old
+
+        Args:
+            records (List[Record]): Records to be written
+        """
+        if not records:
+            return
+        if self._writer != None and (
+            self._writer.size >= self._max_file_size
+            or (
+                self._max_file_age != None
+                and time.monotonic() - self._opened >= self._max_file_age
+            )
+        ):
+            self._writer.close()
+            self._writer = None
+        if self._writer == None:
+            path: str = str(self._path / f"{self._prefix}_{len(self._files):05d}.npy")
+            self._writer = NpyWriter(path, RECORD_DTYPE)
+            self._opened = time.monotonic()
+            self._files.append(path)
+        self._writer.append(
+            np.array([tuple(record) for record in records], dtype=RECORD_DTYPE)
+        )
+        self._writer.flush()
+        with self._condition:
+            self._written += len(records)
@@ -0,0 +1,513 @@
+from kinematics import Kinematics
+from math_operations import MathOperations as mo
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Tuple, Union
+
+import json
+import multiprocessing
+import threading
+import numpy as np
+
+# ids of the relevant actors, their data in JSON format, their values (only if requested) and rounded entries of the stored hero
+# and the amount of actors with insufficient data
+ShardResult = Tuple[
+    List[int],
+    List[str],
+    Union[List[List[Union[float, None]]], None],
+    Union[List[List[float]], None],
+    int,
+]
+# rows of the relevant actors, their data in JSON format separated by newlines and the amount of actors with insufficient data
+WorkerResult = Tuple[np.ndarray, str, int]
+
+
+def _shapes(
+    capacity: int, hero_capacity: int
+) -> List[Tuple[str, Tuple[int, ...], Any]]:
+    """
+    Args:
+        capacity (int): Amount of rows the table holds
+        hero_capacity (int): Amount of heroes the table holds
+
+    Returns:
+        List[Tuple[str, Tuple[int, ...], Any]]: Name, shape and datatype of every column of the shared table
+    """
+    return [
+        ("ids", (capacity,), np.int64),
+        ("frames", (capacity,), np.int64),
+        ("positions", (capacity, 3), np.float64),
+        ("kinematics", (capacity, 4), np.float64),
+        ("entries", (capacity, 6), np.float64),
+        ("hero_ids", (hero_capacity,), np.int64),
+        ("radii", (hero_capacity,), np.float64),
+        ("heroes_now", (hero_capacity, 3), np.float64),
+        ("heroes_before", (hero_capacity, 3), np.float64),
+        ("distances", (hero_capacity, capacity), np.float64),
+        ("angles", (hero_capacity, capacity), np.float64),
+    ]
+
+
+def _table(
+    buffer: memoryview, capacity: int, hero_capacity: int
+) -> Dict[str, np.ndarray]:
+    """Maps the columns of the shared table onto a buffer without copying
+
+    Args:
+        buffer (memoryview): Buffer of the shared memory block
+        capacity (int): Amount of rows the table holds
+        hero_capacity (int): Amount of heroes the table holds
+
+    Returns:
+        Dict[str, np.ndarray]: Columns of the table
+    """
+    table: Dict[str, np.ndarray] = {}
+    offset: int = 0
+    for name, shape, dtype in _shapes(capacity, hero_capacity):
+        table[name] = np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset)
+        offset += table[name].nbytes
+    return table
+
+
+def _table_size(capacity: int, hero_capacity: int) -> int:
+    """
+    Args:
+        capacity (int): Amount of rows the table holds
+        hero_capacity (int): Amount of heroes the table holds
+
+    Returns:
+        int: Size of the shared table in bytes
+    """
+    return sum(
+        int(np.prod(shape)) * np.dtype(dtype).itemsize
+        for _, shape, dtype in _shapes(capacity, hero_capacity)
+    )
+
+
+def _work(connection: Connection, shard: int) -> None:
+    """Main loop of a worker process, calculates and encodes the data of the actors in the rows of its shard
+
+    Args:
+        connection (Connection): Pipe to the pool the commands are received from
+        shard (int): Index of the shard, the worker owns the rows from shard * slice capacity on
+    """
+    kinematics: Kinematics = Kinematics(3)
+    memory: Union[SharedMemory, None] = None
+    table: Dict[str, np.ndarray] = {}
+    start: int = 0
+    while True:
+        message: Tuple = connection.recv()
+        command: str = message[0]
+        if command == "remove":
+            kinematics.remove(message[1])
+            continue
+        if command == "stop":
+            break
+        try:
+            if command == "frame":
+                _, sequence, timestamp, used, hero_count, stored = message
+                connection.send(
+                    _calculate(
+                        kinematics,
+                        table,
+                        start,
+                        start + used,
+                        sequence,
+                        timestamp,
+                        hero_count,
+                        stored,
+                    )
+                )
+            elif command == "attach":
+                _, name, slice_capacity, shard_count, hero_capacity = message
+                table = {}
+                if memory != None:
+                    memory.close()
+                memory = SharedMemory(name)
+                table = _table(memory.buf, slice_capacity * shard_count, hero_capacity)
+                start = shard * slice_capacity
+                connection.send(None)
+        except Exception as e:
+            connection.send(e)
+    table = {}
+    if memory != None:
+        memory.close()
+    connection.close()
+
+
+def _calculate(
+    kinematics: Kinematics,
+    table: Dict[str, np.ndarray],
+    start: int,
+    end: int,
+    sequence: int,
+    timestamp: float,
+    hero_count: int,
+    stored: Union[int, None],
+) -> List[WorkerResult]:
+    """Calculates the data of the actors of a frame within a slice of the shared table, writes it into the table
+    and encodes the data of the actors within the radius of every hero, the data of the stored hero is also rounded like Actor.add_data
+
+    Args:
+        kinematics (Kinematics): Kinematics of the actors of the shard
+        table (Dict[str, np.ndarray]): Columns of the shared table
+        start (int): First row of the slice
+        end (int): Row after the last used row of the slice
+        sequence (int): Number of the frame, rows that are part of it are marked with it
+        timestamp (float): Timestamp of the frame
+        hero_count (int): Amount of heroes in the frame
+        stored (int | None): Index of the hero whose data is stored
+
+    Returns:
+        List[WorkerResult]: Relevant rows, their JSON data and the amount of actors with insufficient data per hero
+    """
+    rows: np.ndarray = np.flatnonzero(table["frames"][start:end] == sequence) + start
+    if len(rows) == 0:
+        return [(rows, "", 0) for _ in range(hero_count)]
+    id_array: np.ndarray = table["ids"][rows]
+    ids: List[int] = id_array.tolist()
+    positions: np.ndarray = table["positions"][rows]
+    columns: Tuple[np.ndarray, ...] = kinematics.update(timestamp, ids, positions)
+    table["kinematics"][rows] = np.stack(columns, axis=1)
+    distances, angles = mo.hero_relations(
+        table["heroes_now"][:hero_count], table["heroes_before"][:hero_count], positions
+    )
+    data: List[List[Union[float, None]]] = [
+        [None if value != value else value for value in column.tolist()]
+        for column in columns
+    ]
+    results: List[WorkerResult] = []
+    for index in range(hero_count):
+        distance_to_hero: np.ndarray = distances[index]
+        angle_to_hero: np.ndarray = angles[index]
+        is_hero: np.ndarray = id_array == table["hero_ids"][index]
+        distance_to_hero[is_hero] = 0
+        angle_to_hero[is_hero] = 0
+        table["distances"][index, rows] = distance_to_hero
+        table["angles"][index, rows] = angle_to_hero
+        relevant: np.ndarray = np.flatnonzero(distance_to_hero <= table["radii"][index])
+        distance_values: List[float] = distance_to_hero.tolist()
+        angle_values: List[Union[float, None]] = [
+            None if angle != angle else angle for angle in angle_to_hero.tolist()
+        ]
+        if index == stored and len(relevant) > 0:
+            table["entries"][rows[relevant]] = [
+                [
+                    round(value, 3) if value != None else 0
+                    for value in (
+                        data[0][row],
+                        data[1][row],
+                        data[2][row],
+                        data[3][row],
+                        distance_values[row],
+                        angle_values[row],
+                    )
+                ]
+                for row in relevant.tolist()
+            ]
+        results.append(
+            (
+                rows[relevant],
+                "\n".join(
+                    json.dumps(
+                        [
+                            ids[row],
+                            data[0][row],
+                            data[1][row],
+                            data[2][row],
+                            data[3][row],
+                            distance_values[row],
+                            angle_values[row],
+                        ]
+                    )
+                    for row in relevant.tolist()
+                ),
+                int(np.isnan(distance_to_hero).sum()),
+            )
+        )
+    return results
+
+
+class ShardPool:
+    """Class that calculates the frames of Hero in several processes, bypassing the global interpreter lock
+
+    Note:
+        Every actor is assigned to the worker with the fewest actors and gets a fixed row within the contiguous
+        slice of the shared memory table that worker owns. The positions of a frame and the poses of the heroes are
+        written into the table, each worker calculates the kinematics, the distances and angles to the heroes and the
+        JSON data of the relevant actors of its slice, so only storing and delivering the data is left to this process.
+        Frames are calculated one after the other, within a frame the actors are published slice by slice
+
+    Args:
+        process_count (int): Amount of worker processes
+        capacity (int, optional): Amount of actors the shared table is allocated for, it grows when more actors join
+        hero_capacity (int, optional): Amount of heroes the shared table is allocated for, it grows when more heroes are added
+    """
+
+    def __init__(
+        self, process_count: int, capacity: int = 1024, hero_capacity: int = 4
+    ) -> None:
+        if process_count < 1:
+            raise ValueError(f"Process count must be at least 1, got {process_count}")
+        # spawned instead of forked, so the workers do not inherit the threads and locks of this process
+        context = multiprocessing.get_context("spawn")
+        self._connections: List[Connection] = []
+        self._processes: List[multiprocessing.process.BaseProcess] = []
+        for shard in range(process_count):
+            connection, child_connection = context.Pipe()
+            process = context.Process(
+                target=_work, args=(child_connection, shard), daemon=True
+            )
+            process.start()
+            child_connection.close()
+            self._connections.append(connection)
+            self._processes.append(process)
+        self._memory: Union[SharedMemory, None] = None
+        self._table: Dict[str, np.ndarray] = {}
+        self._slice_capacity: int = 0
+        self._hero_capacity: int = 0
+        self._shard_of: Dict[int, int] = {}
+        self._slot_of: Dict[int, int] = {}
+        self._counts: List[int] = [0] * process_count
+        self._used: List[int] = [0] * process_count
+        self._free_slots: List[List[int]] = [[] for _ in range(process_count)]
+        self._sorted_ids: np.ndarray = np.empty(0, dtype=np.int64)
+        self._sorted_rows: np.ndarray = np.empty(0, dtype=np.intp)
+        self._indexed: bool = True
+        self._sequence: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self._allocate(max(-(-capacity // process_count), 1), max(hero_capacity, 1))
+
+    @property
+    def process_count(self) -> int:
+        """
+        Returns:
+            int: Amount of worker processes
+        """
+        return len(self._processes)
+
+    def calculate(
+        self,
+        timestamp: float,
+        ids: np.ndarray,
+        positions: np.ndarray,
+        hero_ids: List[int],
+        heroes_now: np.ndarray,
+        heroes_before: np.ndarray,
+        radii: List[float],
+        stored: Union[int, None] = None,
+        records: bool = False,
+    ) -> List[ShardResult]:
+        """Calculates the data of all actors of a frame in the worker processes
+
+        Args:
+            timestamp (float): Timestamp on when the positions were retrieved
+            ids (np.ndarray): Ids of the actors within the Carla world (shape (n,))
+            positions (np.ndarray): Positions of the actors at the given timestamp (shape (n, 3))
+            hero_ids (List[int]): Ids of the heroes
+            heroes_now (np.ndarray): Current positions of the heroes, NaN if unknown (shape (k, 3))
+            heroes_before (np.ndarray): Previous positions of the heroes, NaN if unknown (shape (k, 3))
+            radii (List[float]): Relevance radii of the heroes
+            stored (int, optional): Index of the hero whose data is stored, its entries are returned as well
+            records (bool, optional): Return the values of the stored hero as well, for the records
+
+        Returns:
+            List[ShardResult]: Ids, JSON data, values (if requested) and entries of the stored hero of the actors within the radius
+                and the amount of actors with insufficient data per hero
+        """
+        hero_count: int = len(hero_ids)
+        with self._lock:
+            if hero_count > self._hero_capacity:
+                self._allocate(
+                    self._slice_capacity, max(hero_count, self._hero_capacity * 2)
+                )
+            rows: np.ndarray = self._rows(ids)
+            self._sequence += 1
+            table: Dict[str, np.ndarray] = self._table
+            table["ids"][rows] = ids
+            table["positions"][rows] = positions
+            table["frames"][rows] = self._sequence
+            table["hero_ids"][:hero_count] = hero_ids
+            table["radii"][:hero_count] = radii
+            table["heroes_now"][:hero_count] = heroes_now
+            table["heroes_before"][:hero_count] = heroes_before
+            replies: List[List[WorkerResult]] = self._request(
+                [
+                    ("frame", self._sequence, timestamp, used, hero_count, stored)
+                    for used in self._used
+                ]
+            )
+            results: List[ShardResult] = []
+            for index in range(hero_count):
+                parts: List[WorkerResult] = [reply[index] for reply in replies]
+                relevant: np.ndarray = np.concatenate([part[0] for part in parts])
+                text: str = "\n".join(part[1] for part in parts if part[1])
+                values: Union[List[List[Union[float, None]]], None] = None
+                entries: Union[List[List[float]], None] = None
+                if index == stored:
+                    entries = table["entries"][relevant].tolist()
+                if index == stored and records:
+                    values = [
+                        [None if value != value else value for value in row]
+                        for row in np.column_stack(
+                            (
+                                table["kinematics"][relevant],
+                                table["distances"][index, relevant],
+                                table["angles"][index, relevant],
+                            )
+                        ).tolist()
+                    ]
+                results.append(
+                    (
+                        table["ids"][relevant].tolist(),
+                        text.split("\n") if text else [],
+                        values,
+                        entries,
+                        sum(part[2] for part in parts),
+                    )
+                )
+            return results
+
+    def remove(self, id: int) -> None:
+        """Frees the row of an actor and drops its stored data in the worker process it belongs to
+
+        Args:
+            id (int): Id of the actor within the Carla world
+        """
+        with self._lock:
+            if id not in self._shard_of:
+                return
+            shard: int = self._shard_of.pop(id)
+            slot: int = self._slot_of.pop(id)
+            self._table["frames"][shard * self._slice_capacity + slot] = 0
+            self._free_slots[shard].append(slot)
+            self._counts[shard] -= 1
+            self._indexed = False
+            self._connections[shard].send(("remove", id))
+
+    def stop(self) -> None:
+        """Stops all worker processes and releases the shared table"""
+        with self._lock:
+            for connection in self._connections:
+                connection.send(("stop",))
+            for process in self._processes:
+                process.join()
+            for connection in self._connections:
+                connection.close()
+            self._release()
+
+    def _rows(self, ids: np.ndarray) -> np.ndarray:
+        """Returns the rows of the given actors, assigning a shard and a row to unknown actors without acquiring the lock
+
+        Args:
+            ids (np.ndarray): Ids of the actors within the Carla world (shape (n,))
+
+        Returns:
+            np.ndarray: Row indices of the actors
+        """
+        if not self._indexed:
+            self._index()
+        indices: np.ndarray = np.minimum(
+            np.searchsorted(self._sorted_ids, ids), max(len(self._sorted_ids) - 1, 0)
+        )
+        if len(self._sorted_ids) > 0:
+            known: np.ndarray = self._sorted_ids[indices] == ids
+            if known.all():
+                return self._sorted_rows[indices]
+            unknown: List[int] = ids[~known].tolist()
+        else:
+            unknown = ids.tolist()
+        for id in unknown:
+            self._assign(id)
+        self._index()
+        return self._sorted_rows[np.searchsorted(self._sorted_ids, ids)]
+
+    def _assign(self, id: int) -> None:
+        """Assigns an actor to the shard with the fewest actors and to a free row of its slice without acquiring the lock
+
+        Args:
+            id (int): Id of the actor within the Carla world
+        """
+        shard: int = self._counts.index(min(self._counts))
+        if self._free_slots[shard]:
+            slot: int = self._free_slots[shard].pop()
+        else:
+            slot = self._used[shard]
+            if slot >= self._slice_capacity:
+                self._allocate(self._slice_capacity * 2, self._hero_capacity)
+            self._used[shard] += 1
+        self._shard_of[id] = shard
+        self._slot_of[id] = slot
+        self._counts[shard] += 1
+
+    def _index(self) -> None:
+        """Rebuilds the sorted lookup from actor id to row without acquiring the lock"""
+        ids: np.ndarray = np.fromiter(
+            self._shard_of, dtype=np.int64, count=len(self._shard_of)
+        )
+        rows: np.ndarray = np.array(
+            [
+                self._shard_of[id] * self._slice_capacity + self._slot_of[id]
+                for id in self._shard_of
+            ],
+            dtype=np.intp,
+        )
+        order: np.ndarray = np.argsort(ids)
+        self._sorted_ids = ids[order]
+        self._sorted_rows = rows[order]
+        self._indexed = True
+
+    def _allocate(self, slice_capacity: int, hero_capacity: int) -> None:
+        """Replaces the shared table with an empty one of the given size and attaches all workers to it without acquiring the lock
+
+        Note:
+            Rows are filled anew with every frame, so nothing is copied, but the rows of all actors move along with their slices
+
+        Args:
+            slice_capacity (int): Amount of rows every worker owns
+            hero_capacity (int): Amount of heroes the table holds
+        """
+        shard_count: int = len(self._connections)
+        memory: SharedMemory = SharedMemory(
+            create=True, size=_table_size(slice_capacity * shard_count, hero_capacity)
+        )
+        try:
+            self._request(
+                [("attach", memory.name, slice_capacity, shard_count, hero_capacity)]
+                * shard_count
+            )
+        except Exception:
+            memory.close()
+            memory.unlink()
+            raise
+        self._release()
+        self._memory = memory
+        self._table = _table(memory.buf, slice_capacity * shard_count, hero_capacity)
+        self._slice_capacity = slice_capacity
+        self._hero_capacity = hero_capacity
+        self._index()
+
+    def _request(self, messages: List[Tuple]) -> List[Any]:
+        """Sends a command to every worker process and waits until all of them executed it, the first error of a worker is raised
+
+        Args:
+            messages (List[Tuple]): Command and its arguments per worker
+
+        Returns:
+            List[Any]: Reply of every worker
+        """
+        for connection, message in zip(self._connections, messages):
+            connection.send(message)
+        replies: List[Any] = [connection.recv() for connection in self._connections]
+        for reply in replies:
+            if isinstance(reply, Exception):
+                raise reply
+        return replies
+
+    def _release(self) -> None:
+        """Closes and removes the shared table without acquiring the lock"""
+        self._table = {}
+        if self._memory != None:
+            self._memory.close()
+            self._memory.unlink()
+            self._memory = None
@@ -0,0 +1,199 @@
+from common import ROAD_USER_PREFIXES
+from datatypes import ActorInfo, Coordinate, GnssCallback
+from gnss_recorder import GnssRecorder
+from math_operations import MathOperations as mo
+from noise import NoiseGenerator
+from typing import Dict, List, Tuple, Union, TYPE_CHECKING
+
+import threading
+import numpy as np
+
+if TYPE_CHECKING:
+    import carla
+
+
+class SnapshotSource:
+    """Class that provides the position data of the road users of a Carla world from one world snapshot per tick, without spawning GNSS sensors
+
+    Note:
+        The locations of all attached actors are read from the same snapshot and converted into geolocations
+        (longitude, latitude, altitude) like a GNSS sensor measures them. Callback functions that provide an on_frame
+        method (e.g. FrameBatcher) receive the whole snapshot as one frame, other callback functions the position
+        data of every actor on its own
+
+    Args:
+        world (carla.World): Carla world to read the snapshots from, any object with get_actors, get_map, get_snapshot,
+            on_tick and remove_on_tick can be used instead
+        georeference (Tuple[float, float, float], optional): Latitude, longitude and altitude of the origin of the world,
+            read from the map of the world if not given
+        listen (bool, optional): Read a snapshot on every tick of the world once started, otherwise a snapshot is read on every call of poll
+    """
+
+    def __init__(
+        self,
+        world: "carla.World",
+        georeference: Union[Tuple[float, float, float], None] = None,
+        listen: bool = True,
+    ) -> None:
+        self._world: "carla.World" = world
+        self._listen: bool = listen
+        if georeference == None:
+            # imported here, so the source can be used with a stub world when the georeference is given
+            import carla
+
+            origin = world.get_map().transform_to_geolocation(carla.Location(0, 0, 0))
+            georeference = (origin.latitude, origin.longitude, origin.altitude)
+        self._georeference: Tuple[float, float, float] = georeference
+        self._attached: Dict[
+            int, Tuple[GnssCallback, NoiseGenerator, Union[GnssRecorder, None]]
+        ] = {}
+        self._tick: float = 0
+        self._next_timestamp: Union[float, None] = None
+        self._callback_id: Union[int, None] = None
+        self._infos: Dict[int, ActorInfo] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def actors(self) -> List[ActorInfo]:
+        """Returns all vehicles and pedestrians currently present in the Carla world
+
+        Note:
+            Reading the velocity is a request to the server, so it is only read for actors that were not returned by the previous call
+
+        Returns:
+            List[ActorInfo]: Road users of the Carla world
+        """
+        infos: Dict[int, ActorInfo] = {}
+        for actor in self._world.get_actors():
+            if actor.type_id.startswith(ROAD_USER_PREFIXES):
+                info: Union[ActorInfo, None] = self._infos.get(actor.id)
+                if info == None:
+                    info = ActorInfo(
+                        actor.id,
+                        actor.type_id,
+                        mo.vector_length(actor.get_velocity()) > 0,
+                    )
+                infos[actor.id] = info
+        self._infos = infos
+        return list(infos.values())
+
+    def attach(
+        self,
+        actor: ActorInfo,
+        on_data: GnssCallback,
+        tick: float,
+        noise: NoiseGenerator,
+        recorder: Union[GnssRecorder, None] = None,
+    ) -> None:
+        """Starts forwarding the position data of an actor
+
+        Note:
+            All actors are read with the tick of the first attached actor
+
+        Args:
+            actor (ActorInfo): Actor whose position data should be forwarded
+            on_data (GnssCallback): Callback function to which the position data is forwarded to
+            tick (float): Seconds between each position detection
+            noise (NoiseGenerator): Generator of the offsets the position data is distorted with
+            recorder (GnssRecorder, optional): Recorder the raw measurements and applied distortion are recorded with
+        """
+        with self._lock:
+            if self._tick == 0:
+                self._tick = tick
+            self._attached[actor.id] = (on_data, noise, recorder)
+
+    def start(self) -> None:
+        """Starts reading a snapshot on every tick of the world, does nothing unless listen is enabled"""
+        with self._lock:
+            if self._listen and self._callback_id == None:
+                self._callback_id = self._world.on_tick(self._on_tick)
+
+    def detach(self, id: int) -> None:
+        """Stops forwarding the position data of an actor
+
+        Args:
+            id (int): Id of the actor within the Carla world
+        """
+        with self._lock:
+            self._attached.pop(id, None)
+
+    def stop(self) -> None:
+        """Stops reading snapshots and forwarding the position data of all actors"""
+        with self._lock:
+            if self._callback_id != None:
+                self._world.remove_on_tick(self._callback_id)
+                self._callback_id = None
+            self._attached.clear()
+
+    def poll(self) -> float:
+        """Reads the current snapshot of the world and forwards the position data of all attached actors
+
+        Returns:
+            float: Timestamp of the snapshot
+        """
+        snapshot: "carla.WorldSnapshot" = self._world.get_snapshot()
+        self._emit(snapshot)
+        return snapshot.timestamp.elapsed_seconds
+
+    def _on_tick(self, snapshot: "carla.WorldSnapshot") -> None:
+        """Callback function of the world that forwards the position data once the tick is due
+
+        Args:
+            snapshot (carla.WorldSnapshot): Snapshot of the world after the tick
+        """
+        timestamp: float = snapshot.timestamp.elapsed_seconds
+        with self._lock:
+            if self._next_timestamp != None and timestamp < self._next_timestamp:
+                return
+            self._next_timestamp = timestamp + self._tick
+        self._emit(snapshot)
+
+    def _emit(self, snapshot: "carla.WorldSnapshot") -> None:
+        """Converts the locations of all attached actors within a snapshot and forwards them
+
+        Args:
+            snapshot (carla.WorldSnapshot): Snapshot of the world
+        """
+        with self._lock:
+            attached: Dict[
+                int, Tuple[GnssCallback, NoiseGenerator, Union[GnssRecorder, None]]
+            ] = dict(self._attached)
+        timestamp: float = snapshot.timestamp.elapsed_seconds
+        ids: List[int] = []
+        locations: List[Tuple[float, float, float]] = []
+        for id in attached:
+            actor_snapshot = snapshot.find(id)
+            if actor_snapshot == None:
+                continue
+            location = actor_snapshot.get_transform().location
+            ids.append(id)
+            locations.append((location.x, location.y, location.z))
+        if not ids:
+            return
+        measured: np.ndarray = mo.geolocations(
+            np.array(locations, dtype=np.float64), *self._georeference
+        )
+        positions: np.ndarray = measured.copy()
+        frames: Dict[GnssCallback, List[int]] = {}
+        for row, id in enumerate(ids):
+            on_data, noise, recorder = attached[id]
+            offset_x, offset_y = noise.offset()
+            positions[row, 0] += offset_x
+            positions[row, 1] += offset_y
+            if recorder != None:
+                longitude, latitude, altitude = measured[row].tolist()
+                recorder.record(
+                    id,
+                    timestamp,
+                    longitude,
+                    latitude,
+                    altitude,
+                    Coordinate(*positions[row].tolist()),
+                )
+            frames.setdefault(on_data, []).append(row)
+        for on_data, rows in frames.items():
+            on_frame = getattr(on_data, "on_frame", None)
+            if on_frame != None:
+                on_frame(timestamp, [ids[row] for row in rows], positions[rows])
+                continue
+            for row in rows:
+                on_data(ids[row], timestamp, Coordinate(*positions[row].tolist()))
@@ -0,0 +1,177 @@
+from datatypes import Coordinate
+from typing import Dict, Iterable, List, Sequence, Set, Tuple, Union
+from math import floor, sqrt
+
+import numpy as np
+
+
+class SpatialIndex:
+    """Class that holds the latest position of every actor in a uniform grid to answer radius queries quickly
+
+    Note:
+        The grid is spanned over the x and y components, distances are measured with all three components
+
+    Args:
+        cell_size (float): Edge length of a grid cell (positive), ideally the radius that is queried the most
+    """
+
+    def __init__(self, cell_size: float) -> None:
+        if not cell_size > 0:
+            raise ValueError(f"Cell size must be positive, got {cell_size}")
+        self._cell_size: float = cell_size
+        self._cells: Dict[Tuple[int, int], Set[int]] = {}
+        self._cell_of: Dict[int, Tuple[int, int]] = {}
+        self._positions: Dict[int, Tuple[float, float, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def position(self, id: int) -> Union[Tuple[float, float, float], None]:
+        """Returns the latest position of an actor
+
+        Args:
+            id (int): Id of the actor within the Carla world
+
+        Returns:
+            Tuple[float, float, float]: Latest position of the actor
+            None: Actor is not indexed
+        """
+        return self._positions.get(id)
+
+    def update(self, id: int, position: Coordinate) -> None:
+        """Sets the latest position of an actor
+
+        Args:
+            id (int): Id of the actor within the Carla world
+            position (Coordinate): Latest position of the actor
+        """
+        self._move(
+            id,
+            (position.x, position.y, position.z),
+            (
+                floor(position.x / self._cell_size),
+                floor(position.y / self._cell_size),
+            ),
+        )
+
+    def update_many(self, ids: Sequence[int], positions: np.ndarray) -> None:
+        """Sets the latest positions of several actors
+
+        Args:
+            ids (Sequence[int]): Ids of the actors within the Carla world
+            positions (np.ndarray): Latest positions of the actors (shape (n, 3))
+        """
+        cells: List[List[int]] = (
+            np.floor(positions[:, :2] / self._cell_size).astype(np.int64).tolist()
+        )
+        self._positions.update(zip(ids, map(tuple, positions.tolist())))
+        cell_of: Dict[int, Tuple[int, int]] = self._cell_of
+        for id, cell in zip(ids, map(tuple, cells)):
+            # most actors stay within their cell from one frame to the next
+            if cell_of.get(id) != cell:
+                self._move(id, self._positions[id], cell)
+
+    def remove(self, id: int) -> None:
+        """Removes an actor from the index
+
+        Args:
+            id (int): Id of the actor within the Carla world
+        """
+        if id not in self._positions:
+            return
+        cell: Tuple[int, int] = self._cell_of.pop(id)
+        self._cells[cell].discard(id)
+        if not self._cells[cell]:
+            del self._cells[cell]
+        del self._positions[id]
+
+    def within(
+        self, id: int, center: Tuple[float, float, float], radius: float
+    ) -> bool:
+        """Checks if the latest position of an actor is within the radius around the center
+
+        Args:
+            id (int): Id of the actor within the Carla world
+            center (Tuple[float, float, float]): Center of the radius
+            radius (float): Radius around the center
+
+        Returns:
+            bool: True if the actor is within the radius or not indexed, False otherwise
+        """
+        position: Union[Tuple[float, float, float], None] = self._positions.get(id)
+        if position == None:
+            return True
+        return self._distance(position, center) <= radius
+
+    def query(self, center: Tuple[float, float, float], radius: float) -> List[int]:
+        """Returns all actors whose latest position is within the radius around the center
+
+        Args:
+            center (Tuple[float, float, float]): Center of the radius
+            radius (float): Radius around the center
+
+        Returns:
+            List[int]: Ids of the actors within the radius
+        """
+        x_min: int = floor((center[0] - radius) / self._cell_size)
+        x_max: int = floor((center[0] + radius) / self._cell_size)
+        y_min: int = floor((center[1] - radius) / self._cell_size)
+        y_max: int = floor((center[1] + radius) / self._cell_size)
+        ids: List[int] = []
+        candidates: Iterable[int]
+        if (x_max - x_min + 1) * (y_max - y_min + 1) > len(self._cells):
+            candidates = self._positions
+        else:
+            candidates = [
+                id
+                for x in range(x_min, x_max + 1)
+                for y in range(y_min, y_max + 1)
+                for id in self._cells.get((x, y), ())
+            ]
+        for id in candidates:
+            if self._distance(self._positions[id], center) <= radius:
+                ids.append(id)
+        return ids
+
+    def _move(
+        self,
+        id: int,
+        position: Tuple[float, float, float],
+        cell: Tuple[int, int],
+    ) -> None:
+        """Stores the latest position of an actor and moves it into its grid cell
+
+        Args:
+            id (int): Id of the actor within the Carla world
+            position (Tuple[float, float, float]): Latest position of the actor
+            cell (Tuple[int, int]): Grid cell the position lies in
+        """
+        self._positions[id] = position
+        previous: Union[Tuple[int, int], None] = self._cell_of.get(id)
+        if previous == cell:
+            return
+        if previous != None:
+            self._cells[previous].discard(id)
+            if not self._cells[previous]:
+                del self._cells[previous]
+        self._cells.setdefault(cell, set()).add(id)
+        self._cell_of[id] = cell
+
+    @staticmethod
+    def _distance(
+        position_a: Tuple[float, float, float], position_b: Tuple[float, float, float]
+    ) -> float:
+        """Calculates and returns the distance between two positions
+
+        Args:
+            position_a (Tuple[float, float, float]): First position
+            position_b (Tuple[float, float, float]): Second position
+
+        Returns:
+            float: Distance between the positions
+        """
+        return sqrt(
+            (position_a[0] - position_b[0]) ** 2
+            + (position_a[1] - position_b[1]) ** 2
+            + (position_a[2] - position_b[2]) ** 2
+        )
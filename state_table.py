@@ -0,0 +1,223 @@
+from common import RECORD_DTYPE
+from multiprocessing.shared_memory import SharedMemory
+from record_log import Record
+from typing import Dict, List, Set, Union
+
+import logging
+import threading
+import numpy as np
+
+HEADER_DTYPE: np.dtype = np.dtype([("capacity", np.int64), ("count", np.int64)])
+
+# names of the tables created by this process, whose shared memory blocks are tracked by it
+_created: Set[str] = set()
+
+
+def _layout(buffer: memoryview, capacity: int) -> List[np.ndarray]:
+    """Maps the header, the row versions and the rows of a state table onto a buffer without copying
+
+    Args:
+        buffer (memoryview): Buffer of the shared memory block
+        capacity (int): Amount of rows the table holds
+
+    Returns:
+        List[np.ndarray]: Header, versions (shape (capacity,)) and rows (shape (capacity,)) of the table
+    """
+    header: np.ndarray = np.ndarray((1,), dtype=HEADER_DTYPE, buffer=buffer)
+    versions: np.ndarray = np.ndarray(
+        (capacity,), dtype=np.uint64, buffer=buffer, offset=HEADER_DTYPE.itemsize
+    )
+    rows: np.ndarray = np.ndarray(
+        (capacity,),
+        dtype=RECORD_DTYPE,
+        buffer=buffer,
+        offset=HEADER_DTYPE.itemsize + versions.nbytes,
+    )
+    return [header, versions, rows]
+
+
+class StateTable:
+    """Class that keeps the latest record of every actor in a shared memory block, so processes on the same host can poll it
+
+    Note:
+        Every row holds the fields of common.RECORD_DTYPE and is guarded by its own version counter (seqlock), which is
+        odd while the row is written. Rows of removed actors are cleared (id -1) and reused. Records of further actors
+        are dropped once all rows are taken
+
+    Args:
+        capacity (int): Amount of actors the table holds
+        name (str, optional): Name of the shared memory block, a unique name is generated if not given
+    """
+
+    def __init__(self, capacity: int, name: Union[str, None] = None) -> None:
+        capacity = max(capacity, 1)
+        self._memory: SharedMemory = SharedMemory(
+            name,
+            create=True,
+            size=HEADER_DTYPE.itemsize
+            + capacity * (np.dtype(np.uint64).itemsize + RECORD_DTYPE.itemsize),
+        )
+        self._header, self._versions, self._rows = _layout(self._memory.buf, capacity)
+        self._header[0] = (capacity, 0)
+        self._versions[:] = 0
+        _created.add(self._memory.name)
+        self._row_of: Dict[int, int] = {}
+        self._free_rows: List[int] = []
+        self._dropped: int = 0
+        self._closed: bool = False
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        """
+        Returns:
+            str: Name of the shared memory block, which readers attach to
+        """
+        return self._memory.name
+
+    @property
+    def dropped(self) -> int:
+        """
+        Returns:
+            int: Amount of records that were dropped because all rows were taken
+        """
+        return self._dropped
+
+    def put(self, record: Record) -> None:
+        """Replaces the row of the actor of a record with it
+
+        Args:
+            record (Record): Values in the order of the fields of common.RECORD_DTYPE
+        """
+        with self._lock:
+            if self._closed:
+                return
+            id: int = record[0]
+            row: Union[int, None] = self._row_of.get(id)
+            if row == None:
+                row = self._take_row()
+                if row == None:
+                    if self._dropped == 0:
+                        logging.warning(
+                            f"State table {self.name} is full, records of further actors are dropped"
+                        )
+                    self._dropped += 1
+                    return
+                self._row_of[id] = row
+            self._write(row, record)
+
+    def remove(self, id: int) -> None:
+        """Clears the row of an actor and frees it for other actors
+
+        Args:
+            id (int): Id of the actor within the Carla world
+        """
+        with self._lock:
+            if self._closed or id not in self._row_of:
+                return
+            row: int = self._row_of.pop(id)
+            self._write(row, (-1, -1) + (np.nan,) * (len(RECORD_DTYPE) - 2))
+            self._free_rows.append(row)
+
+    def close(self) -> None:
+        """Releases the shared memory block, readers that are still attached keep their mapping"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            del self._header, self._versions, self._rows
+            self._memory.close()
+            self._memory.unlink()
+            _created.discard(self._memory.name)
+
+    def _take_row(self) -> Union[int, None]:
+        """Returns an unused row without acquiring the lock
+
+        Returns:
+            None: All rows are taken
+            int: Index of the row
+        """
+        if self._free_rows:
+            return self._free_rows.pop()
+        count: int = int(self._header[0]["count"])
+        if count >= len(self._rows):
+            return None
+        self._header[0]["count"] = count + 1
+        return count
+
+    def _write(self, row: int, record: Record) -> None:
+        """Writes a row between the two increments of its version without acquiring the lock
+
+        Args:
+            row (int): Index of the row
+            record (Record): Values in the order of the fields of common.RECORD_DTYPE
+        """
+        version: int = int(self._versions[row]) + 1
+        self._versions[row] = version
+        self._rows[row] = record
+        self._versions[row] = version + 1
+
+
+class StateTableReader:
+    """Class that attaches to the StateTable of another process and reads consistent copies of its rows without locking
+
+    Args:
+        name (str): Name of the shared memory block of the table
+    """
+
+    def __init__(self, name: str) -> None:
+        # the block belongs to the writer, so it must not be removed when this process exits
+        try:
+            self._memory: SharedMemory = SharedMemory(name, track=False)
+        except TypeError:
+            # Python before 3.13 tracks every attached block
+            self._memory = SharedMemory(name)
+            if self._memory.name not in _created:
+                from multiprocessing import resource_tracker
+
+                resource_tracker.unregister(self._memory._name, "shared_memory")
+        capacity: int = int(
+            np.ndarray((1,), dtype=HEADER_DTYPE, buffer=self._memory.buf)[0]["capacity"]
+        )
+        self._header, self._versions, self._rows = _layout(self._memory.buf, capacity)
+
+    @property
+    def capacity(self) -> int:
+        """
+        Returns:
+            int: Amount of actors the table holds
+        """
+        return len(self._rows)
+
+    def read(self, retries: int = 16) -> np.ndarray:
+        """Returns a consistent copy of the latest record of every actor
+
+        Note:
+            Rows that were written while they were copied are copied again, rows that are still changing after
+            all retries are left out
+
+        Args:
+            retries (int, optional): Amount of times rows that changed while being copied are copied again
+
+        Returns:
+            np.ndarray: Records with the fields of common.RECORD_DTYPE (shape (n,))
+        """
+        count: int = int(self._header[0]["count"])
+        versions: np.ndarray = self._versions[:count].copy()
+        rows: np.ndarray = self._rows[:count].copy()
+        changed: np.ndarray = (versions % 2 == 1) | (self._versions[:count] != versions)
+        for _ in range(retries):
+            if not changed.any():
+                break
+            indices: np.ndarray = np.flatnonzero(changed)
+            versions[indices] = self._versions[indices]
+            rows[indices] = self._rows[indices]
+            changed[indices] = (versions[indices] % 2 == 1) | (
+                self._versions[indices] != versions[indices]
+            )
+        return rows[~changed & (rows["id"] >= 0)]
+
+    def close(self) -> None:
+        """Detaches from the shared memory block"""
+        del self._header, self._versions, self._rows
+        self._memory.close()
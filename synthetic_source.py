@@ -0,0 +1,247 @@
+from common import ETrajectory, VehicleTypes
+from datatypes import ActorInfo, Coordinate, GnssCallback
+from gnss_recorder import GnssRecorder
+from noise import NoiseGenerator
+from typing import Dict, List, Sequence, Tuple, Union
+
+import threading
+import time
+import numpy as np
+
+
+class SyntheticSource:
+    """Class that generates the position data of synthetic road users in-process, to load-test the calculations without a Carla instance
+
+    Note:
+        Neither a running simulator nor the carla module is needed, as long as Api is given this source.
+        All trajectories are derived from the seed, so two sources with the same arguments produce the same data.
+        Every actor is emitted with the tick it was attached with, actors with the same tick share their timestamps.
+        With realtime enabled a thread started by start emits the ticks at their pace, otherwise every call of step emits the next due tick
+
+    Args:
+        actor_count (int): Amount of actors to be generated
+        seed (int, optional): Seed of the random trajectories
+        area (float, optional): Edge length (in m) of the square the actors move in
+        pedestrian_share (float, optional): Share of pedestrians among the generated actors
+        trajectories (Sequence[ETrajectory], optional): Trajectories the actors are randomly assigned to
+        realtime (bool, optional): Emit the ticks from a thread at the pace of the tick
+    """
+
+    def __init__(
+        self,
+        actor_count: int,
+        seed: int = 0,
+        area: float = 1000.0,
+        pedestrian_share: float = 0.2,
+        trajectories: Sequence[ETrajectory] = (ETrajectory.LINEAR, ETrajectory.CIRCLE),
+        realtime: bool = True,
+    ) -> None:
+        generator: np.random.Generator = np.random.default_rng(seed)
+        self._area: float = area
+        self._realtime: bool = realtime
+        self._pedestrian: np.ndarray = generator.random(actor_count) < pedestrian_share
+        speed: np.ndarray = np.where(
+            self._pedestrian,
+            generator.uniform(0.5, 2.0, actor_count),
+            generator.uniform(3.0, 20.0, actor_count),
+        )
+        heading: np.ndarray = generator.uniform(0, 2 * np.pi, actor_count)
+        self._start: np.ndarray = generator.uniform(0, area, (actor_count, 2))
+        self._velocity: np.ndarray = speed[:, None] * np.stack(
+            (np.cos(heading), np.sin(heading)), axis=1
+        )
+        self._circular: np.ndarray = np.isin(
+            generator.integers(0, len(trajectories), actor_count),
+            [
+                index
+                for index, trajectory in enumerate(trajectories)
+                if trajectory == ETrajectory.CIRCLE
+            ],
+        )
+        self._radius: np.ndarray = generator.uniform(10.0, 100.0, actor_count)
+        self._angular_velocity: np.ndarray = speed / self._radius
+        names: List[str] = [
+            f"vehicle.{name}"
+            for category in VehicleTypes.categories
+            for name in VehicleTypes.types[category]
+        ]
+        vehicle_names: List[str] = generator.choice(names, actor_count).tolist()
+        self._type_ids: List[str] = [
+            "walker.pedestrian.0001" if pedestrian else vehicle_name
+            for pedestrian, vehicle_name in zip(
+                self._pedestrian.tolist(), vehicle_names
+            )
+        ]
+        self._attached: Dict[
+            int, Tuple[GnssCallback, NoiseGenerator, Union[GnssRecorder, None], float]
+        ] = {}
+        # next frame and amount of attached actors per tick
+        self._schedule: Dict[float, List[int]] = {}
+        self._timestamp: Union[float, None] = None
+        self._condition: threading.Condition = threading.Condition()
+        self._stop: bool = False
+        self._thread: Union[threading.Thread, None] = None
+
+    def actors(self) -> List[ActorInfo]:
+        """Returns all generated actors
+
+        Returns:
+            List[ActorInfo]: Generated road users
+        """
+        return [
+            ActorInfo(id, type_id, True) for id, type_id in enumerate(self._type_ids)
+        ]
+
+    def attach(
+        self,
+        actor: ActorInfo,
+        on_data: GnssCallback,
+        tick: float,
+        noise: NoiseGenerator,
+        recorder: Union[GnssRecorder, None] = None,
+    ) -> None:
+        """Starts forwarding the position data of an actor
+
+        Note:
+            An actor attached with a tick no other attached actor has starts with the first frame of that tick after the last emitted timestamp
+
+        Args:
+            actor (ActorInfo): Actor whose position data should be forwarded
+            on_data (GnssCallback): Callback function to which the position data is forwarded to
+            tick (float): Seconds between each position detection
+            noise (NoiseGenerator): Generator of the offsets the position data is distorted with
+            recorder (GnssRecorder, optional): Recorder the raw measurements and applied distortion are recorded with
+        """
+        with self._condition:
+            self._remove(actor.id)
+            self._attached[actor.id] = (on_data, noise, recorder, tick)
+            if tick in self._schedule:
+                self._schedule[tick][1] += 1
+            else:
+                frame: int = (
+                    0 if self._timestamp == None else int(self._timestamp // tick) + 1
+                )
+                self._schedule[tick] = [frame, 1]
+            self._condition.notify_all()
+
+    def start(self) -> None:
+        """Starts the thread that emits the ticks in realtime, meant to be called once all initial actors are attached
+
+        Note:
+            Does nothing unless realtime is enabled, the ticks are emitted by step then
+        """
+        if self._realtime and self._thread == None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def detach(self, id: int) -> None:
+        """Stops forwarding the position data of an actor
+
+        Args:
+            id (int): Id of the actor
+        """
+        with self._condition:
+            self._remove(id)
+
+    def stop(self) -> None:
+        """Stops forwarding the position data of all actors"""
+        with self._condition:
+            self._stop = True
+            self._condition.notify_all()
+        if self._thread != None:
+            self._thread.join()
+            self._thread = None
+        with self._condition:
+            self._attached.clear()
+            self._schedule.clear()
+
+    def positions(self, timestamp: float) -> np.ndarray:
+        """Returns the positions of all generated actors at a given timestamp
+
+        Args:
+            timestamp (float): Timestamp (in s) for which the positions should be returned
+
+        Returns:
+            np.ndarray: Positions of all actors ordered by id (shape (n, 3))
+        """
+        linear: np.ndarray = self._start + self._velocity * timestamp
+        linear = self._area - np.abs(np.mod(linear, 2 * self._area) - self._area)
+        angle: np.ndarray = self._angular_velocity * timestamp
+        circle: np.ndarray = self._start + self._radius[:, None] * np.stack(
+            (np.cos(angle) - 1, np.sin(angle)), axis=1
+        )
+        xy: np.ndarray = np.where(self._circular[:, None], circle, linear)
+        return np.concatenate((xy, np.zeros((len(xy), 1))), axis=1)
+
+    def step(self) -> float:
+        """Emits the position data of all attached actors whose tick is due next
+
+        Returns:
+            float: Timestamp of the emitted tick, the last emitted timestamp (or 0) if no actor is attached
+        """
+        with self._condition:
+            due: Union[float, None] = self._due()
+            if due == None:
+                return self._timestamp if self._timestamp != None else 0.0
+            timestamp: float = due
+            ticks: List[float] = []
+            for tick, entry in self._schedule.items():
+                if entry[0] * tick == timestamp:
+                    entry[0] += 1
+                    ticks.append(tick)
+            attached: List[
+                Tuple[int, GnssCallback, NoiseGenerator, Union[GnssRecorder, None]]
+            ] = [
+                (id, on_data, noise, recorder)
+                for id, (on_data, noise, recorder, tick) in self._attached.items()
+                if tick in ticks
+            ]
+            self._timestamp = timestamp
+        positions: List[List[float]] = self.positions(timestamp).tolist()
+        for id, on_data, noise, recorder in attached:
+            x, y, z = positions[id]
+            position: Coordinate = noise.distort(x, y, z)
+            if recorder != None:
+                recorder.record(id, timestamp, x, y, z, position)
+            on_data(id, timestamp, position)
+        return timestamp
+
+    def _due(self) -> Union[float, None]:
+        """Returns the timestamp of the next due tick without acquiring the lock
+
+        Returns:
+            float: Timestamp of the next due tick
+            None: No actor is attached
+        """
+        return min(
+            (frame * tick for tick, (frame, _) in self._schedule.items()), default=None
+        )
+
+    def _remove(self, id: int) -> None:
+        """Removes an attached actor from its tick without acquiring the lock
+
+        Args:
+            id (int): Id of the actor
+        """
+        if id not in self._attached:
+            return
+        tick: float = self._attached.pop(id)[3]
+        self._schedule[tick][1] -= 1
+        if self._schedule[tick][1] == 0:
+            del self._schedule[tick]
+
+    def _run(self) -> None:
+        """Main loop of the thread that emits the ticks in realtime"""
+        start: float = time.perf_counter()
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._schedule or self._stop)
+                if self._stop:
+                    return
+                due: float = self._due()
+            delay: float = start + due - time.perf_counter()
+            if delay > 0:
+                with self._condition:
+                    self._condition.wait(delay)
+                continue
+            self.step()
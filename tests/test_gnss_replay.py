@@ -0,0 +1,37 @@
+from datatypes import Coordinate
+from gnss_recorder import GnssRecorder
+from gnss_replay import GnssReplay
+from typing import List, Tuple
+
+import os
+import tempfile
+import numpy as np
+
+Measurement = Tuple[int, str, Tuple[str, str, str]]
+
+
+def _measurement(id: int, timestamp: float, position: Coordinate) -> Measurement:
+    return (id, timestamp.hex(), (position.x.hex(), position.y.hex(), position.z.hex()))
+
+
+def test_replay_forwards_the_recorded_positions_bit_for_bit() -> None:
+    generator: np.random.Generator = np.random.default_rng(11)
+    raw: np.ndarray = np.array([8.4, 49.0, 110.0]) + generator.uniform(
+        -0.01, 0.01, (5000, 3)
+    )
+    distorted: np.ndarray = raw.copy()
+    distorted[:, :2] += generator.normal(0, 2.5, (5000, 2))
+    forwarded: List[Measurement] = []
+    replayed: List[Measurement] = []
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, "record.npy")
+        recorder: GnssRecorder = GnssRecorder(path, chunk_size=1024)
+        for index, (measured, position) in enumerate(
+            zip(raw.tolist(), distorted.tolist())
+        ):
+            timestamp: float = index // 50 * 0.05
+            recorder.record(index % 50, timestamp, *measured, Coordinate(*position))
+            forwarded.append(_measurement(index % 50, timestamp, Coordinate(*position)))
+        recorder.close()
+        GnssReplay(path).run(lambda *data: replayed.append(_measurement(*data)))
+    assert replayed == forwarded
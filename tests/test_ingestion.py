@@ -0,0 +1,8 @@
+from ingestion import Ingestion
+import pytest
+
+
+@pytest.mark.parametrize("max_size, worker_count", [(0, 1), (-1, 1), (10, 0)])
+def test_invalid_arguments_raise(max_size: int, worker_count: int) -> None:
+    with pytest.raises(ValueError):
+        Ingestion(lambda *_: None, max_size, worker_count=worker_count)
@@ -0,0 +1,63 @@
+from datatypes import Vector
+from math_operations import MathOperations as mo
+import numpy as np
+
+
+def _vectors(count: int, seed: int) -> np.ndarray:
+    """Random vectors whose components lie on a 0.005 grid to hit rounding ties"""
+    rng: np.random.Generator = np.random.default_rng(seed)
+    return rng.integers(-2000, 2000, size=(count, 3)) * 0.005
+
+
+def test_vectors_length_matches_vector_length() -> None:
+    vectors: np.ndarray = _vectors(20000, 1)
+    expected: list = [mo.vector_length(Vector(*v)) for v in vectors.tolist()]
+    assert mo.vectors_length(vectors).tolist() == expected
+
+
+def test_velocities_match_velocity() -> None:
+    vectors: np.ndarray = _vectors(20000, 2)
+    rng: np.random.Generator = np.random.default_rng(3)
+    t_before: np.ndarray = rng.integers(0, 1000, size=len(vectors)) * 0.05
+    t_after: np.ndarray = t_before + rng.integers(1, 20, size=len(vectors)) * 0.05
+    expected: list = [
+        mo.velocity(Vector(*v), before, after)
+        for v, before, after in zip(
+            vectors.tolist(), t_before.tolist(), t_after.tolist()
+        )
+    ]
+    assert mo.velocities(vectors, t_before, t_after).tolist() == expected
+    zero_z: np.ndarray = np.array([[0.0, 0.0, 0.225]])
+    assert mo.velocities(zero_z, np.array([0.0]), np.array([0.5])).tolist() == [
+        mo.velocity(Vector(0.0, 0.0, 0.225), 0.0, 0.5)
+    ]
+
+
+def test_angles_match_scalar_angles() -> None:
+    vectors_a: np.ndarray = _vectors(20000, 4)
+    vectors_b: np.ndarray = _vectors(20000, 5)
+    vectors_a[:100, :2] = 0
+    to_y_axis: list = [mo.angle_to_y_axis(Vector(*v)) for v in vectors_a.tolist()]
+    result: list = mo.angles_to_y_axis(vectors_a).tolist()
+    assert [None if np.isnan(angle) else angle for angle in result] == to_y_axis
+    between: list = [
+        mo.angle_between_vectors(Vector(*a), Vector(*b))
+        for a, b in zip(vectors_a.tolist(), vectors_b.tolist())
+    ]
+    assert mo.angles_between_vectors(vectors_a, vectors_b).tolist() == between
+
+
+def test_angular_speeds_match_angular_speed() -> None:
+    rng: np.random.Generator = np.random.default_rng(6)
+    angles_a: np.ndarray = rng.integers(0, 72000, size=20000) * 0.005
+    angles_b: np.ndarray = rng.integers(0, 72000, size=20000) * 0.005
+    t_before: np.ndarray = rng.integers(0, 1000, size=20000) * 0.05
+    t_after: np.ndarray = t_before + rng.integers(1, 20, size=20000) * 0.05
+    expected: list = [
+        mo.angular_speed(*values)
+        for values in zip(
+            angles_a.tolist(), angles_b.tolist(), t_before.tolist(), t_after.tolist()
+        )
+    ]
+    result: list = mo.angular_speeds(angles_a, angles_b, t_before, t_after).tolist()
+    assert result == expected
@@ -0,0 +1,42 @@
+from datatypes import Coordinate
+from noise import NoiseGenerator
+from synthetic_source import SyntheticSource
+from typing import Dict, List
+
+import time
+
+
+def _attach(source: SyntheticSource, ticks: Dict[int, float]) -> Dict[int, List[float]]:
+    received: Dict[int, List[float]] = {id: [] for id in ticks}
+    for actor in source.actors():
+        if actor.id in ticks:
+            source.attach(
+                actor,
+                lambda id, timestamp, position: received[id].append(timestamp),
+                ticks[actor.id],
+                NoiseGenerator(0),
+            )
+    return received
+
+
+def test_step_honours_the_tick_of_every_actor() -> None:
+    source: SyntheticSource = SyntheticSource(3, realtime=False)
+    received: Dict[int, List[float]] = _attach(source, {0: 0.1, 1: 0.25, 2: 0.1})
+    while source.step() < 1.0:
+        pass
+    assert received[0] == [frame * 0.1 for frame in range(11)]
+    assert received[2] == received[0]
+    assert received[1] == [frame * 0.25 for frame in range(5)]
+
+
+def test_realtime_starts_once_started() -> None:
+    source: SyntheticSource = SyntheticSource(2, realtime=True)
+    received: Dict[int, List[float]] = _attach(source, {0: 0.01})
+    time.sleep(0.05)
+    assert received[0] == []
+    late: Dict[int, List[float]] = _attach(source, {1: 0.02})
+    source.start()
+    time.sleep(0.2)
+    source.stop()
+    assert received[0][:2] == [0.0, 0.01]
+    assert late[1][:2] == [0.0, 0.02]
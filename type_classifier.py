@@ -0,0 +1,61 @@
+from common import EActorType, EVehicleType, VehicleTypes, ROAD_USER_CODE
+from typing import Dict, Union
+
+
+class TypeClassifier:
+    """Class that classifies the type ids of Carla blueprints into encoded traffic user types
+
+    Note:
+        The type ids of all known vehicles (e.g. vehicle.audi.a2) are matched exactly against a table built once.
+        Unknown type ids are scanned for a known vehicle name and otherwise classified as the fallback,
+        every result is cached per type id
+
+    Args:
+        fallback (EVehicleType | EActorType, optional): Traffic user type of blueprints that are not known, one of the keys
+            of common.ROAD_USER_CODE (EActorType.VEHICLE is too unspecific to be encoded)
+    """
+
+    def __init__(
+        self, fallback: Union[EVehicleType, EActorType] = EActorType.PEDESTRIAN
+    ) -> None:
+        if fallback not in ROAD_USER_CODE:
+            raise ValueError(
+                f"Unsupported fallback type {fallback}, expected one of {list(ROAD_USER_CODE)}"
+            )
+        self._fallback: int = ROAD_USER_CODE[fallback]
+        self._codes: Dict[str, int] = {}
+        for category in VehicleTypes.categories:
+            for type in VehicleTypes.types[category]:
+                self._codes.setdefault(
+                    f"{EActorType.VEHICLE.value}.{type}", ROAD_USER_CODE[category]
+                )
+
+    def classify(self, type_id: str) -> int:
+        """Classifies the type id of a blueprint
+
+        Args:
+            type_id (str): Type id of the blueprint provided by the Carla world
+
+        Returns:
+            int: Encoded traffic user type
+        """
+        code: Union[int, None] = self._codes.get(type_id)
+        if code == None:
+            code = self._scan(type_id)
+            self._codes[type_id] = code
+        return code
+
+    def _scan(self, type_id: str) -> int:
+        """Searches an unknown type id for the name of a known vehicle
+
+        Args:
+            type_id (str): Type id of the blueprint provided by the Carla world
+
+        Returns:
+            int: Encoded traffic user type of the first vehicle name found, otherwise the fallback
+        """
+        for category in VehicleTypes.categories:
+            for type in VehicleTypes.types[category]:
+                if type in type_id:
+                    return ROAD_USER_CODE[category]
+        return self._fallback